@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 import shutil
 import sys
+import time
 from collections.abc import Callable, Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import replace
@@ -16,11 +19,14 @@ from typing import TypeVar
 import click
 
 from . import __version__
-from .config import Config
+from .config import Config, default_env_file, load_env_file, read_env_file
 
 _OBSERVE_SOURCES = ["claude", "codex", "opencode", "kimi", "grok", "hermes", "cowork", "claude-memory", "all"]
 _OBSERVER_WORKER_SOURCES = _OBSERVE_SOURCES
 _OBSERVER_RSS_CHECK_INTERVAL_SECONDS = 1.0
+_BACKFILL_PROGRESS_INTERVAL_SECONDS = 0.1
+# Clock behind the backfill progress throttle; tests swap it for a scripted one.
+_progress_clock = time.monotonic
 _T = TypeVar("_T")
 
 
@@ -36,15 +42,27 @@ class ObserverWorkerMemoryExceeded(ObserverWorkerTimeout):
     """Raised when background observer work exceeds its RSS memory cap."""
 
 
+class _CliState(dict):
+    """``ctx.obj`` that builds the shared :class:`Config` on first access.
+
+    Commands that never read ``ctx.obj["config"]`` (``login``, ``auth``,
+    ``cluster relay serve``, subcommand ``--help``) skip Config construction.
+    """
+
+    def __missing__(self, key: str) -> object:
+        if key != "config":
+            raise KeyError(key)
+        config = self[key] = Config()
+        return config
+
+
 @click.group()
 @click.version_option(__version__, prog_name="om")
 @click.pass_context
 def cli(ctx: click.Context) -> None:
     """Observational Memory — shared memory for Claude Code, Codex CLI, OpenCode, Kimi Code CLI, and Hermes Agent."""
-    ctx.ensure_object(dict)
-    Config().load_env_file()  # Seed os.environ before constructing final config
-    config = Config()
-    ctx.obj["config"] = config
+    load_env_file(default_env_file())  # Seed os.environ before the lazy Config reads it
+    ctx.obj = _CliState(ctx.obj or {})
 
 
 @cli.command()
@@ -610,8 +628,6 @@ def _write_conflict_report(conflicts: list) -> Path:
 
 
 def _valid_backup_reason(reason: str) -> bool:
-    import re
-
     return bool(re.match(r"^[a-z0-9-]+$", reason))
 
 
@@ -884,8 +900,6 @@ def _reflect_async(config: Config, explicit: bool) -> None:
 @click.pass_context
 def prune(ctx: click.Context, dry_run: bool, as_json: bool, drop_stale: bool, namespace: str | None) -> None:
     """Prune or mark stale reflection snapshot entries."""
-    import json as json_mod
-
     from .reflect import _reindex_if_enabled
     from .reflection_metadata import ensure_reflection_metadata, prune_stale_snapshots
     from .startup_memory import refresh_startup_memory
@@ -901,7 +915,7 @@ def prune(ctx: click.Context, dry_run: bool, as_json: bool, drop_stale: bool, na
     pruned, summary = prune_stale_snapshots(text, ttl_days=config.snapshot_ttl_days, action=action)
     if as_json:
         payload = {**summary.to_dict(), "dry_run": dry_run, "namespace": namespace}
-        click.echo(json_mod.dumps(payload, indent=2, sort_keys=True))
+        click.echo(json.dumps(payload, indent=2, sort_keys=True))
     elif dry_run:
         click.echo(pruned, nl=not pruned.endswith("\n"))
     else:
@@ -934,6 +948,16 @@ def _maybe_run_reflector_catchup(config: Config) -> None:
         click.echo("No observations to reflect on.")
 
 
+def _stdout_is_tty() -> bool:
+    return sys.stdout.isatty()
+
+
+def _project_and_file_name(path: Path) -> tuple[str, str]:
+    """Return ``(parent dir name, file name)`` using string splits rather than ``Path.parent``."""
+    head, file_name = os.path.split(path)
+    return os.path.basename(head), file_name
+
+
 @cli.command()
 @click.option(
     "--source",
@@ -958,44 +982,52 @@ def backfill(ctx: click.Context, source: str, dry_run: bool, limit: int, reflect
     """
     from .observe import observe_claude_transcript_backfill, observe_cowork_transcript_backfill
     from .reflect import run_reflector
-    from .transcripts.claude import find_all_transcripts
+    from .transcripts import TranscriptFile
+    from .transcripts.claude import scan_all_transcripts
     from .transcripts.codex import find_recent_sessions
     from .transcripts.cowork import find_all_transcripts as find_all_cowork
 
     config = ctx.obj["config"]
 
-    # Discover transcripts
-    all_transcripts: list[tuple[Path, str]] = []  # (path, source_label)
+    # Discover transcripts. Claude discovery comes from os.scandir with the
+    # stat result attached, so the dry-run listing below needs no extra stat.
+    all_transcripts: list[tuple[TranscriptFile, str]] = []  # (transcript, source_label)
 
     if source in ("claude", "all"):
-        for p in find_all_transcripts(config.claude_projects_dir):
-            all_transcripts.append((p, "claude"))
+        for t in scan_all_transcripts(config.claude_projects_dir):
+            all_transcripts.append((t, "claude"))
 
     if source in ("codex", "all"):
         for p in find_recent_sessions(config.codex_home):
-            all_transcripts.append((p, "codex"))
+            all_transcripts.append((TranscriptFile.from_path(p), "codex"))
 
     if source in ("cowork", "all"):
         for p in find_all_cowork(config.cowork_sessions_dir):
-            all_transcripts.append((p, "cowork"))
+            all_transcripts.append((TranscriptFile.from_path(p), "cowork"))
 
     if not all_transcripts:
         click.echo("No transcripts found.")
         return
 
-    # Filter out already-processed transcripts for display count
+    # Filter out already-processed transcripts once and iterate only those below,
+    # so the cursor never needs re-reading mid-run (the observe_*_backfill
+    # helpers still consult the on-disk cursor for their own resume point).
     cursor = config.load_cursor()
-    unprocessed = [(p, s) for p, s in all_transcripts if str(p) not in cursor]
+    unprocessed = [(t, s) for t, s in all_transcripts if str(t.path) not in cursor]
     total = len(all_transcripts)
     pending = len(unprocessed)
 
     click.echo(f"Found {total} transcript(s), {pending} unprocessed")
 
     if dry_run:
-        for p, s in unprocessed[: limit or None]:
-            size = p.stat().st_size
-            project = p.parent.name
-            click.echo(f"  [{s}] {project}/{p.name} ({size:,} bytes)")
+        # One write for the whole listing: click.echo flushes per call, which
+        # dominates when thousands of transcripts are listed to a terminal.
+        listing = [
+            f"  [{s}] {'/'.join(_project_and_file_name(t.path))} ({t.size:,} bytes)"
+            for t, s in unprocessed[: limit or None]
+        ]
+        if listing:
+            click.echo("\n".join(listing))
         return
 
     if pending == 0:
@@ -1007,20 +1039,42 @@ def backfill(ctx: click.Context, source: str, dry_run: bool, limit: int, reflect
     errors = 0
     total_chars = 0
 
-    for path, src in all_transcripts:
+    # On a terminal, one carriage-return status line shows the transcript being
+    # observed (the LLM call can take a while), redrawn at most every
+    # _BACKFILL_PROGRESS_INTERVAL_SECONDS so a run of quick, quiet transcripts
+    # doesn't write once per file. Results with observations or errors always
+    # get a line of their own. Piped output is unchanged.
+    interactive = _stdout_is_tty()
+    last_progress = 0.0
+    progress_open = False
+
+    def end_progress_line() -> None:
+        nonlocal progress_open
+        if progress_open:
+            click.echo()
+            progress_open = False
+
+    for transcript, src in unprocessed:
+        path = transcript.path
         if limit and processed >= limit:
+            end_progress_line()
             click.echo(f"\nReached limit of {limit} transcripts.")
             break
 
-        # Skip already-processed (cursor check is also inside observe_*_backfill,
-        # but checking here avoids noisy output)
-        if str(path) in cursor:
-            continue
-
-        project = path.parent.name
+        project, file_name = _project_and_file_name(path)
         processed += 1
-        click.echo(f"[{processed}/{pending}] {project}/{path.name[:12]}... ", nl=False)
+        label = f"[{processed}/{pending}] {project}/{file_name[:12]}... "
+        drawn = False
+        if interactive:
+            now = _progress_clock()
+            if now - last_progress >= _BACKFILL_PROGRESS_INTERVAL_SECONDS:
+                click.echo(f"\r\x1b[K{label}", nl=False)
+                last_progress = now
+                progress_open = drawn = True
+        else:
+            click.echo(label, nl=False)
 
+        outcome: str | None = None
         try:
             if src == "claude":
                 chars = observe_claude_transcript_backfill(path, config, chunk_size)
@@ -1033,15 +1087,24 @@ def backfill(ctx: click.Context, source: str, dry_run: bool, limit: int, reflect
 
             if chars:
                 total_chars += chars
-                click.echo(f"({chars:,} chars)")
-            else:
-                click.echo("(no new messages)")
+                outcome = f"({chars:,} chars)"
         except Exception as e:
             errors += 1
-            click.echo(f"ERROR: {e}")
+            outcome = f"ERROR: {e}"
+
+        if not interactive:
+            click.echo(outcome or "(no new messages)")
+        elif outcome is not None:
+            click.echo(f"\r\x1b[K{label}{outcome}")
+            progress_open = False
+        elif drawn or processed == pending:
+            # Only finish a label that is on screen; the last one always lands so the count reads N/N.
+            click.echo(f"\r\x1b[K{label}(no new messages)", nl=False)
+            progress_open = True
 
         # Periodic reflector
         if reflect_every and processed % reflect_every == 0:
+            end_progress_line()
             click.echo(f"\n--- Running reflector (every {reflect_every} transcripts) ---")
             try:
                 run_reflector(config)
@@ -1049,8 +1112,7 @@ def backfill(ctx: click.Context, source: str, dry_run: bool, limit: int, reflect
             except Exception as e:
                 click.echo(f"--- Reflector error: {e} ---\n")
 
-        # Reload cursor after each transcript (it may have been updated)
-        cursor = config.load_cursor()
+    end_progress_line()
 
     # Final reflector run
     if processed > 0:
@@ -1093,7 +1155,8 @@ def search(ctx: click.Context, query: str, limit: int, reindex: bool, as_json: b
 
     backend = get_backend(config.search_backend, config)
 
-    if not backend.is_ready():
+    # A fresh --reindex just built the index; only probe readiness otherwise.
+    if not reindex and not backend.is_ready():
         # Auto-index on first search
         n = do_reindex(config)
         if not as_json and not raw_qmd:
@@ -1113,29 +1176,29 @@ def search(ctx: click.Context, query: str, limit: int, reindex: bool, as_json: b
     results = backend.search(query, limit=limit)
 
     if as_json:
-        import json as json_mod
-
         output = [_search_result_payload(r) for r in results]
-        click.echo(json_mod.dumps(output, indent=2))
+        click.echo(json.dumps(output, indent=2))
     elif results:
+        # Collect the whole listing and write it once instead of flushing per line.
+        out: list[str] = []
         for r in results:
-            click.echo(f"\n--- [{r.rank}] {r.document.heading} (score: {r.score:.2f}) ---")
+            out.append(f"\n--- [{r.rank}] {r.document.heading} (score: {r.score:.2f}) ---")
             payload = _search_result_payload(r)
             source_location = _format_location(payload["source_path"], payload["source_line"])
             qmd_location = _format_location(payload["qmd_file"], payload["qmd_line"])
             if source_location:
-                click.echo(f"  Source: {source_location}")
+                out.append(f"  Source: {source_location}")
             if qmd_location:
-                click.echo(f"  QMD hit: {qmd_location}")
+                out.append(f"  QMD hit: {qmd_location}")
             # Show first 5 lines of content. Use the payload's stripped content
             # (not r.document.content) so the human terminal output never leads
             # with a raw `<!--om: ...-->` / `<!--om-section: ...-->` comment —
             # the same content the --json path emits.
             lines = str(payload["content"]).strip().splitlines()
-            for line in lines[:5]:
-                click.echo(f"  {line}")
+            out.extend(f"  {line}" for line in lines[:5])
             if len(lines) > 5:
-                click.echo(f"  ... ({len(lines) - 5} more lines)")
+                out.append(f"  ... ({len(lines) - 5} more lines)")
+        click.echo("\n".join(out))
     else:
         click.echo("No results found.")
 
@@ -1203,8 +1266,6 @@ def context(
     containing compact generated memory and recall handles. With
     ``--quality-report`` it prints a diagnostic instead.
     """
-    import json as json_mod
-
     from .startup_memory import build_startup_payload, startup_quality_report
 
     config = ctx.obj["config"]
@@ -1212,7 +1273,7 @@ def context(
     if quality_report:
         report = startup_quality_report(config, budget_chars=budget_chars, cwd=routing_cwd, task=task, agent=agent)
         if as_json:
-            click.echo(json_mod.dumps(report, indent=2))
+            click.echo(json.dumps(report, indent=2))
         else:
             click.echo(_format_quality_report(report))
         return
@@ -1234,7 +1295,8 @@ def context(
             "additionalContext": payload.text,
         }
     }
-    click.echo(json_mod.dumps(output))
+    # Consumed by the hook runner, not a human: skip all optional whitespace.
+    click.echo(json.dumps(output, separators=(",", ":")))
 
 
 def _format_quality_report(report: dict) -> str:
@@ -1286,7 +1348,6 @@ def recall(
     agent: str | None,
 ) -> None:
     """Recall deeper memory by search query or startup expansion handle."""
-    import json as json_mod
     import logging
 
     from .search import get_backend
@@ -1319,7 +1380,7 @@ def recall(
             # backend search, so report it as a clean "ok".
             output["recall_status"] = RecallStatus.OK.value
             if as_json:
-                click.echo(json_mod.dumps(output, indent=2, sort_keys=True))
+                click.echo(json.dumps(output, indent=2, sort_keys=True))
             else:
                 click.echo(text.rstrip())
             return
@@ -1344,7 +1405,7 @@ def recall(
     output["results"] = payloads
     output["recall_status"] = recall_status
     if as_json:
-        click.echo(json_mod.dumps(output, indent=2, sort_keys=True))
+        click.echo(json.dumps(output, indent=2, sort_keys=True))
         return
     if handle and output.get("text"):
         click.echo(str(output["text"]).rstrip())
@@ -1398,8 +1459,6 @@ def talk(
     pluggable voice providers (mic + speech) are planned on the same loop.
     Flags and output may change. See docs/talk-to-memories.md.
     """
-    import json as json_mod
-
     from .search import reindex as reindex_index
     from .talk import Conversation, RecallEngine, TextTransport
 
@@ -1482,7 +1541,7 @@ def talk(
 
     if as_json:
         click.echo(
-            json_mod.dumps(
+            json.dumps(
                 {"backend": config.search_backend, "backend_ready": ready, "turns": turns},
                 indent=2,
                 sort_keys=True,
@@ -1645,8 +1704,6 @@ def cluster_join(ctx: click.Context, invite_token: str, node_alias: str | None,
 @click.pass_context
 def cluster_status(ctx: click.Context, as_json: bool) -> None:
     """Show cluster status."""
-    import json as json_mod
-
     from .sync.config import cluster_feature_enabled, load_cluster_config, load_pending_join_state
     from .sync.store import ClusterStore
 
@@ -1672,7 +1729,7 @@ def cluster_status(ctx: click.Context, as_json: bool) -> None:
                 "transports": [transport.to_dict() for transport in cluster_config.transports],
             }
             if as_json:
-                click.echo(json_mod.dumps(data, indent=2, sort_keys=True))
+                click.echo(json.dumps(data, indent=2, sort_keys=True))
                 return
             click.echo(f"Cluster: {data['cluster']['name']} ({data['cluster']['id']})")
             click.echo(f"Node: {data['node']['alias']} ({data['node']['id']})")
@@ -1715,7 +1772,7 @@ def cluster_status(ctx: click.Context, as_json: bool) -> None:
             }
         data["remediation"] = _cluster_remediation(data)
     if as_json:
-        click.echo(json_mod.dumps(data, indent=2, sort_keys=True))
+        click.echo(json.dumps(data, indent=2, sort_keys=True))
         return
     if not data["initialized"]:
         click.echo("OM Cluster: not initialized")
@@ -1838,8 +1895,6 @@ def cluster_relay_serve(storage_dir: Path, host: str, port: int) -> None:
 @click.pass_context
 def cluster_relay_health(ctx: click.Context, url: str | None, artifact_dir: Path | None, as_json: bool) -> None:
     """Check relay reachability and artifact secrecy."""
-    import json as json_mod
-
     from .sync.config import load_cluster_config
     from .sync.relay_server import scan_relay_artifacts
     from .sync.transports.relay import RelayTransport
@@ -1862,7 +1917,7 @@ def cluster_relay_health(ctx: click.Context, url: str | None, artifact_dir: Path
     if artifact_scan is not None:
         payload["ok"] = bool(payload["ok"] and artifact_scan["ok"])
     if as_json:
-        click.echo(json_mod.dumps(payload, indent=2, sort_keys=True))
+        click.echo(json.dumps(payload, indent=2, sort_keys=True))
         return
     if not checks and artifact_scan is None:
         click.echo("No relay URL or artifact directory configured.")
@@ -1882,8 +1937,6 @@ def cluster_relay_health(ctx: click.Context, url: str | None, artifact_dir: Path
 @click.pass_context
 def cluster_requests(ctx: click.Context, as_json: bool) -> None:
     """List pending request-mode join requests visible in configured transports."""
-    import json as json_mod
-
     from .sync.config import load_cluster_config, verify_join_request
     from .sync.engine import build_transport
 
@@ -1899,7 +1952,7 @@ def cluster_requests(ctx: click.Context, as_json: bool) -> None:
             if data is None:
                 continue
             try:
-                request = verify_join_request(json_mod.loads(data.decode("utf-8")), cluster_id=cluster_config.id)
+                request = verify_join_request(json.loads(data.decode("utf-8")), cluster_id=cluster_config.id)
             except Exception as e:
                 requests[request_id] = {"request_id": request_id, "status": "invalid", "error": str(e)}
                 continue
@@ -1914,7 +1967,7 @@ def cluster_requests(ctx: click.Context, as_json: bool) -> None:
                 "expires_at": request.get("expires_at"),
             }
     if as_json:
-        click.echo(json_mod.dumps(list(requests.values()), indent=2, sort_keys=True))
+        click.echo(json.dumps(list(requests.values()), indent=2, sort_keys=True))
         return
     if not requests:
         click.echo("No join requests.")
@@ -1947,8 +2000,6 @@ def cluster_reject(ctx: click.Context, request_id: str, reason: str) -> None:
 
 
 def _complete_join_request(ctx: click.Context, request_id: str, *, approve: bool, reason: str) -> None:
-    import json as json_mod
-
     from .sync.config import (
         create_join_approval,
         create_join_rejection,
@@ -1970,7 +2021,7 @@ def _complete_join_request(ctx: click.Context, request_id: str, *, approve: bool
         if data is None:
             continue
         try:
-            request = verify_join_request(json_mod.loads(data.decode("utf-8")), cluster_id=cluster_config.id)
+            request = verify_join_request(json.loads(data.decode("utf-8")), cluster_id=cluster_config.id)
         except ValueError as e:
             raise click.ClickException(str(e)) from e
         break
@@ -2006,7 +2057,7 @@ def _complete_join_request(ctx: click.Context, request_id: str, *, approve: bool
         record = None
         approval = create_join_rejection(config, cluster_config, request=request, reason=reason)
 
-    payload = (json_mod.dumps(approval, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    payload = (json.dumps(approval, indent=2, sort_keys=True) + "\n").encode("utf-8")
     for transport in transports:
         transport.publish_join_approval(cluster_config.id, request_id, payload)
     if approve and record is not None:
@@ -2020,14 +2071,12 @@ def _complete_join_request(ctx: click.Context, request_id: str, *, approve: bool
 @click.pass_context
 def cluster_peers(ctx: click.Context, as_json: bool) -> None:
     """List trusted cluster peers."""
-    import json as json_mod
-
     from .sync.store import ClusterStore
 
     store = ClusterStore.from_config(ctx.obj["config"])
     peers = [node.to_dict() for node in store.public_nodes().values()]
     if as_json:
-        click.echo(json_mod.dumps(peers, indent=2, sort_keys=True))
+        click.echo(json.dumps(peers, indent=2, sort_keys=True))
         return
     for peer in peers:
         revoked = " revoked" if peer.get("revoked") else ""
@@ -2101,8 +2150,6 @@ def cluster_source_policy() -> None:
 @click.option("--json", "as_json", is_flag=True, help="Machine-readable JSON output")
 @click.pass_context
 def cluster_source_policy_list(ctx: click.Context, as_json: bool) -> None:
-    import json as json_mod
-
     from .sync.config import load_cluster_config
 
     cluster_config = load_cluster_config(ctx.obj["config"])
@@ -2110,7 +2157,7 @@ def cluster_source_policy_list(ctx: click.Context, as_json: bool) -> None:
         raise click.ClickException("OM Cluster is not initialized.")
     rules = [rule.__dict__ for rule in cluster_config.namespace_rules]
     if as_json:
-        click.echo(json_mod.dumps(rules, indent=2, sort_keys=True))
+        click.echo(json.dumps(rules, indent=2, sort_keys=True))
         return
     for index, rule in enumerate(rules, 1):
         filters = ", ".join(f"{key}={value}" for key, value in rule.items() if key != "namespace" and value)
@@ -2155,13 +2202,11 @@ def cluster_source_policy_add(
 @click.pass_context
 def cluster_sync(ctx: click.Context, as_json: bool, no_materialize: bool) -> None:
     """Sync records through configured transports."""
-    import json as json_mod
-
     from .sync.engine import sync_cluster
 
     summary = sync_cluster(ctx.obj["config"], materialize=not no_materialize)
     if as_json:
-        click.echo(json_mod.dumps(summary.to_dict(), indent=2, sort_keys=True))
+        click.echo(json.dumps(summary.to_dict(), indent=2, sort_keys=True))
         return
     click.echo(f"Pulled {summary.pulled} record(s)")
     click.echo(f"Pushed {summary.pushed} record(s)")
@@ -2471,8 +2516,6 @@ def cluster_override_set(ctx: click.Context, target: str, section: str, body: st
 @click.option("--json", "as_json", is_flag=True, help="Machine-readable JSON output")
 @click.pass_context
 def cluster_override_list(ctx: click.Context, as_json: bool) -> None:
-    import json as json_mod
-
     from .sync.store import ClusterStore
 
     store = ClusterStore.from_config(ctx.obj["config"])
@@ -2490,7 +2533,7 @@ def cluster_override_list(ctx: click.Context, as_json: bool) -> None:
             }
         )
     if as_json:
-        click.echo(json_mod.dumps(rows, indent=2, sort_keys=True))
+        click.echo(json.dumps(rows, indent=2, sort_keys=True))
         return
     for row in rows:
         click.echo(f"{row['record_id']} {row['operation']} {row['target']}:{row['section']}")
@@ -2564,8 +2607,6 @@ def _parse_transport_spec(spec: str):
 
 def _expand_transport_path(value: str) -> str:
     if sys.platform == "win32":
-        import re
-
         value = re.sub(r"%([^%]+)%", lambda match: os.environ.get(match.group(1), match.group(0)), value)
     return os.path.expandvars(os.path.expanduser(value))
 
@@ -3031,9 +3072,7 @@ def _import_existing_memory(store) -> None:
 
 
 def json_like(value) -> str:
-    import json as json_mod
-
-    return json_mod.dumps(value, sort_keys=True, ensure_ascii=False)
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
 
 
 @cli.command(name="export")
@@ -3088,13 +3127,11 @@ def export_cmd(
 @click.pass_context
 def codex_checkpoint(ctx: click.Context) -> None:
     """Queue a Codex transcript-specific checkpoint from the Stop hook payload."""
-    import json as json_mod
-
     config = ctx.obj["config"]
 
     try:
-        payload = json_mod.load(sys.stdin)
-    except json_mod.JSONDecodeError:
+        payload = json.load(sys.stdin)
+    except json.JSONDecodeError:
         return
 
     if not isinstance(payload, dict):
@@ -3113,7 +3150,7 @@ def codex_checkpoint(ctx: click.Context) -> None:
         return
 
     try:
-        current_count = _count_codex_transcript_messages(transcript)
+        current_count = _count_codex_transcript_messages(config, transcript)
         if current_count <= 0:
             _release_codex_checkpoint_lock(lock_path)
             return
@@ -3145,7 +3182,7 @@ def codex_checkpoint(ctx: click.Context) -> None:
         _update_codex_checkpoint_state(
             config,
             transcript,
-            message_count=_count_codex_transcript_messages(transcript),
+            message_count=_count_codex_transcript_messages(config, transcript),
             status="failed",
         )
         _release_codex_checkpoint_lock(lock_path)
@@ -3174,14 +3211,14 @@ def codex_checkpoint_worker(ctx: click.Context, transcript: Path) -> None:
         _update_codex_checkpoint_state(
             config,
             transcript,
-            message_count=_count_codex_transcript_messages(transcript),
+            message_count=_count_codex_transcript_messages(config, transcript),
             status="success",
         )
     except ObserverWorkerBusy:
         _update_codex_checkpoint_state(
             config,
             transcript,
-            message_count=_count_codex_transcript_messages(transcript),
+            message_count=_count_codex_transcript_messages(config, transcript),
             status="skipped_busy",
         )
         return
@@ -3189,7 +3226,7 @@ def codex_checkpoint_worker(ctx: click.Context, transcript: Path) -> None:
         _update_codex_checkpoint_state(
             config,
             transcript,
-            message_count=_count_codex_transcript_messages(transcript),
+            message_count=_count_codex_transcript_messages(config, transcript),
             status="memory_exceeded",
         )
         return
@@ -3197,7 +3234,7 @@ def codex_checkpoint_worker(ctx: click.Context, transcript: Path) -> None:
         _update_codex_checkpoint_state(
             config,
             transcript,
-            message_count=_count_codex_transcript_messages(transcript),
+            message_count=_count_codex_transcript_messages(config, transcript),
             status="timeout",
         )
         return
@@ -3205,7 +3242,7 @@ def codex_checkpoint_worker(ctx: click.Context, transcript: Path) -> None:
         _update_codex_checkpoint_state(
             config,
             transcript,
-            message_count=_count_codex_transcript_messages(transcript),
+            message_count=_count_codex_transcript_messages(config, transcript),
             status="failed",
         )
         raise
@@ -3257,13 +3294,11 @@ def claude_checkpoint(ctx: click.Context) -> None:
     ``claude-checkpoint-worker`` so the calling agent isn't blocked by
     LLM work.
     """
-    import json as json_mod
-
     config = ctx.obj["config"]
 
     try:
-        payload = json_mod.load(sys.stdin)
-    except json_mod.JSONDecodeError:
+        payload = json.load(sys.stdin)
+    except json.JSONDecodeError:
         return
 
     if not isinstance(payload, dict):
@@ -3413,6 +3448,19 @@ _SUPPORTED_PROVIDERS = (
 )
 _SCHEDULER_MODES = ("auto", "launchd", "cron", "schtasks", "none")
 _SCHEDULER_COMMAND_TIMEOUT_SECONDS = 5
+_OBSERVATIONS_TEMPLATE = b"# Observations\n\n<!-- Auto-maintained by the Observer. -->\n"
+_REFLECTIONS_TEMPLATE = (
+    "# Reflections — Long-Term Memory\n\n"
+    "*Last updated: never*\n\n"
+    "<!-- Auto-maintained by the Reflector. -->\n\n"
+    "## Core Identity\n\n"
+    "## Active Projects\n\n"
+    "## Preferences & Opinions\n\n"
+    "## Relationship & Communication\n\n"
+    "## Key Facts & Context\n\n"
+    "## Recent Themes\n\n"
+    "## Archive\n"
+).encode()
 
 
 def _validate_api_key_format(key: str, provider: str) -> bool:
@@ -3722,22 +3770,11 @@ def install(
 
     # Create initial memory files
     if not config.observations_path.exists():
-        config.observations_path.write_text("# Observations\n\n<!-- Auto-maintained by the Observer. -->\n")
+        config.observations_path.write_bytes(_OBSERVATIONS_TEMPLATE)
         click.echo(f"Created {config.observations_path}")
 
     if not config.reflections_path.exists():
-        config.reflections_path.write_text(
-            "# Reflections — Long-Term Memory\n\n"
-            "*Last updated: never*\n\n"
-            "<!-- Auto-maintained by the Reflector. -->\n\n"
-            "## Core Identity\n\n"
-            "## Active Projects\n\n"
-            "## Preferences & Opinions\n\n"
-            "## Relationship & Communication\n\n"
-            "## Key Facts & Context\n\n"
-            "## Recent Themes\n\n"
-            "## Archive\n"
-        )
+        config.reflections_path.write_bytes(_REFLECTIONS_TEMPLATE)
         click.echo(f"Created {config.reflections_path}")
 
     from .startup_memory import refresh_startup_memory
@@ -3831,8 +3868,6 @@ def uninstall(ctx: click.Context, targets: str, purge: bool) -> None:
         _uninstall_cron(targets)
 
     if purge:
-        import shutil
-
         if config.memory_dir.exists():
             shutil.rmtree(config.memory_dir)
             click.echo(f"Removed {config.memory_dir}")
@@ -3840,6 +3875,48 @@ def uninstall(ctx: click.Context, targets: str, purge: bool) -> None:
     click.echo("Uninstall complete.")
 
 
+_LINE_COUNT_CHUNK_BYTES = 64 * 1024
+
+
+def _file_line_byte_counts(path: Path) -> tuple[int, int] | None:
+    """Return ``(lines, bytes)`` for *path* without decoding it, or None if missing.
+
+    Memory files can grow to several MB; ``om status`` only needs counts, so
+    stream binary chunks through one reused buffer instead of materializing the
+    text. A final line without a trailing newline still counts, matching
+    ``splitlines()``.
+    """
+    try:
+        with path.open("rb", buffering=0) as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if not size:
+                return 0, 0
+            lines = 0
+            last = ord("\n")
+            buffer = bytearray(min(size, _LINE_COUNT_CHUNK_BYTES))
+            while read := handle.readinto(buffer):
+                lines += buffer.count(b"\n", 0, read)
+                last = buffer[read - 1]
+    except FileNotFoundError:
+        return None
+    if last != ord("\n"):
+        lines += 1
+    return lines, size
+
+
+def _directory_file_names(directory: Path) -> frozenset[str] | None:
+    """Return the names of regular files in *directory*, or None if it does not exist.
+
+    Any other failure to list it (e.g. PermissionError) propagates, so callers
+    can report the directory as unreadable rather than missing.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 @cli.command()
 @click.pass_context
 def status(ctx: click.Context) -> None:
@@ -3849,62 +3926,54 @@ def status(ctx: click.Context) -> None:
     click.echo("Observational Memory Status")
     click.echo("=" * 40)
 
-    # Memory directory
+    # Memory directory: one listing answers which OM files exist, so missing
+    # ones are reported without probing each path.
+    memory_dir_error: OSError | None = None
+    try:
+        memory_dir_names = _directory_file_names(config.memory_dir)
+    except OSError as exc:
+        memory_dir_names, memory_dir_error = None, exc
+    memory_dir_exists = memory_dir_names is not None or memory_dir_error is not None
     click.echo(f"\nMemory dir: {config.memory_dir}")
-    click.echo(f"  Exists: {config.memory_dir.exists()}")
-
-    # Observations
-    if config.observations_path.exists():
-        obs = config.observations_path.read_text()
-        lines = len(obs.splitlines())
-        size = len(obs)
-        click.echo(f"\nObservations: {config.observations_path}")
-        click.echo(f"  Lines: {lines}, Size: {size} bytes")
-    else:
-        click.echo("\nObservations: not created yet")
-
-    # Reflections
-    if config.reflections_path.exists():
-        ref = config.reflections_path.read_text()
-        lines = len(ref.splitlines())
-        size = len(ref)
-        click.echo(f"\nReflections: {config.reflections_path}")
-        click.echo(f"  Lines: {lines}, Size: {size} bytes")
-    else:
-        click.echo("\nReflections: not created yet")
+    click.echo(f"  Exists: {memory_dir_exists}")
+
+    if memory_dir_names is not None:
+        # Memory files
+        for label, path in (
+            ("Observations", config.observations_path),
+            ("Reflections", config.reflections_path),
+            ("Startup profile", config.profile_path),
+            ("Active context", config.active_path),
+        ):
+            counts = _file_line_byte_counts(path) if path.name in memory_dir_names else None
+            if counts is None:
+                click.echo(f"\n{label}: not created yet")
+                continue
+            lines, size = counts
+            click.echo(f"\n{label}: {path}")
+            click.echo(f"  Lines: {lines}, Size: {size} bytes")
 
-    # Compact startup files
-    if config.profile_path.exists():
-        profile = config.profile_path.read_text()
-        click.echo(f"\nStartup profile: {config.profile_path}")
-        click.echo(f"  Lines: {len(profile.splitlines())}, Size: {len(profile)} bytes")
-    else:
-        click.echo("\nStartup profile: not created yet")
+        # Cursor
+        from .observe import CURSOR_META_KEYS
 
-    if config.active_path.exists():
-        active = config.active_path.read_text()
-        click.echo(f"\nActive context: {config.active_path}")
-        click.echo(f"  Lines: {len(active.splitlines())}, Size: {len(active)} bytes")
-    else:
-        click.echo("\nActive context: not created yet")
-
-    # Cursor
-    cursor = config.load_cursor()
-    if cursor:
-        click.echo(f"\nCursor: tracking {len(cursor)} transcript(s)")
+        cursor = config.load_cursor() if config.cursor_path.name in memory_dir_names else {}
+        tracked = sum(1 for key in cursor if key not in CURSOR_META_KEYS)
+        if tracked:
+            click.echo(f"\nCursor: tracking {tracked} transcript(s)")
+        else:
+            click.echo("\nCursor: no transcripts tracked yet")
+    elif memory_dir_error is not None:
+        click.echo(f"\nMemory files: unreadable ({memory_dir_error.strerror or memory_dir_error})")
     else:
-        click.echo("\nCursor: no transcripts tracked yet")
+        # Memory files and the cursor all live under memory_dir; skip probing each one.
+        click.echo("\nMemory files: not installed (run 'om install' to create)")
 
     # Env file
     click.echo(f"\nEnv file: {config.env_file}")
     if config.env_file.exists():
-        # Count non-comment, non-empty lines (i.e. actual key assignments)
-        env_lines = [
-            line.strip()
-            for line in config.env_file.read_text().splitlines()
-            if line.strip() and not line.strip().startswith("#")
-        ]
-        click.echo(f"  Exists: yes ({len(env_lines)} key(s) configured)")
+        # Shares the cached parse from seeding os.environ at startup
+        key_count = len(read_env_file(config.env_file))
+        click.echo(f"  Exists: yes ({key_count} key(s) configured)")
     else:
         click.echo("  Exists: no (run 'om install' to create)")
 
@@ -3979,19 +4048,15 @@ def status(ctx: click.Context) -> None:
 
     # Claude Code hooks
     if config.claude_settings_path.exists():
-        import json
-
-        settings = json.loads(config.claude_settings_path.read_text())
-        hooks = settings.get("hooks", {})
-        has_start = "SessionStart" in hooks
-        has_end = "SessionEnd" in hooks
-        has_prompt_submit = "UserPromptSubmit" in hooks
-        has_precompact = "PreCompact" in hooks
-        click.echo("\nClaude Code hooks:")
-        click.echo(f"  SessionStart: {'installed' if has_start else 'not installed'}")
-        click.echo(f"  SessionEnd: {'installed' if has_end else 'not installed'}")
-        click.echo(f"  UserPromptSubmit: {'installed' if has_prompt_submit else 'not installed'}")
-        click.echo(f"  PreCompact: {'installed' if has_precompact else 'not installed'}")
+        settings = json.loads(config.claude_settings_path.read_bytes())
+        installed_events = set(settings.get("hooks", {})).intersection(_CLAUDE_HOOK_EVENTS)
+        click.echo(
+            "\nClaude Code hooks:\n"
+            + "\n".join(
+                f"  {event}: {'installed' if event in installed_events else 'not installed'}"
+                for event in _CLAUDE_HOOK_EVENTS
+            )
+        )
     else:
         click.echo(f"\nClaude Code: settings not found at {config.claude_settings_path}")
 
@@ -4132,9 +4197,7 @@ def status(ctx: click.Context) -> None:
     if grok_hook_file.exists():
         click.echo(f"  OM hook file: installed ({grok_hook_file})")
         try:
-            import json as json_mod
-
-            data = json_mod.loads(grok_hook_file.read_text())
+            data = json.loads(grok_hook_file.read_text())
             events = list(data.get("hooks", {}).keys())
             click.echo(f"  Registered events: {', '.join(events) if events else 'none'}")
         except Exception:
@@ -4182,8 +4245,6 @@ def status(ctx: click.Context) -> None:
 @click.pass_context
 def doctor(ctx: click.Context, as_json: bool, validate_key: bool) -> None:
     """Run diagnostic checks on your observational memory installation."""
-    import json as json_mod
-
     config = ctx.obj["config"]
     results: list[dict] = []
 
@@ -4199,7 +4260,7 @@ def doctor(ctx: click.Context, as_json: bool, validate_key: bool) -> None:
         _check("Python version", "FAIL", ver_str, fix="Upgrade to Python 3.11+")
 
     # 2. om binary on PATH
-    om_path = shutil.which("om")
+    om_path = _find_om_path()
     if om_path:
         _check("om binary", "PASS", om_path)
     else:
@@ -4461,7 +4522,7 @@ def doctor(ctx: click.Context, as_json: bool, validate_key: bool) -> None:
     # 10. Claude hooks
     if config.claude_settings_path.exists():
         try:
-            settings = json_mod.loads(config.claude_settings_path.read_text())
+            settings = json.loads(config.claude_settings_path.read_bytes())
             hooks = settings.get("hooks", {})
             expected = ["SessionStart", "SessionEnd", "UserPromptSubmit", "PreCompact"]
             present = [h for h in expected if h in hooks]
@@ -4692,7 +4753,7 @@ def doctor(ctx: click.Context, as_json: bool, validate_key: bool) -> None:
     # 13. Hook paths valid (only check Claude hook commands that look like file paths, not inline shell commands)
     if config.claude_settings_path.exists():
         try:
-            settings = json_mod.loads(config.claude_settings_path.read_text())
+            settings = json.loads(config.claude_settings_path.read_bytes())
             hooks = settings.get("hooks", {})
             broken = []
             for event_name, event_hooks in hooks.items():
@@ -4880,7 +4941,7 @@ def doctor(ctx: click.Context, as_json: bool, validate_key: bool) -> None:
 
     # Output
     if as_json:
-        click.echo(json_mod.dumps(results, indent=2))
+        click.echo(json.dumps(results, indent=2))
     else:
         for r in results:
             tag = r["status"]
@@ -4959,68 +5020,66 @@ def _grok_hook_commands() -> tuple[str, str]:
     return str(grok_hooks_dir / "session-start.sh"), f"{_find_om_path() or 'om'} grok-checkpoint"
 
 
+_CLAUDE_HOOK_EVENTS = ("SessionStart", "SessionEnd", "UserPromptSubmit", "PreCompact")
+
+
+def _claude_hook_entry(command: str, timeout: int, *, async_: bool = False, status_message: str | None = None) -> list:
+    """Return a single-command Claude Code hook matcher list."""
+    hook: dict = {"type": "command", "command": command, "timeout": timeout}
+    if status_message is not None:
+        hook["statusMessage"] = status_message
+    if async_:
+        hook["async"] = True
+    return [{"hooks": [hook]}]
+
+
+def _claude_hooks_template(session_start_command: str, checkpoint_command: str) -> dict:
+    """Return the hook events OM manages in Claude Code settings, keyed by event name."""
+    return {
+        "SessionStart": _claude_hook_entry(session_start_command, 15, status_message="Loading observational memory..."),
+        "SessionEnd": _claude_hook_entry(checkpoint_command, 60, async_=True),
+        "UserPromptSubmit": _claude_hook_entry(checkpoint_command, 5, async_=True),
+        "PreCompact": _claude_hook_entry(checkpoint_command, 5, async_=True),
+    }
+
+
 def _install_claude_hooks(config: Config) -> None:
     """Add SessionStart and session checkpoint hooks to ~/.claude/settings.json."""
-    import json
-
     session_start_command, checkpoint_command = _claude_hook_commands()
 
     if not config.claude_settings_path.exists():
         config.claude_settings_path.parent.mkdir(parents=True, exist_ok=True)
+        original = None
         settings = {}
     else:
-        settings = json.loads(config.claude_settings_path.read_text())
-
-    hooks = settings.setdefault("hooks", {})
-
-    # SessionStart hook
-    hooks["SessionStart"] = [
-        {
-            "hooks": [
-                {
-                    "type": "command",
-                    "command": session_start_command,
-                    "timeout": 15,
-                    "statusMessage": "Loading observational memory...",
-                }
-            ]
-        }
-    ]
+        original = config.claude_settings_path.read_bytes()
+        settings = json.loads(original)
 
-    # SessionEnd hook
-    hooks["SessionEnd"] = [
-        {"hooks": [{"type": "command", "command": checkpoint_command, "timeout": 60, "async": True}]}
-    ]
-
-    # UserPromptSubmit checkpoint hook
-    hooks["UserPromptSubmit"] = [
-        {"hooks": [{"type": "command", "command": checkpoint_command, "timeout": 5, "async": True}]}
-    ]
+    settings.setdefault("hooks", {}).update(_claude_hooks_template(session_start_command, checkpoint_command))
 
-    # PreCompact checkpoint hook
-    hooks["PreCompact"] = [{"hooks": [{"type": "command", "command": checkpoint_command, "timeout": 5, "async": True}]}]
-
-    config.claude_settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+    # Re-running install is common; leave settings.json (and its mtime) alone
+    # when the hooks are already exactly what we would write.
+    updated = (json.dumps(settings, indent=2) + "\n").encode()
+    if updated == original:
+        click.echo("Claude Code hooks already up to date (SessionStart, UserPromptSubmit, PreCompact, SessionEnd)")
+        return
+    config.claude_settings_path.write_bytes(updated)
     click.echo("Installed Claude Code hooks (SessionStart, UserPromptSubmit, PreCompact, SessionEnd)")
 
 
 def _uninstall_claude_hooks(config: Config) -> None:
     """Remove observational memory hooks from Claude Code settings."""
-    import json
-
     if not config.claude_settings_path.exists():
         return
 
-    settings = json.loads(config.claude_settings_path.read_text())
+    settings = json.loads(config.claude_settings_path.read_bytes())
     hooks = settings.get("hooks", {})
-    hooks.pop("SessionStart", None)
-    hooks.pop("SessionEnd", None)
-    hooks.pop("UserPromptSubmit", None)
-    hooks.pop("PreCompact", None)
+    for event in _CLAUDE_HOOK_EVENTS:
+        hooks.pop(event, None)
     if not hooks:
         settings.pop("hooks", None)
 
-    config.claude_settings_path.write_text(json.dumps(settings, indent=2) + "\n")
+    config.claude_settings_path.write_bytes((json.dumps(settings, indent=2) + "\n").encode())
     click.echo("Removed Claude Code hooks")
 
 
@@ -5036,8 +5095,6 @@ def _cowork_plugin_dir(config: Config) -> Path:
 
 def _validate_cowork_hooks_json(path: Path) -> tuple[bool, str]:
     """Validate enough of the Cowork plugin hook schema for local diagnostics."""
-    import json
-
     try:
         payload = json.loads(path.read_text())
     except json.JSONDecodeError as exc:
@@ -5056,8 +5113,6 @@ def _validate_cowork_hooks_json(path: Path) -> tuple[bool, str]:
 
 def _install_cowork_plugin(config: Config) -> None:
     """Copy the bundled Cowork plugin to the local-agent-mode-plugins directory."""
-    import shutil
-
     if sys.platform == "win32":
         # Cowork ships only on macOS today and its bash hook scripts depend
         # on jq + bash. We surface a clear message rather than copy files
@@ -5085,8 +5140,6 @@ def _install_cowork_plugin(config: Config) -> None:
 
 def _uninstall_cowork_plugin(config: Config) -> None:
     """Remove the observational-memory Cowork plugin."""
-    import shutil
-
     target_dir = _cowork_plugin_dir(config)
     if target_dir.exists():
         shutil.rmtree(target_dir)
@@ -5144,6 +5197,9 @@ The same `om search` / `om recall` / `om context` work from within Grok.
 
 {_CODEX_OM_MARKER}"""
 
+_CODEX_OM_MARKER_BYTES = _CODEX_OM_MARKER.encode()
+_CODEX_OM_BLOCK_BYTES = (_CODEX_OM_BLOCK + "\n").encode()
+
 
 def _build_codex_session_start_command() -> str:
     """Return the command string for the Codex SessionStart hook."""
@@ -5208,8 +5264,6 @@ def _hook_command_exists(command: str) -> bool:
 
 def _load_codex_hooks_payload(path: Path) -> dict:
     """Load hooks.json, validating the expected top-level shape."""
-    import json
-
     if not path.exists():
         return {"hooks": {}}
 
@@ -5303,8 +5357,6 @@ def _is_om_codex_stop_group(group: object) -> bool:
 
 def _find_codex_session_start_hook(config: Config) -> tuple[dict | None, str | None]:
     """Return the installed OM SessionStart hook, or an error string if unreadable."""
-    import json
-
     path = config.codex_hooks_path
     if not path.exists():
         return None, None
@@ -5336,8 +5388,6 @@ def _find_codex_session_start_hook(config: Config) -> tuple[dict | None, str | N
 
 def _find_codex_stop_hook(config: Config) -> tuple[dict | None, str | None]:
     """Return the installed OM Stop hook, or an error string if unreadable."""
-    import json
-
     path = config.codex_hooks_path
     if not path.exists():
         return None, None
@@ -5405,8 +5455,6 @@ def _codex_hooks_feature_enabled(config: Config) -> tuple[bool | None, str | Non
 
 def _enable_codex_hooks_feature(config: Config) -> None:
     """Ensure ~/.codex/config.toml enables Codex hooks across old and new flag names."""
-    import re
-
     path = config.codex_config_path
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -5501,8 +5549,6 @@ def _enable_codex_hooks_feature(config: Config) -> None:
 
 def _install_codex_session_start_hook(config: Config) -> None:
     """Install the OM-managed Codex SessionStart hook in hooks.json."""
-    import json
-
     path = config.codex_hooks_path
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = _load_codex_hooks_payload(path)
@@ -5522,8 +5568,6 @@ def _install_codex_session_start_hook(config: Config) -> None:
 
 def _install_codex_stop_hook(config: Config) -> None:
     """Install the OM-managed Codex Stop hook in hooks.json."""
-    import json
-
     path = config.codex_hooks_path
     path.parent.mkdir(parents=True, exist_ok=True)
     payload = _load_codex_hooks_payload(path)
@@ -5543,8 +5587,6 @@ def _install_codex_stop_hook(config: Config) -> None:
 
 def _uninstall_codex_session_start_hook(config: Config) -> None:
     """Remove the OM-managed Codex SessionStart hook from hooks.json."""
-    import json
-
     path = config.codex_hooks_path
     if not path.exists():
         return
@@ -5577,8 +5619,6 @@ def _uninstall_codex_session_start_hook(config: Config) -> None:
 
 def _uninstall_codex_stop_hook(config: Config) -> None:
     """Remove the OM-managed Codex Stop hook from hooks.json."""
-    import json
-
     path = config.codex_hooks_path
     if not path.exists():
         return
@@ -5611,8 +5651,6 @@ def _uninstall_codex_stop_hook(config: Config) -> None:
 
 def _uninstall_codex_hooks(config: Config) -> None:
     """Remove OM-managed Codex hooks from hooks.json in a single read-write pass."""
-    import json
-
     path = config.codex_hooks_path
     if not path.exists():
         return
@@ -5660,8 +5698,6 @@ def _uninstall_codex_hooks(config: Config) -> None:
 
 def _install_codex(config: Config) -> None:
     """Install Codex startup integration with hooks-first behavior."""
-    import re
-
     _enable_codex_hooks_feature(config)
     _install_codex_session_start_hook(config)
     _install_codex_stop_hook(config)
@@ -5670,22 +5706,52 @@ def _install_codex(config: Config) -> None:
 
     if not agents_md.exists():
         agents_md.parent.mkdir(parents=True, exist_ok=True)
-        agents_md.write_text(_CODEX_OM_BLOCK + "\n")
+        agents_md.write_bytes(_CODEX_OM_BLOCK_BYTES)
         click.echo(f"Installed Codex AGENTS fallback in {agents_md}")
         return
 
-    existing = agents_md.read_text()
-    if _CODEX_OM_MARKER in existing:
-        pattern = rf"\n*{re.escape(_CODEX_OM_MARKER)}.*?{re.escape(_CODEX_OM_MARKER)}\n*"
-        replaced = re.sub(pattern, "\n\n" + _CODEX_OM_BLOCK + "\n", existing, flags=re.DOTALL)
-        agents_md.write_text(replaced.strip() + "\n")
+    # Stay in bytes unless an existing block has to be swapped out; appending
+    # never needs the rest of a large AGENTS.md decoded and re-encoded.
+    existing = agents_md.read_bytes()
+    if _CODEX_OM_MARKER_BYTES in existing:
+        replaced = _replace_delimited_blocks(
+            existing.decode(), _CODEX_OM_MARKER, _CODEX_OM_MARKER, "\n\n" + _CODEX_OM_BLOCK + "\n"
+        )
+        updated = (replaced.strip() + "\n").encode()
+        if updated == existing:
+            click.echo(f"Observational memory instructions already up to date in {agents_md}")
+            return
+        agents_md.write_bytes(updated)
         click.echo(f"Updated observational memory instructions in {agents_md}")
         return
 
-    agents_md.write_text(existing.rstrip() + "\n\n" + _CODEX_OM_BLOCK + "\n")
+    agents_md.write_bytes(existing.rstrip() + b"\n\n" + _CODEX_OM_BLOCK_BYTES)
     click.echo(f"Installed Codex AGENTS fallback in {agents_md}")
 
 
+def _replace_delimited_blocks(content: str, start_marker: str, end_marker: str, replacement: str = "\n") -> str:
+    """Replace every ``start_marker ... end_marker`` block with *replacement*.
+
+    Newlines hugging a block are absorbed, matching the old
+    ``\\n*START.*?END\\n*`` DOTALL substitution, but with plain ``str.find``
+    slicing: the markers are fixed strings, so no pattern compile or backtracking.
+    An unterminated start marker is left untouched.
+    """
+    parts: list[str] = []
+    pos = 0
+    while (start := content.find(start_marker, pos)) != -1:
+        end = content.find(end_marker, start + len(start_marker))
+        if end == -1:
+            break
+        parts.append(content[pos:start].rstrip("\n"))
+        parts.append(replacement)
+        pos = end + len(end_marker)
+        while content.startswith("\n", pos):
+            pos += 1
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
 def _uninstall_codex(config: Config) -> None:
     """Remove OM Codex startup integration while preserving user hook settings."""
     _uninstall_codex_hooks(config)
@@ -5698,24 +5764,20 @@ def _uninstall_codex(config: Config) -> None:
     if _CODEX_OM_MARKER not in content:
         return
 
-    # Remove the OM block
-    import re
-
-    pattern = rf"\n*{re.escape(_CODEX_OM_MARKER)}.*?{re.escape(_CODEX_OM_MARKER)}\n*"
-    content = re.sub(pattern, "\n", content, flags=re.DOTALL)
+    content = _replace_delimited_blocks(content, _CODEX_OM_MARKER, _CODEX_OM_MARKER)
     agents_md.write_text(content.strip() + "\n" if content.strip() else "")
     click.echo("Removed observational memory from Codex AGENTS.md")
 
 
-def _count_codex_transcript_messages(transcript: Path) -> int:
+def _count_codex_transcript_messages(config: Config, transcript: Path) -> int:
     """Return the number of parsed Codex messages in a transcript."""
-    from .transcripts.codex import count_messages
+    from .observe import count_codex_messages
 
     if not transcript.exists():
         return 0
 
     try:
-        return count_messages(transcript)
+        return count_codex_messages(transcript, config)
     except OSError:
         return 0
 
@@ -5832,8 +5894,6 @@ def _release_checkpoint_lock(lock_path: Path) -> None:
 
 def _load_checkpoint_state(state_path: Path) -> dict[str, dict]:
     """Load checkpoint hook state, tolerating missing or invalid files."""
-    import json
-
     if not state_path.exists():
         return {}
 
@@ -5858,7 +5918,6 @@ def _update_checkpoint_state(
     except ImportError:  # pragma: no cover - non-POSIX fallback
         fcntl = None
 
-    import json
     import tempfile
 
     state_lock_path = state_path.with_suffix(".lock")
@@ -6202,7 +6261,9 @@ def _uninstall_launchd(config: Config, targets: str = "both") -> None:
 
 
 def _observer_interval_minutes(env_name: str, default: int = 15) -> int:
-    raw_interval = os.environ.get(env_name, str(default))
+    raw_interval = os.environ.get(env_name)
+    if raw_interval is None:
+        return default
     try:
         interval = int(raw_interval)
     except ValueError:
@@ -6235,17 +6296,15 @@ def _cron_every_minutes(minutes: int) -> str:
     return f"*/{minutes}"
 
 
+_CRON_JOB_RE = re.compile(r"om (?:observe(?:-worker)? --source (codex|claude-memory|claude)|(reflect))")
+
+
 def _cron_job_key(line: str) -> str | None:
     """Return the OM cron job key for a crontab line, if any."""
-    if "om observe --source codex" in line or "om observe-worker --source codex" in line:
-        return "codex"
-    if "om observe --source claude-memory" in line or "om observe-worker --source claude-memory" in line:
-        return "claude-memory"
-    if "om observe --source claude" in line or "om observe-worker --source claude" in line:
-        return "claude"
-    if "om reflect" in line:
-        return "reflect"
-    return None
+    match = _CRON_JOB_RE.search(line)
+    if match is None:
+        return None
+    return match.group(1) or match.group(2)
 
 
 def _cron_job_keys_for_targets(targets: str) -> set[str]:
@@ -6402,6 +6461,9 @@ def _install_cron(config: Config, targets: str) -> None:
     merged_jobs.update(desired_jobs)
 
     new_crontab = "\n".join(_render_crontab_lines(preserved, merged_jobs)) + "\n"
+    if new_crontab == existing:
+        click.echo(f"Cron jobs already up to date ({len(desired_jobs)} job(s))")
+        return
 
     write_error = _write_crontab(new_crontab)
     if write_error is None:
@@ -6433,10 +6495,18 @@ def _uninstall_cron(targets: str = "both") -> None:
 
 
 def _find_om_path() -> str | None:
-    """Find the absolute path to the 'om' command."""
-    import shutil
+    """Find the absolute path to the 'om' command.
 
-    return shutil.which("om")
+    ``shutil.which`` stats candidates in every PATH directory, and one install
+    renders many hook and scheduler commands that each need the path, so the
+    lookup is memoized per PATH value.
+    """
+    return _which_om(os.environ.get("PATH"))
+
+
+@functools.lru_cache(maxsize=8)
+def _which_om(search_path: str | None) -> str | None:
+    return shutil.which("om", path=search_path)
 
 
 # --- Windows Task Scheduler installation ---
@@ -6711,9 +6781,6 @@ The OpenCode plugin installed by OM records message events locally so `om observ
 
 
 def _install_opencode(config: Config) -> None:
-    import re
-    import shutil
-
     config.opencode_plugins_dir.mkdir(parents=True, exist_ok=True)
     source = Path(__file__).parent / "hooks" / "opencode" / _OPENCODE_PLUGIN_NAME
     target = config.opencode_plugins_dir / _OPENCODE_PLUGIN_NAME
@@ -6725,8 +6792,9 @@ def _install_opencode(config: Config) -> None:
     if agents_md.exists():
         existing = agents_md.read_text()
         if _OPENCODE_OM_MARKER in existing:
-            pattern = rf"\n*{re.escape(_OPENCODE_OM_MARKER)}.*?{re.escape(_OPENCODE_OM_MARKER)}\n*"
-            replaced = re.sub(pattern, "\n\n" + _OPENCODE_OM_BLOCK + "\n", existing, flags=re.DOTALL)
+            replaced = _replace_delimited_blocks(
+                existing, _OPENCODE_OM_MARKER, _OPENCODE_OM_MARKER, "\n\n" + _OPENCODE_OM_BLOCK + "\n"
+            )
             agents_md.write_text(replaced.strip() + "\n")
         else:
             agents_md.write_text(existing.rstrip() + "\n\n" + _OPENCODE_OM_BLOCK + "\n")
@@ -6736,8 +6804,6 @@ def _install_opencode(config: Config) -> None:
 
 
 def _uninstall_opencode(config: Config) -> None:
-    import re
-
     plugin = config.opencode_plugins_dir / _OPENCODE_PLUGIN_NAME
     if plugin.exists():
         plugin.unlink()
@@ -6747,8 +6813,7 @@ def _uninstall_opencode(config: Config) -> None:
     if agents_md.exists():
         content = agents_md.read_text()
         if _OPENCODE_OM_MARKER in content:
-            pattern = rf"\n*{re.escape(_OPENCODE_OM_MARKER)}.*?{re.escape(_OPENCODE_OM_MARKER)}\n*"
-            content = re.sub(pattern, "\n", content, flags=re.DOTALL)
+            content = _replace_delimited_blocks(content, _OPENCODE_OM_MARKER, _OPENCODE_OM_MARKER)
             agents_md.write_text(content.strip() + "\n" if content.strip() else "")
             click.echo("Removed observational memory from OpenCode AGENTS.md")
 
@@ -6790,9 +6855,7 @@ def _has_om_claude_session_start(config: Config) -> bool:
     if not claude_settings.exists():
         return False
     try:
-        import json as json_mod
-
-        data = json_mod.loads(claude_settings.read_text())
+        data = json.loads(claude_settings.read_text())
         hooks = data.get("hooks", {})
         for group in hooks.get("SessionStart", []):
             for hook in group.get("hooks", []):
@@ -6813,8 +6876,6 @@ def _install_grok(config: Config) -> None:
     On Windows, commands are registered as direct ``om`` invocations (matching
     the Claude Code strategy) for robustness.
     """
-    import json as json_mod
-
     grok_hooks_dir = config.grok_hooks_dir
     grok_hooks_dir.mkdir(parents=True, exist_ok=True)
 
@@ -6860,7 +6921,7 @@ def _install_grok(config: Config) -> None:
             }
         ]
 
-    hook_file.write_text(json_mod.dumps(payload, indent=2) + "\n")
+    hook_file.write_text(json.dumps(payload, indent=2) + "\n")
     click.echo(f"Installed Grok hooks in {hook_file}")
 
     if has_claude_om:
@@ -6871,14 +6932,12 @@ def _install_grok(config: Config) -> None:
 
 def _uninstall_grok(config: Config) -> None:
     """Remove OM Grok hooks file if it only contains our entries."""
-    import json as json_mod
-
     hook_file = config.grok_hooks_dir / _GROK_OM_HOOK_FILE
     if not hook_file.exists():
         return
 
     try:
-        payload = json_mod.loads(hook_file.read_text())
+        payload = json.loads(hook_file.read_text())
     except Exception:
         hook_file.unlink(missing_ok=True)
         click.echo(f"Removed invalid Grok hook file {hook_file}")
@@ -7543,19 +7602,14 @@ def _toml_basic_string(value: str) -> str:
 
 
 def _replace_marked_block(content: str, block: str) -> str:
-    import re
-
-    pattern = rf"\n*{re.escape(_KIMI_OM_BLOCK_START)}.*?{re.escape(_KIMI_OM_BLOCK_END)}\n*"
     if _KIMI_OM_BLOCK_START in content:
-        return re.sub(pattern, "\n\n" + block + "\n", content, flags=re.DOTALL).strip() + "\n"
+        replaced = _replace_delimited_blocks(content, _KIMI_OM_BLOCK_START, _KIMI_OM_BLOCK_END, "\n\n" + block + "\n")
+        return replaced.strip() + "\n"
     return content.rstrip() + ("\n\n" if content.strip() else "") + block + "\n"
 
 
 def _remove_marked_block(content: str) -> str:
-    import re
-
-    pattern = rf"\n*{re.escape(_KIMI_OM_BLOCK_START)}.*?{re.escape(_KIMI_OM_BLOCK_END)}\n*"
-    return re.sub(pattern, "\n", content, flags=re.DOTALL).strip() + "\n"
+    return _replace_delimited_blocks(content, _KIMI_OM_BLOCK_START, _KIMI_OM_BLOCK_END).strip() + "\n"
 
 
 def _install_kimi(config: Config) -> None:
@@ -7588,15 +7642,13 @@ def _uninstall_kimi(config: Config) -> None:
 @click.pass_context
 def kimi_checkpoint(ctx: click.Context) -> None:
     """Capture Kimi hook JSON from stdin for later observation."""
-    import json as json_mod
-
     config = ctx.obj["config"]
     raw = sys.stdin.read().strip()
     if not raw:
         return
     try:
-        payload = json_mod.loads(raw)
-    except json_mod.JSONDecodeError:
+        payload = json.loads(raw)
+    except json.JSONDecodeError:
         payload = {"hook_event_name": "Unknown", "raw": raw}
     if not isinstance(payload, dict):
         payload = {"hook_event_name": "Unknown", "raw": payload}
@@ -7604,5 +7656,5 @@ def kimi_checkpoint(ctx: click.Context) -> None:
     path = config.kimi_om_events_path
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as f:
-        f.write(json_mod.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n")
+        f.write(json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n")
     _queue_kimi_observer(config)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -56,6 +58,53 @@ def _xdg_config_home() -> Path:
     return Path.home() / ".config"
 
 
+def default_env_file() -> Path:
+    """Return the default env-file path (``$XDG_CONFIG_HOME/observational-memory/env``)."""
+    return _xdg_config_home() / "observational-memory" / "env"
+
+
+def load_env_file(env_file: Path) -> None:
+    """Load API keys from *env_file* into os.environ (if not already set).
+
+    Module-level so the CLI can seed the environment before it builds the one
+    :class:`Config` it needs, instead of constructing a throwaway Config just to
+    find the env file.
+    """
+    for key, value in read_env_file(env_file).items():
+        # Don't overwrite keys already in the environment
+        if key not in os.environ:
+            os.environ[key] = value
+
+
+def read_env_file(env_file: Path) -> dict[str, str]:
+    """Return the ``KEY=value`` assignments in *env_file* (empty if it is missing).
+
+    Parsed results are cached on the file's mtime and size, so callers in one
+    process (env seeding, ``om status``) share a single read and parse.
+    """
+    try:
+        stat = env_file.stat()
+    except OSError:
+        return {}
+    return dict(_parse_env_file(str(env_file), stat.st_mtime_ns, stat.st_size))
+
+
+# One ``KEY=value`` assignment per line. Blank lines, ``#`` comments and lines
+# without ``=`` simply don't match, so one C-level scan replaces per-line
+# strip/startswith/partition calls.
+_ENV_ASSIGNMENT_RE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=([^\n]*)$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    entries: dict[str, str] = {}
+    for match in _ENV_ASSIGNMENT_RE.finditer(Path(path).read_text()):
+        key = match.group(1)
+        if key not in entries:
+            entries[key] = match.group(2).strip().strip("'\"")
+    return tuple(entries.items())
+
+
 def _claude_user_dir() -> Path:
     """Return the Claude Code per-user directory.
 
@@ -260,6 +309,11 @@ ENV_FILE_TEMPLATE = """\
 # job; apply later with `om jobs poll`. Also opt-in per run via `om reflect --async`.
 # OM_OPENAI_ASYNC_MODE=off
 #
+# Backfill via Anthropic Message Batches (direct 'anthropic' provider only).
+# When on, `om backfill` sends a transcript's chunks as one batch and waits for
+# it instead of making one synchronous call per chunk.
+# OM_BACKFILL_BATCH=0
+#
 # Subscription providers (preferred for cheap-feeling features; run `om login`):
 # OM_OPENAI_CHATGPT_MODEL=gpt-5.5
 # OM_XAI_OAUTH_MODEL=grok-4.3
@@ -331,6 +385,11 @@ ENV_FILE_TEMPLATE = """\
 # OM_BUDGET_MODE=hard                  # hard (block) | soft (warn); per-budget override: <KEY>_MODE
 # OM_BUDGET_SOFT_THRESHOLD=0.8         # warn at 80% of a cap
 # OM_BUDGET_BYPASS=0                   # one-shot: 1 lets a single call exceed a hard cap
+
+# LLM response cache (host-local; never synced). Replays an identical request
+# (e.g. `om reflect --dry-run` then `om reflect`) from <memory_dir>/.llm-cache/.
+# OM_LLM_CACHE=0                       # 1=on, 0=off (default)
+# OM_LLM_CACHE_TTL_DAYS=7
 """
 
 
@@ -354,7 +413,7 @@ class Config:
     memory_dir: Path = field(default_factory=lambda: _xdg_data_home() / "observational-memory")
 
     # Env file for API keys
-    env_file: Path = field(default_factory=lambda: _xdg_config_home() / "observational-memory" / "env")
+    env_file: Path = field(default_factory=default_env_file)
 
     # Claude Code paths
     claude_projects_dir: Path = field(default_factory=lambda: _claude_user_dir() / "projects")
@@ -550,11 +609,17 @@ class Config:
     budget_soft_threshold: float = field(
         default_factory=lambda: _safe_float(os.environ.get("OM_BUDGET_SOFT_THRESHOLD"), 0.8)
     )
+    # Response cache for identical LLM requests (host-local; never synced; opt-in).
+    llm_cache_enabled: bool = field(default_factory=lambda: _env_flag("OM_LLM_CACHE", False))
+    llm_cache_ttl_days: int = field(default_factory=lambda: _safe_int(os.environ.get("OM_LLM_CACHE_TTL_DAYS"), 7))
     # Async execution mode for the direct API-key OpenAI provider: off | batch.
     # When "batch", `om reflect` submits an offline OpenAI Batch job instead of
     # running synchronously (also opt-in per-invocation via `om reflect --async`).
     # Never applies to the openai-chatgpt subscription provider.
     openai_async_mode: str = field(default_factory=lambda: os.environ.get("OM_OPENAI_ASYNC_MODE", "off"))
+    # Send each backfilled transcript's chunks as one Anthropic Message Batch
+    # (direct 'anthropic' provider only; other providers stay synchronous).
+    backfill_batch: bool = field(default_factory=lambda: _env_flag("OM_BACKFILL_BATCH", False))
 
     # OM Mail (experimental email memory substrate). The provider seam keeps
     # the mailbox a role, not a vendor: agentmail (API-first dynamic inboxes)
@@ -611,6 +676,11 @@ class Config:
         """Host-local store for async provider jobs (e.g. OpenAI Batch). Never synced."""
         return self.memory_dir / ".provider-jobs"
 
+    @property
+    def llm_cache_dir(self) -> Path:
+        """Host-local LLM response cache (see ``llm_cache``). Never synced."""
+        return self.memory_dir / ".llm-cache"
+
     @property
     def backups_dir(self) -> Path:
         """Host-local memory snapshots. Never synced (outside the materialized set)."""
@@ -786,20 +856,7 @@ class Config:
 
     def load_env_file(self) -> None:
         """Load API keys from the env file into os.environ (if not already set)."""
-        if not self.env_file.exists():
-            return
-        for line in self.env_file.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip().strip("'\"")
-            # Don't overwrite keys already in the environment
-            if key and key not in os.environ:
-                os.environ[key] = value
+        load_env_file(self.env_file)
 
     def ensure_env_file(self) -> bool:
         """Create the env file from template if it doesn't exist. Returns True if created."""
@@ -995,8 +1052,9 @@ class Config:
         if not self.cursor_path.exists():
             return {}
         try:
-            payload = json.loads(self.cursor_path.read_text())
-        except (json.JSONDecodeError, OSError):
+            # json decodes UTF-8 bytes itself; skip the locale-dependent read_text() decode.
+            payload = json.loads(self.cursor_path.read_bytes())
+        except (ValueError, OSError):
             return {}
         return payload if isinstance(payload, dict) else {}
 
@@ -1005,3 +1063,16 @@ class Config:
 
         self.ensure_memory_dir()
         atomic_write_text(self.cursor_path, json.dumps(cursor, indent=2) + "\n")
+
+    def merge_cursor(self, entries: dict) -> None:
+        """Merge *entries* into the on-disk cursor, writing only if a bookmark changed.
+
+        The cursor is re-read right before the write, so an observer that held a
+        copy across a long LLM call doesn't clobber bookmarks other sources saved
+        in the meantime, and a no-op update costs no write at all.
+        """
+        cursor = self.load_cursor()
+        if all(key in cursor and cursor[key] == value for key, value in entries.items()):
+            return
+        cursor.update(entries)
+        self.save_cursor(cursor)
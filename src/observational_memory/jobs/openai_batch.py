@@ -306,8 +306,11 @@ def _apply_one(config: Config, client, store: ProviderJobStore, record: JobRecor
         return {"job_id": record.job_id, "status": "drifted", "artifact": str(artifact)}
 
     # Apply with full parity to a synchronous reflect.
-    raw_observations = config.observations_path.read_text() if config.observations_path.exists() else ""
-    reflect.finalize_reflection(text, config, raw_observations)
+    if inputs is not None:
+        reflect.finalize_reflection(text, config, inputs.raw_observations, raw_signature=inputs.raw_signature)
+    else:
+        raw_observations = config.observations_path.read_text() if config.observations_path.exists() else ""
+        reflect.finalize_reflection(text, config, raw_observations)
     _record_batch_usage(config, record, body)
     _cleanup_remote(client, record)
     record.status = "applied"
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import random
 import sys
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, TypeVar
 
 from .config import Config, _env_flag
 
@@ -14,11 +16,24 @@ if TYPE_CHECKING:
     from .usage.models import LLMUsage
 
 _LOGGER = logging.getLogger(__name__)
+_C = TypeVar("_C")
 
 # Retry settings for transient errors (connection errors, rate limits).
 _MAX_RETRIES = 5
 _RETRY_BASE_DELAY = 2  # seconds; doubles each attempt (2, 4, 8, 16, 32)
 
+# SDK clients shared by _shared_client, keyed on constructor + arguments + the
+# env vars the SDKs read when constructed.
+_CLIENTS: dict[tuple, object] = {}
+_CLIENT_ENV_VARS = ("ANTHROPIC_API_KEY", "ANTHROPIC_BASE_URL", "OPENAI_API_KEY", "OPENAI_BASE_URL")
+
+# Message Batch polling: most small batches end within minutes, so start fast
+# and back off to a steady once-a-minute check.
+_BATCH_POLL_INITIAL_DELAY = 1  # seconds
+_BATCH_POLL_MAX_DELAY = 60
+# The API only expires a batch after 24h; give up (and cancel it) well before that.
+_BATCH_TIMEOUT_SECONDS = 2 * 60 * 60
+
 
 def compress(
     system_prompt: str,
@@ -31,23 +46,7 @@ def compress(
     if config is None:
         config = Config()
 
-    # An explicit per-workflow provider (OM_LLM_OBSERVER_PROVIDER /
-    # OM_LLM_REFLECTOR_PROVIDER) is authoritative for this operation: use it
-    # directly, resolve its model without the global OM_LLM_MODEL (which usually
-    # belongs to a different provider), and skip model-name inference.
-    op_provider = config.operation_provider(operation)
-    if op_provider:
-        effective_provider = config.validate_provider_config(provider=op_provider)
-        model = config.resolve_model(operation=operation, provider=effective_provider, ignore_global_model=True)
-    else:
-        provider = config.validate_provider_config()
-        model = config.resolve_model(operation=operation, provider=provider)
-        # When an operation-specific model override crosses provider boundaries
-        # (e.g. reflector set to claude-sonnet-4-6 while default provider is openai),
-        # infer the correct provider from the model name.
-        effective_provider = _infer_provider(model, provider, auth_file=_config_auth_file(config))
-        if effective_provider != provider:
-            config.validate_provider_config(provider=effective_provider)
+    effective_provider, model = _resolve_provider_and_model(config, operation)
 
     dispatcher = {
         "anthropic": _call_anthropic_direct,
@@ -64,15 +63,28 @@ def compress(
 
     _LOGGER.debug("LLM call: provider=%s model=%s operation=%s", effective_provider, model, operation or "default")
 
-    # Pre-call budget gate (may raise BudgetExceededError on a hard cap). Token
-    # and cost recording happens after the call returns / finally fails.
-    _enforce_budget(config, operation, effective_provider, model, system_prompt, user_content, max_tokens)
-
     # ChatGPT Codex reasoning effort is per-operation; resolve it here (compress
     # knows the operation) and pass it only to that path so other provider
     # signatures (and their test fakes) are unaffected.
     reasoning_effort = config.resolve_reasoning_effort(operation) if effective_provider == "openai-chatgpt" else None
 
+    cache_key = None
+    if config.llm_cache_enabled:
+        from . import llm_cache
+
+        cache_key = llm_cache.cache_key(
+            effective_provider, model, max_tokens, system_prompt, user_content, reasoning_effort
+        )
+        cached = llm_cache.get(config, cache_key)
+        if cached is not None:
+            # A replayed response costs nothing, so it skips the budget gate and usage record.
+            _LOGGER.debug("LLM cache hit: operation=%s", operation or "default")
+            return cached
+
+    # Pre-call budget gate (may raise BudgetExceededError on a hard cap). Token
+    # and cost recording happens after the call returns / finally fails.
+    _enforce_budget(config, operation, effective_provider, model, [(system_prompt, user_content)], max_tokens)
+
     last_error: Exception | None = None
     started = time.monotonic()
     for attempt in range(_MAX_RETRIES + 1):
@@ -95,6 +107,10 @@ def compress(
                 retries=attempt,
                 status="ok",
             )
+            if cache_key is not None:
+                from . import llm_cache
+
+                llm_cache.put(config, cache_key, text)
             return text
         except Exception as e:
             last_error = e
@@ -129,6 +145,122 @@ def compress(
     ) from last_error
 
 
+def _resolve_provider_and_model(config: Config, operation: str | None) -> tuple[str, str]:
+    """Return the validated ``(provider, model)`` pair one *operation* call should use."""
+    # An explicit per-workflow provider (OM_LLM_OBSERVER_PROVIDER /
+    # OM_LLM_REFLECTOR_PROVIDER) is authoritative for this operation: use it
+    # directly, resolve its model without the global OM_LLM_MODEL (which usually
+    # belongs to a different provider), and skip model-name inference.
+    op_provider = config.operation_provider(operation)
+    if op_provider:
+        effective_provider = config.validate_provider_config(provider=op_provider)
+        model = config.resolve_model(operation=operation, provider=effective_provider, ignore_global_model=True)
+        return effective_provider, model
+
+    provider = config.validate_provider_config()
+    model = config.resolve_model(operation=operation, provider=provider)
+    # When an operation-specific model override crosses provider boundaries
+    # (e.g. reflector set to claude-sonnet-4-6 while default provider is openai),
+    # infer the correct provider from the model name.
+    effective_provider = _infer_provider(model, provider, auth_file=_config_auth_file(config))
+    if effective_provider != provider:
+        config.validate_provider_config(provider=effective_provider)
+    return effective_provider, model
+
+
+def compress_batch(
+    requests: Sequence[tuple[str, str]],
+    config: Config | None = None,
+    max_tokens: int = 4096,
+    operation: str | None = None,
+) -> list[str]:
+    """Run several independent ``(system_prompt, user_content)`` calls, results in request order.
+
+    When the operation resolves to the direct ``anthropic`` provider and more
+    than one request misses the LLM cache, those requests go out as a single
+    Message Batch and this call blocks until the batch ends. Entries the batch
+    fails on are retried with :func:`compress`. Every other provider (and a
+    single request) falls back to one :func:`compress` call per request, so
+    callers can use this unconditionally.
+    """
+    if config is None:
+        config = Config()
+    effective_provider, model = _resolve_provider_and_model(config, operation) if len(requests) > 1 else ("", "")
+    if effective_provider != "anthropic":
+        return [compress(system, user, config, max_tokens=max_tokens, operation=operation) for system, user in requests]
+
+    texts: list[str | None] = [None] * len(requests)
+    cache_keys: list[str | None] = [None] * len(requests)
+    if config.llm_cache_enabled:
+        from . import llm_cache
+
+        for index, (system_prompt, user_content) in enumerate(requests):
+            cache_keys[index] = llm_cache.cache_key(effective_provider, model, max_tokens, system_prompt, user_content)
+            texts[index] = llm_cache.get(config, cache_keys[index])
+    pending = [index for index, text in enumerate(texts) if text is None]
+
+    if len(pending) > 1:
+        _LOGGER.debug(
+            "LLM batch: provider=%s model=%s operation=%s size=%d", effective_provider, model, operation, len(pending)
+        )
+        batch_requests = [requests[index] for index in pending]
+        # One check for the whole batch: per-request checks would each pass
+        # against the same ledger and let the batch overshoot a hard cap.
+        _enforce_budget(config, operation, effective_provider, model, batch_requests, max_tokens)
+
+        started = time.monotonic()
+        try:
+            results = _call_anthropic_batch(batch_requests, model, max_tokens)
+        except Exception as e:
+            for system_prompt, user_content in batch_requests:
+                _record_usage(
+                    config,
+                    provider=effective_provider,
+                    model=model,
+                    operation=operation,
+                    usage=None,
+                    response_text="",
+                    system_prompt=system_prompt,
+                    user_content=user_content,
+                    started=started,
+                    retries=0,
+                    status="error",
+                )
+            raise RuntimeError(
+                f"LLM batch request failed for provider '{effective_provider}' using model '{model}': {e}"
+            ) from e
+
+        for index, result in zip(pending, results, strict=True):
+            if result is None:
+                continue  # Retried below through compress(), which records its own usage
+            text, usage = result
+            system_prompt, user_content = requests[index]
+            _record_usage(
+                config,
+                provider=effective_provider,
+                model=model,
+                operation=operation,
+                usage=usage,
+                response_text=text,
+                system_prompt=system_prompt,
+                user_content=user_content,
+                started=started,
+                retries=0,
+                status="ok",
+            )
+            if cache_keys[index] is not None:
+                from . import llm_cache
+
+                llm_cache.put(config, cache_keys[index], text)
+            texts[index] = text
+
+    for index in pending:
+        if texts[index] is None:
+            system_prompt, user_content = requests[index]
+            texts[index] = compress(system_prompt, user_content, config, max_tokens=max_tokens, operation=operation)
+    return texts  # type: ignore[return-value]
+
+
 def _estimate_tokens(text: str) -> int:
     """Cheap prompt/completion token estimate (~4 chars/token) with no tokenizer dep."""
     return max(len(text or "") // 4, 0)
@@ -150,14 +282,13 @@ def _enforce_budget(
     operation: str | None,
     provider: str,
     model: str,
-    system_prompt: str,
-    user_content: str,
+    requests: Sequence[tuple[str, str]],
     max_tokens: int,
 ) -> None:
-    """Check budgets before dispatch. Raises BudgetExceededError on a hard cap.
+    """Check budgets before dispatching *requests* together. Raises BudgetExceededError on a hard cap.
 
     Estimation is intentionally dependency-free: prompt tokens ≈ chars//4 plus
-    the requested ``max_tokens`` for the completion. A one-shot ``OM_BUDGET_BYPASS=1``
+    the requested ``max_tokens`` for each completion. A one-shot ``OM_BUDGET_BYPASS=1``
     downgrades a hard block to a warning. All non-block failures are swallowed so
     budgeting can never break an LLM call.
     """
@@ -170,12 +301,13 @@ def _enforce_budget(
     except Exception:  # pragma: no cover - usage subsystem optional/defensive
         return
 
-    prompt_tokens = _estimate_tokens(system_prompt) + _estimate_tokens(user_content)
-    est_tokens = prompt_tokens + max(max_tokens, 0)
+    prompt_tokens = sum(_estimate_tokens(system) + _estimate_tokens(user) for system, user in requests)
+    completion_tokens = max(max_tokens, 0) * len(requests)
+    est_tokens = prompt_tokens + completion_tokens
     try:
         pricing = load_pricing(config.pricing_overrides_path)
         est = pricing.estimate(
-            provider=provider, model=model, prompt_tokens=prompt_tokens, completion_tokens=max_tokens
+            provider=provider, model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
         )
         decision = check_budget(config, operation=operation, est_usd=est.total_usd, est_tokens=est_tokens)
     except Exception:  # pragma: no cover - never let pricing/estimation break the call
@@ -379,6 +511,21 @@ def _is_retryable(exc: Exception) -> bool:
     return False
 
 
+def _shared_client(factory: Callable[..., _C], **kwargs: object) -> _C:
+    """Return a process-wide SDK client for *factory* and *kwargs*.
+
+    Constructing a client builds a fresh ``httpx`` pool, so per-call clients pay
+    a TCP + TLS handshake on every request. Reusing one keeps connections alive
+    across observer/reflector calls. The credential env vars the SDKs read at
+    construction are part of the key, so rotating a key yields a new client.
+    """
+    key = (factory, tuple(sorted(kwargs.items())), tuple(os.environ.get(name) for name in _CLIENT_ENV_VARS))
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = _CLIENTS[key] = factory(**kwargs)
+    return client
+
+
 def _call_anthropic_direct(
     system_prompt: str,
     user_content: str,
@@ -388,7 +535,7 @@ def _call_anthropic_direct(
 ) -> tuple[str, "LLMUsage | None"]:
     import anthropic
 
-    client = anthropic.Anthropic()
+    client = _shared_client(anthropic.Anthropic)
     message = client.messages.create(
         model=model,
         max_tokens=max_tokens,
@@ -398,6 +545,61 @@ def _call_anthropic_direct(
     return _extract_anthropic_text(message), _anthropic_usage(message)
 
 
+def _call_anthropic_batch(
+    requests: Sequence[tuple[str, str]],
+    model: str,
+    max_tokens: int,
+) -> list[tuple[str, "LLMUsage | None"] | None]:
+    """Submit *requests* as one Anthropic Message Batch, wait for it, and return ordered results.
+
+    Entries that did not succeed (errored, expired, canceled, or missing) come
+    back as None so the caller can retry just those. A batch that has not
+    ended within ``_BATCH_TIMEOUT_SECONDS`` is canceled and raises TimeoutError.
+    """
+    import anthropic
+
+    client = _shared_client(anthropic.Anthropic)
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": f"om-{index}",
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "system": _anthropic_system_blocks(system_prompt),
+                    "messages": [{"role": "user", "content": user_content}],
+                },
+            }
+            for index, (system_prompt, user_content) in enumerate(requests)
+        ]
+    )
+
+    deadline = time.monotonic() + _BATCH_TIMEOUT_SECONDS
+    delay = _BATCH_POLL_INITIAL_DELAY
+    while batch.processing_status != "ended":
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            try:
+                client.messages.batches.cancel(batch.id)
+            except Exception as exc:
+                _LOGGER.warning("Could not cancel Message Batch %s: %s", batch.id, exc)
+            raise TimeoutError(f"batch {batch.id} did not end within {_BATCH_TIMEOUT_SECONDS}s; canceled it")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, _BATCH_POLL_MAX_DELAY)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    results: dict[str, tuple[str, LLMUsage | None]] = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            error = getattr(entry.result, "error", None)
+            _LOGGER.warning("Batch request %s %s: %s", entry.custom_id, entry.result.type, error or "no detail")
+            continue
+        message = entry.result.message
+        results[entry.custom_id] = (_extract_anthropic_text(message), _anthropic_usage(message))
+
+    return [results.get(f"om-{index}") for index in range(len(requests))]
+
+
 def _call_anthropic_vertex(
     system_prompt: str,
     user_content: str,
@@ -407,7 +609,7 @@ def _call_anthropic_vertex(
 ) -> tuple[str, "LLMUsage | None"]:
     import anthropic
 
-    client = anthropic.AnthropicVertex(project_id=config.vertex_project_id, region=config.vertex_region)
+    client = _shared_client(anthropic.AnthropicVertex, project_id=config.vertex_project_id, region=config.vertex_region)
     message = client.messages.create(
         model=model,
         max_tokens=max_tokens,
@@ -426,7 +628,7 @@ def _call_anthropic_bedrock(
 ) -> tuple[str, "LLMUsage | None"]:
     import anthropic
 
-    client = anthropic.AnthropicBedrock(aws_region=config.bedrock_region)
+    client = _shared_client(anthropic.AnthropicBedrock, aws_region=config.bedrock_region)
     message = client.messages.create(
         model=model,
         max_tokens=max_tokens,
@@ -445,7 +647,7 @@ def _call_openai_direct(
 ) -> tuple[str, "LLMUsage | None"]:
     import openai
 
-    client = openai.OpenAI(timeout=300.0)
+    client = _shared_client(openai.OpenAI, timeout=300.0)
     response = client.chat.completions.create(
         **build_openai_chat_request(model, system_prompt, user_content, max_tokens)
     )
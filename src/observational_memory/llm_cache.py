@@ -0,0 +1,107 @@
+"""Opt-in on-disk cache of LLM responses keyed on the exact request.
+
+A re-run over unchanged inputs (``om reflect --dry-run`` followed by a real
+run, or a retry after a crash between the LLM call and the write) returns the
+stored response instead of paying for the same call again. Entries live under
+``<memory_dir>/.llm-cache/`` and expire after ``llm_cache_ttl_days``. Most keys
+are never asked for again, so writes also sweep out expired entries (at most
+once a day, tracked by a marker file) rather than leaving their prompt text on
+disk indefinitely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+
+from .config import Config
+
+_PRUNE_MARKER = ".last-prune"
+_PRUNE_INTERVAL_SECONDS = 86400
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    max_tokens: int,
+    system_prompt: str,
+    user_content: str,
+    reasoning_effort: str | None = None,
+) -> str:
+    """Return the SHA-256 hex key identifying one LLM request."""
+    digest = hashlib.sha256()
+    for part in (provider, model, str(max_tokens), reasoning_effort or "", system_prompt, user_content):
+        encoded = part.encode()
+        # Length-prefix each field so adjacent fields can't shift into each other.
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def get(config: Config, key: str) -> str | None:
+    """Return the cached response for *key*, or None on a miss or expired entry."""
+    path = config.llm_cache_dir / f"{key}.json"
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    if time.time() - stat.st_mtime > config.llm_cache_ttl_days * 86400:
+        path.unlink(missing_ok=True)
+        return None
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    text = data.get("text") if isinstance(data, dict) else None
+    return text if isinstance(text, str) else None
+
+
+def put(config: Config, key: str, text: str) -> None:
+    """Store *text* as the response for *key*; failures are ignored."""
+    from .sync.atomic import atomic_write_text
+
+    try:
+        atomic_write_text(config.llm_cache_dir / f"{key}.json", json.dumps({"text": text}), mode=0o600)
+    except OSError:
+        return  # A cache write must never fail the call that produced the response
+    _prune_if_due(config)
+
+
+def _prune_if_due(config: Config) -> None:
+    """Run :func:`prune` unless the marker says it ran within the last day."""
+    marker = config.llm_cache_dir / _PRUNE_MARKER
+    try:
+        if time.time() - marker.stat().st_mtime < _PRUNE_INTERVAL_SECONDS:
+            return
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    prune(config)
+    try:
+        marker.touch()
+    except OSError:
+        pass
+
+
+def prune(config: Config) -> int:
+    """Delete expired cache entries and return how many were removed."""
+    cutoff = time.time() - config.llm_cache_ttl_days * 86400
+    removed = 0
+    try:
+        entries = os.scandir(config.llm_cache_dir)
+    except OSError:
+        return 0
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError:
+                continue  # Raced with another writer or unreadable; try again next sweep
+    return removed
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .config import Config
-from .llm import compress
+from .llm import compress, compress_batch
 from .transcripts import Message
 
 OBSERVER_PROMPT_PATH = Path(__file__).parent / "prompts" / "observer.md"
 
+# Cursor entry mapping each Codex session to {"messages": n, "offset": byte} so an
+# incremental observe can seek past lines it has already parsed.
+_CODEX_OFFSETS_CURSOR_KEY = "codex-offsets"
+
+# Cursor entry mapping each Claude/Cowork transcript to {"uuid": id, "offset": byte}
+# just past that message, so an incremental observe skips the scan for the UUID.
+_CLAUDE_OFFSETS_CURSOR_KEY = "claude-offsets"
+
+# Cursor entries that hold bookkeeping rather than one transcript's position.
+CURSOR_META_KEYS = frozenset({"claude-memory", _CODEX_OFFSETS_CURSOR_KEY, _CLAUDE_OFFSETS_CURSOR_KEY})
+
+# None outside _deferred_reindex(); inside it, whether a write asked for a reindex.
+_REINDEX_PENDING: ContextVar[bool | None] = ContextVar("om_observe_reindex_pending", default=None)
+
 
 def _recent_observations_window(observations: str, config: Config) -> str:
     """Return only the most recent tail of observations for dedup context.
@@ -68,7 +86,9 @@ def run_observer(
     # never lost. So we only bound the dedup context in the append-only path.
     cluster_mode = _cluster_enabled(config)
     existing_observations = ""
-    if config.observations_path.exists():
+    # Stat before reading so a write that races the read forces a re-read later.
+    existing_signature = _file_signature(config.observations_path)
+    if existing_signature is not None:
         existing_observations = config.observations_path.read_text()
         if cluster_mode:
             existing_observations = _recent_observations_window(existing_observations, config)
@@ -88,7 +108,7 @@ def run_observer(
         _write_observation_record(result, messages, config, transcript_path=transcript_path, source=source)
         return result
 
-    _write_observations(result, config)
+    _write_observations(result, config, existing=existing_observations, existing_signature=existing_signature)
     return result
 
 
@@ -98,16 +118,10 @@ def observe_claude_transcript(
     dry_run: bool = False,
 ) -> str | None:
     """Run observer on a specific Claude Code transcript."""
-    from .transcripts.claude import last_message_uuid, parse_transcript
-
     if config is None:
         config = Config()
 
-    cursor = config.load_cursor()
-    cursor_key = str(transcript_path)
-    after_uuid = cursor.get(cursor_key)
-
-    messages = parse_transcript(transcript_path, after_uuid=after_uuid)
+    messages = _claude_messages_since_cursor(transcript_path, config.load_cursor())
 
     if not messages:
         return None
@@ -115,15 +129,59 @@ def observe_claude_transcript(
     result = run_observer(messages, config, dry_run, transcript_path=transcript_path, source="claude")
 
     if result and not dry_run:
-        # Update cursor to last message UUID without loading large transcripts.
-        last_uuid = last_message_uuid(transcript_path)
-        if last_uuid:
-            cursor[cursor_key] = last_uuid
-            config.save_cursor(cursor)
+        _advance_claude_cursor(transcript_path, config)
 
     return result
 
 
+def _claude_messages_since_cursor(transcript_path: Path, cursor: dict, source: str = "claude") -> list[Message]:
+    """Return the Claude-format messages after the transcript's cursor UUID."""
+    from .transcripts.claude import parse_transcript
+
+    cursor_key = str(transcript_path)
+    after_uuid = cursor.get(cursor_key)
+
+    # The byte offset is only trusted while it was saved with the same UUID, so
+    # a cursor advanced without it (e.g. by an older version) scans for the UUID.
+    byte_offset = None
+    offsets = cursor.get(_CLAUDE_OFFSETS_CURSOR_KEY)
+    saved = offsets.get(cursor_key) if isinstance(offsets, dict) else None
+    if after_uuid and isinstance(saved, dict) and saved.get("uuid") == after_uuid:
+        if isinstance(saved.get("offset"), int):
+            byte_offset = saved["offset"]
+
+    return parse_transcript(transcript_path, after_uuid=after_uuid, source=source, byte_offset=byte_offset)
+
+
+def _save_resume_offset(
+    config: Config, meta_key: str, transcript_path: Path, position: str | int, entry: dict | None
+) -> None:
+    """Save the transcript's cursor position and its resume entry under ``meta_key``.
+
+    A ``None`` entry drops any saved resume offset for the transcript.
+    """
+    # Re-read the offsets map so transcripts observed meanwhile keep their entries.
+    offsets = dict(config.load_cursor().get(meta_key) or {})
+    if entry is None:
+        offsets.pop(str(transcript_path), None)
+    else:
+        offsets[str(transcript_path)] = entry
+    config.merge_cursor({str(transcript_path): position, meta_key: offsets})
+
+
+def _advance_claude_cursor(transcript_path: Path, config: Config) -> None:
+    """Move the cursor to the transcript's last message UUID, with its byte offset."""
+    from .transcripts.claude import last_message_position
+
+    # Read from the end so large transcripts are not loaded again.
+    position = last_message_position(transcript_path)
+    if position is None:
+        return
+    last_uuid, end_offset = position
+    entry = None if end_offset is None else {"uuid": last_uuid, "offset": end_offset}
+    _save_resume_offset(config, _CLAUDE_OFFSETS_CURSOR_KEY, transcript_path, last_uuid, entry)
+
+
 def observe_all_claude(config: Config | None = None, dry_run: bool = False) -> list[str]:
     """Scan all recent Claude Code transcripts and run observer on each."""
     from .transcripts.claude import find_recent_transcripts
@@ -132,10 +190,11 @@ def observe_all_claude(config: Config | None = None, dry_run: bool = False) -> l
         config = Config()
 
     results = []
-    for path in find_recent_transcripts(config.claude_projects_dir):
-        result = observe_claude_transcript(path, config, dry_run)
-        if result:
-            results.append(result)
+    with _deferred_reindex(config):
+        for path in find_recent_transcripts(config.claude_projects_dir):
+            result = observe_claude_transcript(path, config, dry_run)
+            if result:
+                results.append(result)
     return results
 
 
@@ -145,16 +204,10 @@ def observe_cowork_transcript(
     dry_run: bool = False,
 ) -> str | None:
     """Run observer on a specific Cowork audit.jsonl transcript."""
-    from .transcripts.claude import parse_transcript
-
     if config is None:
         config = Config()
 
-    cursor = config.load_cursor()
-    cursor_key = str(transcript_path)
-    after_uuid = cursor.get(cursor_key)
-
-    messages = parse_transcript(transcript_path, after_uuid=after_uuid, source="cowork")
+    messages = _claude_messages_since_cursor(transcript_path, config.load_cursor(), source="cowork")
 
     if not messages:
         return None
@@ -162,22 +215,7 @@ def observe_cowork_transcript(
     result = run_observer(messages, config, dry_run, transcript_path=transcript_path, source="cowork")
 
     if result and not dry_run:
-        import json
-
-        last_uuid = None
-        for line in reversed(transcript_path.read_text().splitlines()):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                if entry.get("type") in ("user", "assistant") and entry.get("uuid"):
-                    last_uuid = entry["uuid"]
-                    break
-            except json.JSONDecodeError:
-                continue
-        if last_uuid:
-            cursor[cursor_key] = last_uuid
-            config.save_cursor(cursor)
+        _advance_claude_cursor(transcript_path, config)
 
     return result
 
@@ -190,10 +228,11 @@ def observe_all_cowork(config: Config | None = None, dry_run: bool = False) -> l
         config = Config()
 
     results = []
-    for path in find_recent_transcripts(config.cowork_sessions_dir):
-        result = observe_cowork_transcript(path, config, dry_run)
-        if result:
-            results.append(result)
+    with _deferred_reindex(config):
+        for path in find_recent_transcripts(config.cowork_sessions_dir):
+            result = observe_cowork_transcript(path, config, dry_run)
+            if result:
+                results.append(result)
     return results
 
 
@@ -273,8 +312,7 @@ def observe_hermes_transcript(
 
     result = run_observer(messages, config, dry_run, transcript_path=transcript_path, source="hermes")
     if result and not dry_run:
-        cursor[cursor_key] = after_index + len(messages)
-        config.save_cursor(cursor)
+        config.merge_cursor({cursor_key: after_index + len(messages)})
 
     return result
 
@@ -306,10 +344,11 @@ def observe_all_hermes(
         sessions_dir = config.hermes_sessions_dir
 
     results = []
-    for path in find_recent_sessions(sessions_dir, max_age_hours=max_age_hours):
-        result = observe_hermes_transcript(path, config, dry_run)
-        if result:
-            results.append(result)
+    with _deferred_reindex(config):
+        for path in find_recent_sessions(sessions_dir, max_age_hours=max_age_hours):
+            result = observe_hermes_transcript(path, config, dry_run)
+            if result:
+                results.append(result)
     return results
 
 
@@ -323,14 +362,14 @@ def observe_codex_transcript(
         config = Config()
 
     cursor = config.load_cursor()
-    messages, total_messages = _codex_messages_since_cursor(transcript_path, cursor)
+    messages, total_messages, end_offset = _codex_messages_since_cursor(transcript_path, cursor)
     if not messages:
         return None
 
     result = run_observer(messages, config, dry_run, transcript_path=transcript_path, source="codex")
     if result and not dry_run:
-        cursor[str(transcript_path)] = total_messages
-        config.save_cursor(cursor)
+        entry = None if end_offset is None else {"messages": total_messages, "offset": end_offset}
+        _save_resume_offset(config, _CODEX_OFFSETS_CURSOR_KEY, transcript_path, total_messages, entry)
 
     return result
 
@@ -344,26 +383,57 @@ def observe_all_codex(config: Config | None = None, dry_run: bool = False) -> li
 
     results = []
 
-    for path in find_recent_sessions(config.codex_home):
-        result = observe_codex_transcript(path, config, dry_run)
-        if result:
-            results.append(result)
+    with _deferred_reindex(config):
+        for path in find_recent_sessions(config.codex_home):
+            result = observe_codex_transcript(path, config, dry_run)
+            if result:
+                results.append(result)
 
     return results
 
 
-def _codex_messages_since_cursor(transcript_path: Path, cursor: dict) -> tuple[list[Message], int]:
-    """Return new Codex messages for a transcript plus the total parsed count."""
-    from .transcripts.codex import line_offset_to_message_count, parse_transcript_with_count
+def count_codex_messages(transcript_path: Path, config: Config) -> int:
+    """Return the number of parsed messages in a Codex transcript.
+
+    Resumes from the observer's saved byte offset when one is on record, so a
+    checkpoint hook firing after every turn only parses what was appended.
+    """
+    from .transcripts.codex import count_messages, parse_transcript_resumable
+
+    offsets = config.load_cursor().get(_CODEX_OFFSETS_CURSOR_KEY)
+    saved = offsets.get(str(transcript_path)) if isinstance(offsets, dict) else None
+    if isinstance(saved, dict) and isinstance(saved.get("messages"), int) and isinstance(saved.get("offset"), int):
+        # The offset and count were saved together, so they agree with each
+        # other even if the per-path cursor has since moved.
+        _, total_messages, _ = parse_transcript_resumable(
+            transcript_path, after_index=saved["messages"], byte_offset=saved["offset"]
+        )
+        return total_messages
+    return count_messages(transcript_path)
+
+
+def _codex_messages_since_cursor(transcript_path: Path, cursor: dict) -> tuple[list[Message], int, int | None]:
+    """Return new Codex messages for a transcript, the total parsed count, and the resume offset."""
+    from .transcripts.codex import line_offset_to_message_count, parse_transcript_resumable
 
     cursor_key = str(transcript_path)
     after_index = cursor.get(cursor_key)
     if not isinstance(after_index, int):
         after_index = 0
 
-    messages, total_messages = parse_transcript_with_count(transcript_path, after_index=after_index)
+    # The byte offset is only trusted while it was saved with the same message
+    # count, so a cursor advanced without it (e.g. by an older version) re-parses.
+    byte_offset = None
+    offsets = cursor.get(_CODEX_OFFSETS_CURSOR_KEY)
+    saved = offsets.get(cursor_key) if isinstance(offsets, dict) else None
+    if isinstance(saved, dict) and saved.get("messages") == after_index and isinstance(saved.get("offset"), int):
+        byte_offset = saved["offset"]
+
+    messages, total_messages, end_offset = parse_transcript_resumable(
+        transcript_path, after_index=after_index, byte_offset=byte_offset
+    )
     if not messages and total_messages <= 0:
-        return [], 0
+        return [], 0, None
 
     if after_index and after_index > total_messages:
         # Backward compatibility: older cursors tracked raw JSONL line offsets
@@ -376,9 +446,9 @@ def _codex_messages_since_cursor(transcript_path: Path, cursor: dict) -> tuple[l
             after_index = migrated_index
         else:
             after_index = 0
-        messages, total_messages = parse_transcript_with_count(transcript_path, after_index=after_index)
+        messages, total_messages, end_offset = parse_transcript_resumable(transcript_path, after_index=after_index)
 
-    return messages, total_messages
+    return messages, total_messages, end_offset
 
 
 def _chunk_messages(messages: list[Message], chunk_size: int = 200) -> list[list[Message]]:
@@ -419,13 +489,16 @@ def run_observer_backfill(
     if len(messages) < config.min_messages:
         return None
 
-    system_prompt = _load_observer_prompt()
-    transcript_text = _format_messages(messages)
+    result = compress(_load_observer_prompt(), _backfill_user_content(messages), config, operation="observer")
+    return _store_backfill_result(result, messages, config, dry_run)
 
-    user_content = f"## New transcript to process\n\n{transcript_text}"
 
-    result = compress(system_prompt, user_content, config, operation="observer")
+def _backfill_user_content(messages: list[Message]) -> str:
+    return f"## New transcript to process\n\n{_format_messages(messages)}"
+
 
+def _store_backfill_result(result: str, messages: list[Message], config: Config, dry_run: bool) -> str:
+    """Persist one backfill observer result (append, or a cluster record) unless *dry_run*."""
     if dry_run:
         return result
 
@@ -437,6 +510,25 @@ def run_observer_backfill(
     return result
 
 
+def _run_observer_backfill_batch(chunks: list[list[Message]], config: Config, dry_run: bool) -> list[str]:
+    """Observe independent backfill *chunks* with one :func:`compress_batch` call.
+
+    Backfill prompts never include existing observations, so the chunks of one
+    transcript don't depend on each other and can be submitted together.
+    Results are stored in chunk order, matching the sequential path.
+    """
+    eligible = [chunk for chunk in chunks if len(chunk) >= config.min_messages]
+    if not eligible:
+        return []
+    system_prompt = _load_observer_prompt()
+    results = compress_batch(
+        [(system_prompt, _backfill_user_content(chunk)) for chunk in eligible], config, operation="observer"
+    )
+    return [
+        _store_backfill_result(result, chunk, config, dry_run) for chunk, result in zip(eligible, results, strict=True)
+    ]
+
+
 def observe_claude_transcript_backfill(
     transcript_path: Path,
     config: Config | None = None,
@@ -463,16 +555,10 @@ def observe_claude_transcript_backfill(
         Total characters of observation text produced, or ``None`` if the
         transcript had no new messages.
     """
-    from .transcripts.claude import parse_transcript
-
     if config is None:
         config = Config()
 
-    cursor = config.load_cursor()
-    cursor_key = str(transcript_path)
-    after_uuid = cursor.get(cursor_key)
-
-    messages = parse_transcript(transcript_path, after_uuid=after_uuid)
+    messages = _claude_messages_since_cursor(transcript_path, config.load_cursor())
 
     if not messages:
         return None
@@ -491,16 +577,10 @@ def observe_cowork_transcript_backfill(
     Same logic as :func:`observe_claude_transcript_backfill` but parses
     with ``source="cowork"``.
     """
-    from .transcripts.claude import parse_transcript
-
     if config is None:
         config = Config()
 
-    cursor = config.load_cursor()
-    cursor_key = str(transcript_path)
-    after_uuid = cursor.get(cursor_key)
-
-    messages = parse_transcript(transcript_path, after_uuid=after_uuid, source="cowork")
+    messages = _claude_messages_since_cursor(transcript_path, config.load_cursor(), source="cowork")
 
     if not messages:
         return None
@@ -517,33 +597,14 @@ def _backfill_from_messages(
 ) -> int:
     """Shared backfill logic: chunk, observe, update cursor."""
     chunks = _chunk_messages(messages, chunk_size)
-    total_chars = 0
-
-    for chunk in chunks:
-        result = run_observer_backfill(chunk, config, dry_run)
-        if result:
-            total_chars += len(result)
+    if config.backfill_batch and len(chunks) > 1:
+        results = _run_observer_backfill_batch(chunks, config, dry_run)
+    else:
+        results = [run_observer_backfill(chunk, config, dry_run) for chunk in chunks]
+    total_chars = sum(len(result) for result in results if result)
 
     if not dry_run:
-        # Update cursor to the last message UUID in the transcript
-        import json
-
-        cursor = config.load_cursor()
-        cursor_key = str(transcript_path)
-        last_uuid = None
-        for line in reversed(transcript_path.read_text().splitlines()):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                if entry.get("type") in ("user", "assistant") and entry.get("uuid"):
-                    last_uuid = entry["uuid"]
-                    break
-            except json.JSONDecodeError:
-                continue
-        if last_uuid:
-            cursor[cursor_key] = last_uuid
-            config.save_cursor(cursor)
+        _advance_claude_cursor(transcript_path, config)
         # Reindex once after all chunks are written
         _reindex_if_enabled(config)
 
@@ -553,12 +614,19 @@ def _backfill_from_messages(
 def _append_observations(new_observations: str, config: Config, *, skip_reindex: bool = False) -> None:
     """Append new observations to the observations file (never overwrite)."""
     from .startup_memory import refresh_startup_memory
-    from .sync.atomic import atomic_write_text
+    from .sync.atomic import atomic_write_bytes, atomic_write_text
 
     config.ensure_memory_dir()
     if config.observations_path.exists():
-        existing = config.observations_path.read_text()
-        atomic_write_text(config.observations_path, existing.rstrip() + "\n\n" + new_observations.rstrip() + "\n")
+        # Always rewrite atomically: an in-place append cut short by a crash or
+        # signal would leave a torn section, and since the cursor has not moved
+        # the next run would append it again. Backfill appends chunk after chunk
+        # to a growing file; keep the existing contents as bytes so only the new
+        # section is encoded.
+        existing = config.observations_path.read_bytes()
+        atomic_write_bytes(
+            config.observations_path, existing.rstrip() + b"\n\n" + new_observations.rstrip().encode() + b"\n"
+        )
     else:
         atomic_write_text(config.observations_path, new_observations.rstrip() + "\n")
     refresh_startup_memory(config)
@@ -566,8 +634,9 @@ def _append_observations(new_observations: str, config: Config, *, skip_reindex:
         _reindex_if_enabled(config)
 
 
+@functools.lru_cache(maxsize=1)
 def _load_observer_prompt() -> str:
-    """Load the observer system prompt."""
+    """Load the observer system prompt; the packaged file is read once per process."""
     if OBSERVER_PROMPT_PATH.exists():
         return OBSERVER_PROMPT_PATH.read_text()
     # Fallback minimal prompt
@@ -593,6 +662,9 @@ def _reindex_if_enabled(config: Config) -> None:
     """Silently rebuild the search index after memory writes."""
     if config.search_backend == "none":
         return
+    if _REINDEX_PENDING.get() is not None:
+        _REINDEX_PENDING.set(True)
+        return
     try:
         from .search import reindex
 
@@ -601,6 +673,23 @@ def _reindex_if_enabled(config: Config) -> None:
         pass  # Never block observe/reflect on search failures
 
 
+@contextmanager
+def _deferred_reindex(config: Config) -> Iterator[None]:
+    """Collapse the reindexes requested inside the block into one at exit.
+
+    ``observe_all_*`` scans write observations once per transcript, and each
+    write would otherwise rebuild the whole index to reach the same end state.
+    """
+    token = _REINDEX_PENDING.set(False)
+    try:
+        yield
+    finally:
+        pending = _REINDEX_PENDING.get()
+        _REINDEX_PENDING.reset(token)
+        if pending:
+            _reindex_if_enabled(config)
+
+
 def _cluster_enabled(config: Config) -> bool:
     try:
         from .sync import cluster_feature_enabled
@@ -663,8 +752,29 @@ def _latest_message_timestamp(messages: list[Message]) -> str | None:
     return max(timestamps) if timestamps else None
 
 
-def _write_observations(new_observations: str, config: Config) -> None:
-    """Write or append observations to the file."""
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _write_observations(
+    new_observations: str,
+    config: Config,
+    *,
+    existing: str | None = None,
+    existing_signature: tuple[int, int] | None = None,
+) -> None:
+    """Write or append observations to the file.
+
+    ``existing``/``existing_signature`` are the contents the caller already read
+    and the file signature taken before that read. They are reused only while
+    the file still matches, so an observe run for another transcript that
+    appended in the meantime is re-read rather than overwritten.
+    """
     from .startup_memory import refresh_startup_memory
     from .sync.atomic import atomic_write_text
 
@@ -672,8 +782,10 @@ def _write_observations(new_observations: str, config: Config) -> None:
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    if config.observations_path.exists():
-        existing = config.observations_path.read_text()
+    signature = _file_signature(config.observations_path)
+    if signature is not None:
+        if existing is None or signature != existing_signature:
+            existing = config.observations_path.read_text()
         # The LLM returns the full updated observations — just write it
         if existing.strip() and f"## {today}" in new_observations:
             atomic_write_text(config.observations_path, new_observations.rstrip() + "\n")
@@ -716,8 +828,7 @@ def observe_opencode_transcript(
 
     result = run_observer(messages, config, dry_run, transcript_path=transcript_path, source="opencode")
     if result and not dry_run:
-        cursor[cursor_key] = len(all_messages)
-        config.save_cursor(cursor)
+        config.merge_cursor({cursor_key: len(all_messages)})
     return result
 
 
@@ -729,10 +840,11 @@ def observe_all_opencode(config: Config | None = None, dry_run: bool = False) ->
         config = Config()
 
     results = []
-    for path in find_recent_sessions(config.opencode_events_dir):
-        result = observe_opencode_transcript(path, config, dry_run)
-        if result:
-            results.append(result)
+    with _deferred_reindex(config):
+        for path in find_recent_sessions(config.opencode_events_dir):
+            result = observe_opencode_transcript(path, config, dry_run)
+            if result:
+                results.append(result)
     return results
 
 
@@ -783,8 +895,7 @@ def observe_grok_transcript(
 
     if not dry_run and (combined or len(all_messages) >= config.min_messages):
         # Use count-based cursor for Grok to avoid reprocessing same-second chunks
-        cursor[cursor_key] = len(all_parsed_messages)
-        config.save_cursor(cursor)
+        config.merge_cursor({cursor_key: len(all_parsed_messages)})
 
     return combined
 
@@ -798,10 +909,11 @@ def observe_all_grok(config: Config | None = None, dry_run: bool = False) -> lis
 
     results = []
 
-    for path in find_recent_grok_sessions(config.grok_sessions_dir):
-        result = observe_grok_transcript(path, config, dry_run)
-        if result:
-            results.append(result)
+    with _deferred_reindex(config):
+        for path in find_recent_grok_sessions(config.grok_sessions_dir):
+            result = observe_grok_transcript(path, config, dry_run)
+            if result:
+                results.append(result)
 
     return results
 
@@ -833,8 +945,7 @@ def observe_kimi_transcript(
 
     result = run_observer(messages, config, dry_run, transcript_path=transcript_path, source="kimi")
     if result and not dry_run:
-        cursor[cursor_key] = processed_index
-        config.save_cursor(cursor)
+        config.merge_cursor({cursor_key: processed_index})
 
     return result
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -30,6 +32,14 @@ _CHARS_PER_TOKEN = 3.5
 # the "## Observations (chunk i/N)" header, and the intermediate-chunk NOTE),
 # plus a safety margin.
 _FOLD_WRAPPER_CHARS = 400
+# Appended to the user turn of every fold but the last. It rides in the user
+# turn, not the system prompt, so the system prompt stays byte-identical across
+# folds and keeps hitting the provider's prompt cache.
+_INTERMEDIATE_CHUNK_NOTE = (
+    "\n\n**NOTE:** This is chunk {i} of {total}. More observations follow. "
+    "Focus on integrating these observations into the reflections. "
+    "Produce the complete updated reflections document."
+)
 # Floor on the observations chunk so a fold always makes forward progress.
 _MIN_CHUNK_CHARS = 4000
 # Standalone fallback chunk budget for callers without a Config (mirrors the
@@ -47,9 +57,12 @@ _MAX_COMPETING_SNAPSHOT_CHARS = 4000
 
 # Regex for the "Last reflected" timestamp line in reflections.md
 _LAST_REFLECTED_RE = re.compile(r"^\*Last reflected:\s*(\d{4}-\d{2}-\d{2})\b.*\*$", re.MULTILINE)
-# Regex for the "Last updated" timestamp line
-_LAST_UPDATED_RE = re.compile(r"^\*Last updated:.*\*$", re.MULTILINE)
+# Either timestamp line, so _stamp_timestamps finds both in one scan
+_TIMESTAMP_LINE_RE = re.compile(
+    r"^\*Last (?:(?P<updated>updated:.*)|(?P<reflected>reflected:\s*\d{4}-\d{2}-\d{2}\b.*))\*$", re.MULTILINE
+)
 _LAST_UPDATED_VALUE_RE = re.compile(r"^\*Last updated:\s*(.+?)\s*\*$", re.MULTILINE)
+_TITLE_LINE_RE = re.compile(r"(#[^\n]*\n)")
 
 
 def run_reflector(config: Config | None = None, dry_run: bool = False) -> str | None:
@@ -123,7 +136,14 @@ def run_reflector(config: Config | None = None, dry_run: bool = False) -> str |
             parse_reflection_document(inputs.reflections).sections
         )
 
-    return finalize_reflection(result, config, inputs.raw_observations, dry_run=dry_run, reassembled=reassembled)
+    return finalize_reflection(
+        result,
+        config,
+        inputs.raw_observations,
+        dry_run=dry_run,
+        reassembled=reassembled,
+        raw_signature=inputs.raw_signature,
+    )
 
 
 @dataclass
@@ -137,6 +157,7 @@ class ReflectionInputs:
     auto_memory: str
     amem_changed: bool
     single_pass: bool
+    raw_signature: tuple[int, int] | None = None  # observations.md (mtime_ns, size) before the read
 
 
 class ChunkingRequired(RuntimeError):
@@ -149,8 +170,11 @@ def _gather_reflection_inputs(config: Config) -> ReflectionInputs | None:
     Returns None when there's nothing to reflect on. Shared by the synchronous
     reflector and the async (Batch) submit path so both see identical inputs.
     """
+    from .observe import _file_signature
+
     raw_observations = ""
-    if config.observations_path.exists():
+    raw_signature = _file_signature(config.observations_path)
+    if raw_signature is not None:
         raw_observations = config.observations_path.read_text()
 
     reflections = ""
@@ -183,6 +207,7 @@ def _gather_reflection_inputs(config: Config) -> ReflectionInputs | None:
         auto_memory=auto_memory,
         amem_changed=amem_changed,
         single_pass=single_pass,
+        raw_signature=raw_signature,
     )
 
 
@@ -213,6 +238,7 @@ def finalize_reflection(
     raw_observations: str,
     dry_run: bool = False,
     reassembled: bool = False,
+    raw_signature: tuple[int, int] | None = None,
 ) -> str:
     """Stamp, normalize, and persist a raw reflector output.
 
@@ -229,6 +255,10 @@ def finalize_reflection(
     UNTOUCHED tail sections (the exact memory loss Validation gate 3 forbids). The
     cap exists only for legacy single-pass / chunked LLM rewrites, where the model
     can genuinely run away.
+
+    ``raw_signature`` is the observations.md signature taken before
+    ``raw_observations`` was read; the trim reuses that text only while the file
+    still matches it.
     """
     # Cap a runaway reflector output before it's stamped and persisted. The cap
     # is provider-agnostic — it runs here, where the sync and async paths
@@ -276,7 +306,7 @@ def finalize_reflection(
     create_snapshot_failclosed(config, reason="pre-reflect")
 
     _write_reflections(result, config)
-    _trim_old_observations(config)
+    _trim_old_observations(config, content=raw_observations, signature=raw_signature)
     _reindex_if_enabled(config)
 
     return result
@@ -634,14 +664,8 @@ def _reflect_chunked(
 
     for i, chunk in enumerate(chunks, 1):
         is_last = i == len(chunks)
-        fold_prompt = system_prompt
-        if not is_last:
-            # For intermediate chunks, tell the model more data is coming
-            fold_prompt += (
-                "\n\n**NOTE:** This is chunk {i} of {total}. More observations follow. "
-                "Focus on integrating these observations into the reflections. "
-                "Produce the complete updated reflections document."
-            ).format(i=i, total=len(chunks))
+        # For intermediate chunks, tell the model more data is coming
+        fold_note = "" if is_last else _INTERMEDIATE_CHUNK_NOTE.format(i=i, total=len(chunks))
 
         # Include auto-memory context only in the final chunk.
         fold_amem = amem_section if is_last else ""
@@ -659,10 +683,10 @@ def _reflect_chunked(
         user_content = (
             f"## Current reflections\n\n{bounded}\n\n"
             f"---\n\n"
-            f"## Observations (chunk {i}/{len(chunks)})\n\n{chunk}{fold_amem}"
+            f"## Observations (chunk {i}/{len(chunks)})\n\n{chunk}{fold_amem}{fold_note}"
         )
         running_reflections = compress(
-            fold_prompt,
+            system_prompt,
             user_content,
             config,
             max_tokens=_REFLECTOR_MAX_OUTPUT_TOKENS,
@@ -672,6 +696,7 @@ def _reflect_chunked(
     return running_reflections
 
 
+@functools.lru_cache(maxsize=1)
 def _sectioned_reflector_prompt() -> str:
     """Load the section-targeted reflector system prompt (fallback if missing)."""
     if REFLECTOR_SECTIONED_PROMPT_PATH.exists():
@@ -1022,13 +1047,7 @@ def _reflect_chunked_legacy(
     running_reflections = reflections
     for i, chunk in enumerate(chunks, 1):
         is_last = i == len(chunks)
-        fold_prompt = system_prompt
-        if not is_last:
-            fold_prompt += (
-                "\n\n**NOTE:** This is chunk {i} of {total}. More observations follow. "
-                "Focus on integrating these observations into the reflections. "
-                "Produce the complete updated reflections document."
-            ).format(i=i, total=len(chunks))
+        fold_note = "" if is_last else _INTERMEDIATE_CHUNK_NOTE.format(i=i, total=len(chunks))
         fold_amem = amem_section if is_last else ""
         if budget_exhausted:
             bounded = _REFLECTIONS_BUDGET_EXHAUSTED
@@ -1037,10 +1056,10 @@ def _reflect_chunked_legacy(
         user_content = (
             f"## Current reflections\n\n{bounded}\n\n"
             f"---\n\n"
-            f"## Observations (chunk {i}/{len(chunks)})\n\n{chunk}{fold_amem}"
+            f"## Observations (chunk {i}/{len(chunks)})\n\n{chunk}{fold_amem}{fold_note}"
         )
         running_reflections = compress(
-            fold_prompt,
+            system_prompt,
             user_content,
             config,
             max_tokens=_REFLECTOR_MAX_OUTPUT_TOKENS,
@@ -1059,21 +1078,24 @@ def _split_to_width(text: str, max_len: int) -> list[str]:
     if max_len <= 0 or len(text) <= max_len:
         return [text]
     pieces: list[str] = []
-    cur = ""
+    # Lines of the piece being built and their total length; joined once at flush.
+    cur: list[str] = []
+    cur_len = 0
     for line in text.splitlines(keepends=True):
         if len(line) > max_len:
             if cur:
-                pieces.append(cur)
-                cur = ""
+                pieces.append("".join(cur))
+                cur, cur_len = [], 0
             for j in range(0, len(line), max_len):
                 pieces.append(line[j : j + max_len])
             continue
-        if cur and len(cur) + len(line) > max_len:
-            pieces.append(cur)
-            cur = ""
-        cur += line
+        if cur and cur_len + len(line) > max_len:
+            pieces.append("".join(cur))
+            cur, cur_len = [], 0
+        cur.append(line)
+        cur_len += len(line)
     if cur:
-        pieces.append(cur)
+        pieces.append("".join(cur))
     return pieces
 
 
@@ -1093,15 +1115,8 @@ def _chunk_observations(observations: str, budget_chars: int | None = None) -> l
     if budget_chars is None:
         budget_chars = _DEFAULT_CHUNK_BUDGET_CHARS
 
-    sections = re.split(r"(?=^## \d{4}-\d{2}-\d{2})", observations, flags=re.MULTILINE)
-
-    header = ""
-    date_sections = []
-    for section in sections:
-        if re.match(r"## \d{4}-\d{2}-\d{2}", section.strip()):
-            date_sections.append(section)
-        else:
-            header = section
+    header, dated = _split_date_sections(observations)
+    date_sections = [section for _, section in dated]
 
     if not date_sections:
         # No date structure — return whole if it fits, else hard-split to width.
@@ -1114,18 +1129,87 @@ def _chunk_observations(observations: str, budget_chars: int | None = None) -> l
         pieces.extend(_split_to_width(section, max_content))
 
     chunks: list[str] = []
-    current = ""  # content only; header is added at flush
+    current: list[str] = []  # content only; header is added at flush
+    current_len = len(header)
     for piece in pieces:
-        if current and len(header) + len(current) + len(piece) > budget_chars:
-            chunks.append(header + current)
-            current = ""
-        current += piece
+        if current and current_len + len(piece) > budget_chars:
+            chunks.append(header + "".join(current))
+            current, current_len = [], len(header)
+        current.append(piece)
+        current_len += len(piece)
     if current:
-        chunks.append(header + current)
+        chunks.append(header + "".join(current))
 
     return chunks if chunks else [observations]
 
 
+def _date_header_at(text: str, index: int) -> str | None:
+    """Return the date of a ``## YYYY-MM-DD`` header starting at *index*, else None."""
+    if not text.startswith("## ", index):
+        return None
+    date = text[index + 3 : index + 13]
+    if (
+        len(date) == 10
+        and date[4] == "-"
+        and date[7] == "-"
+        and date[:4].isdecimal()
+        and date[5:7].isdecimal()
+        and date[8:].isdecimal()
+    ):
+        return date
+    return None
+
+
+def _iter_date_headers(text: str) -> Iterator[tuple[int, str]]:
+    """Yield ``(offset, date)`` for each line of *text* starting ``## YYYY-MM-DD``.
+
+    Candidate lines are located with ``str.find`` so a large file is scanned
+    once instead of running a multiline regex over it.
+    """
+    date = _date_header_at(text, 0)
+    if date:
+        yield 0, date
+    pos = text.find("\n## ")
+    while pos != -1:
+        date = _date_header_at(text, pos + 1)
+        if date:
+            yield pos + 1, date
+        pos = text.find("\n## ", pos + 4)
+
+
+def _date_section_spans(text: str) -> tuple[int, list[tuple[str, int, int]]]:
+    """Locate the date sections of observations without slicing them out.
+
+    Returns the end offset of the leading header and a ``(date, start, end)``
+    span per section, so callers that keep only some sections copy just those.
+    A section starts at each line beginning with ``## YYYY-MM-DD`` and runs to
+    the next one (see :func:`_iter_date_headers`).
+    """
+    starts = list(_iter_date_headers(text))
+    header_end = starts[0][0] if starts else len(text)
+    ends = [start for start, _ in starts[1:]] + [len(text)]
+    spans = [(date, start, end) for (start, date), end in zip(starts, ends)]
+
+    # Indentation before the first header still counts as a date section.
+    if header_end:
+        header = text[:header_end]
+        date = _date_header_at(header.lstrip(), 0)
+        if date:
+            spans.insert(0, (date, 0, header_end))
+            header_end = 0
+    return header_end, spans
+
+
+def _split_date_sections(text: str) -> tuple[str, list[tuple[str, str]]]:
+    """Split observations into the leading header and ``(date, section)`` pairs.
+
+    Joining the header and sections reproduces *text*; see
+    :func:`_date_section_spans` for what starts a section.
+    """
+    header_end, spans = _date_section_spans(text)
+    return text[:header_end], [(date, text[start:end]) for date, start, end in spans]
+
+
 def _parse_last_reflected(reflections: str) -> str | None:
     """Extract the ``Last reflected`` date from reflections.md.
 
@@ -1161,22 +1245,12 @@ def _filter_new_observations(observations: str, since_date: str | None) -> str:
     if since_date is None:
         return observations
 
-    sections = re.split(r"(?=^## \d{4}-\d{2}-\d{2})", observations, flags=re.MULTILINE)
-
-    header = ""
-    kept: list[str] = []
-    for section in sections:
-        date_match = re.match(r"## (\d{4}-\d{2}-\d{2})", section.strip())
-        if date_match:
-            if date_match.group(1) >= since_date:
-                kept.append(section)
-        else:
-            header = section
-
+    header_end, spans = _date_section_spans(observations)
+    kept = [observations[start:end] for date, start, end in spans if date >= since_date]
     if not kept:
         return ""
 
-    return header + "".join(kept)
+    return observations[:header_end] + "".join(kept)
 
 
 def _extract_latest_observation_date(observations: str) -> str | None:
@@ -1185,8 +1259,7 @@ def _extract_latest_observation_date(observations: str) -> str | None:
     Returns:
         A ``YYYY-MM-DD`` string, or None if no date headers found.
     """
-    dates = re.findall(r"^## (\d{4}-\d{2}-\d{2})", observations, flags=re.MULTILINE)
-    return max(dates) if dates else None
+    return max((date for _, date in _iter_date_headers(observations)), default=None)
 
 
 def _extract_observation_date_range(observations: str) -> tuple[str, str] | None:
@@ -1197,7 +1270,7 @@ def _extract_observation_date_range(observations: str) -> tuple[str, str] | None
     caller then omits ``derived_from_obs_window`` entirely rather than stamping a
     wrong/partial range).
     """
-    dates = re.findall(r"^## (\d{4}-\d{2}-\d{2})", observations, flags=re.MULTILINE)
+    dates = [date for _, date in _iter_date_headers(observations)]
     if not dates:
         return None
     return min(dates), max(dates)
@@ -1243,28 +1316,40 @@ def _stamp_timestamps(reflections: str, updated: str, reflected: str) -> str:
     updated_line = f"*Last updated: {updated}*"
     reflected_line = f"*Last reflected: {reflected}*"
 
-    has_updated = _LAST_UPDATED_RE.search(reflections)
-    has_reflected = _LAST_REFLECTED_RE.search(reflections)
-
-    if has_updated:
-        reflections = _LAST_UPDATED_RE.sub(updated_line, reflections, count=1)
-    if has_reflected:
-        reflections = _LAST_REFLECTED_RE.sub(reflected_line, reflections, count=1)
-
-    # If "Last reflected" wasn't in the LLM output, insert it after "Last updated"
-    if not has_reflected:
-        if has_updated or _LAST_UPDATED_RE.search(reflections):
-            reflections = _LAST_UPDATED_RE.sub(f"{updated_line}\n{reflected_line}", reflections, count=1)
+    # The first line of each kind is the one that gets replaced.
+    updated_match = reflected_match = None
+    for match in _TIMESTAMP_LINE_RE.finditer(reflections):
+        if match.group("updated") is not None:
+            updated_match = updated_match or match
         else:
-            # No timestamp lines at all — insert after the title
-            title_match = re.match(r"(#[^\n]*\n)", reflections)
-            if title_match:
-                insert_pos = title_match.end()
-                reflections = (
-                    reflections[:insert_pos] + f"\n{updated_line}\n{reflected_line}\n" + reflections[insert_pos:]
-                )
+            reflected_match = reflected_match or match
+        if updated_match and reflected_match:
+            break
+
+    if not updated_match and not reflected_match:
+        # No timestamp lines at all — insert after the title
+        title_match = _TITLE_LINE_RE.match(reflections)
+        if title_match:
+            insert_pos = title_match.end()
+            reflections = reflections[:insert_pos] + f"\n{updated_line}\n{reflected_line}\n" + reflections[insert_pos:]
+        return reflections
+
+    replacements = []
+    if updated_match:
+        # If "Last reflected" wasn't in the LLM output, insert it after "Last updated"
+        new_line = updated_line if reflected_match else f"{updated_line}\n{reflected_line}"
+        replacements.append((updated_match.start(), updated_match.end(), new_line))
+    if reflected_match:
+        replacements.append((reflected_match.start(), reflected_match.end(), reflected_line))
 
-    return reflections
+    pieces = []
+    pos = 0
+    for start, end, new_line in sorted(replacements):
+        pieces.append(reflections[pos:start])
+        pieces.append(new_line)
+        pos = end
+    pieces.append(reflections[pos:])
+    return "".join(pieces)
 
 
 def _reindex_if_enabled(config: Config) -> None:
@@ -1279,8 +1364,9 @@ def _reindex_if_enabled(config: Config) -> None:
         pass  # Never block observe/reflect on search failures
 
 
+@functools.lru_cache(maxsize=1)
 def _load_reflector_prompt() -> str:
-    """Load the reflector system prompt."""
+    """Load the reflector system prompt; the packaged file is read once per process."""
     if REFLECTOR_PROMPT_PATH.exists():
         return REFLECTOR_PROMPT_PATH.read_text()
     return (
@@ -1302,33 +1388,40 @@ def _write_reflections(reflections: str, config: Config) -> None:
     refresh_startup_memory(config)
 
 
-def _trim_old_observations(config: Config) -> None:
-    """Remove observation entries older than retention period."""
-    if not config.observations_path.exists():
-        return
+def _trim_old_observations(
+    config: Config,
+    *,
+    content: str | None = None,
+    signature: tuple[int, int] | None = None,
+) -> None:
+    """Remove observation entries older than retention period.
+
+    ``content``/``signature`` are observations the caller already read and the
+    file signature taken before that read. An observer can append while the
+    reflector LLM call runs, so they are reused only if the file still matches.
+    """
+    from .observe import _file_signature
 
-    content = config.observations_path.read_text()
+    current_signature = _file_signature(config.observations_path)
+    if current_signature is None:
+        return
+    if content is None or current_signature != signature:
+        content = config.observations_path.read_text()
     cutoff = datetime.now(timezone.utc) - timedelta(days=config.observation_retention_days)
     cutoff_str = cutoff.strftime("%Y-%m-%d")
 
-    # Split by date headers (## YYYY-MM-DD)
-    sections = re.split(r"(?=^## \d{4}-\d{2}-\d{2})", content, flags=re.MULTILINE)
-
-    kept = []
-    for section in sections:
-        # Extract date from header
-        date_match = re.match(r"## (\d{4}-\d{2}-\d{2})", section.strip())
-        if date_match:
-            section_date = date_match.group(1)
-            if section_date >= cutoff_str:
-                kept.append(section)
-        else:
-            # Keep non-date sections (like the header)
-            kept.append(section)
+    header_end, spans = _date_section_spans(content)
+    if all(date >= cutoff_str for date, _, _ in spans):
+        # Nothing aged out; skip rebuilding and atomically rewriting a large file.
+        return
+
+    # Keep the file header, drop date sections older than the cutoff
+    kept = [content[start:end] for date, start, end in spans if date >= cutoff_str]
+    trimmed = (content[:header_end] + "".join(kept)).rstrip() + "\n"
 
     from .sync.atomic import atomic_write_text
 
-    atomic_write_text(config.observations_path, "".join(kept).rstrip() + "\n")
+    atomic_write_text(config.observations_path, trimmed)
 
 
 def _cluster_enabled(config: Config) -> bool:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pickle
 import re
+from collections import Counter
 from pathlib import Path
 
 from . import Document, SearchResult
@@ -34,11 +35,24 @@ _STOPWORDS = frozenset(
 )
 
 
+# Runs of word characters; markdown punctuation and emoji fall between tokens.
+_TOKEN_RE = re.compile(r"\w+")
+# The same pattern over bytes, where \w is exactly the ASCII word characters.
+_ASCII_TOKEN_RE = re.compile(rb"\w+")
+_ASCII_STOPWORDS = frozenset(word.encode() for word in _STOPWORDS)
+
+# Bump whenever _tokenize's output changes, so a reindex never reuses term
+# counts that an older tokenizer produced.
+_TOKENIZER_VERSION = 1
+
+
 def _tokenize(text: str) -> list[str]:
     """Lowercase, strip markdown/emoji, remove stopwords."""
-    text = text.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-    return [w for w in text.split() if w and w not in _STOPWORDS]
+    if text.isascii():
+        # Queries and plain sections are usually pure ASCII, where lowercasing
+        # and matching bytes skips the per-character Unicode lookups.
+        return [w.decode() for w in _ASCII_TOKEN_RE.findall(text.encode().lower()) if w not in _ASCII_STOPWORDS]
+    return [w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOPWORDS]
 
 
 class BM25Backend:
@@ -48,18 +62,35 @@ class BM25Backend:
         self._index_path = index_path
         self._bm25 = None
         self._documents: list[Document] = []
-        self._tokenized_corpus: list[list[str]] = []
+        self._length_norm = None
+        self._tokenizer_version: int | None = None
         self._load()
 
     def index(self, documents: list[Document]) -> None:
         from rank_bm25 import BM25Okapi
 
+        if self._bm25 is not None and self._tokenizer_version == _TOKENIZER_VERSION and documents == self._documents:
+            return  # Nothing changed since the saved index was built
+
+        # Reindexing mostly re-sends unchanged sections. Their term counts are
+        # already in the loaded model, and expanding those back into tokens is
+        # far cheaper than running the tokenizer over the text again.
+        previous: dict[str, dict[str, int]] = {}
+        if self._bm25 is not None and self._tokenizer_version == _TOKENIZER_VERSION:
+            previous = {doc.content: freqs for doc, freqs in zip(self._documents, self._bm25.doc_freqs)}
+        # One shared str per distinct term: the model's per-document dicts then
+        # hash each term once, and pickle writes it once instead of per document.
+        vocab: dict[str, str] = {}
+        tokenized_corpus = []
+        for doc in documents:
+            freqs = previous.get(doc.content)
+            tokens = Counter(freqs).elements() if freqs is not None else _tokenize(doc.content)
+            tokenized_corpus.append([vocab.setdefault(token, token) for token in tokens])
+
         self._documents = documents
-        self._tokenized_corpus = [_tokenize(doc.content) for doc in documents]
-        if self._tokenized_corpus:
-            self._bm25 = BM25Okapi(self._tokenized_corpus)
-        else:
-            self._bm25 = None
+        self._tokenizer_version = _TOKENIZER_VERSION
+        self._bm25 = BM25Okapi(tokenized_corpus) if tokenized_corpus else None
+        self._length_norm = None
         self._save()
 
     def search(self, query: str, limit: int = 10) -> list[SearchResult]:
@@ -67,22 +98,23 @@ class BM25Backend:
             return []
 
         tokenized_query = _tokenize(query)
-        if not tokenized_query:
+        # Every corpus term has an IDF entry, so a query sharing none of them
+        # can match nothing, not even through the token-overlap fallback.
+        if not any(token in self._bm25.idf for token in tokenized_query):
             return []
 
-        scores = self._bm25.get_scores(tokenized_query)
+        import numpy as np
 
-        scored = sorted(
-            zip(scores, self._documents),
-            key=lambda x: x[0],
-            reverse=True,
-        )
+        scores = self._get_scores(tokenized_query)
 
-        positive_scored = [(score, doc) for score, doc in scored if score > 0]
-        if positive_scored:
+        # A stable descending argsort keeps tied documents in corpus order, and
+        # only the top *limit* indices are turned into results.
+        top = np.argsort(-scores, kind="stable")[:limit]
+        top = top[scores[top] > 0]
+        if top.size:
             return [
-                SearchResult(document=doc, score=float(score), rank=rank)
-                for rank, (score, doc) in enumerate(positive_scored[:limit], start=1)
+                SearchResult(document=self._documents[index], score=float(scores[index]), rank=rank)
+                for rank, index in enumerate(top.tolist(), start=1)
             ]
 
         # rank-bm25 can assign zero IDF to terms that appear in half the corpus,
@@ -90,8 +122,8 @@ class BM25Backend:
         # only when BM25 produced no positive results at all.
         overlap_scored = []
         query_terms = set(tokenized_query)
-        for doc, doc_tokens in zip(self._documents, self._tokenized_corpus):
-            overlap = sum(1 for token in doc_tokens if token in query_terms)
+        for doc, doc_freqs in zip(self._documents, self._bm25.doc_freqs):
+            overlap = sum(doc_freqs.get(token, 0) for token in query_terms)
             if overlap > 0:
                 overlap_scored.append((float(overlap), doc))
 
@@ -101,14 +133,39 @@ class BM25Backend:
             results.append(SearchResult(document=doc, score=float(score), rank=rank))
         return results
 
+    def _get_scores(self, tokenized_query: list[str]):
+        """Score every document for *tokenized_query*, like ``BM25Okapi.get_scores``.
+
+        The per-document length normalization does not depend on the query, so
+        it is computed once per loaded index instead of once per query term,
+        and terms absent from the corpus (which contribute exactly 0) are
+        skipped instead of walking every document for them.
+        """
+        import numpy as np
+
+        bm25 = self._bm25
+        if self._length_norm is None:
+            doc_len = np.array(bm25.doc_len)
+            self._length_norm = bm25.k1 * (1 - bm25.b + bm25.b * doc_len / bm25.avgdl)
+        scores = np.zeros(bm25.corpus_size)
+        for token in tokenized_query:
+            idf = bm25.idf.get(token)
+            if not idf:
+                continue
+            q_freq = np.fromiter((doc.get(token) or 0 for doc in bm25.doc_freqs), float, count=bm25.corpus_size)
+            scores += idf * (q_freq * (bm25.k1 + 1) / (q_freq + self._length_norm))
+        return scores
+
     def is_ready(self) -> bool:
         return self._bm25 is not None and len(self._documents) > 0
 
     def _save(self) -> None:
         self._index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Persist the fitted model so loading skips recomputing term statistics.
         data = {
             "documents": self._documents,
-            "tokenized_corpus": self._tokenized_corpus,
+            "bm25": self._bm25,
+            "tokenizer": _TOKENIZER_VERSION,
         }
         with open(self._index_path, "wb") as f:
             pickle.dump(data, f)
@@ -120,11 +177,14 @@ class BM25Backend:
             with open(self._index_path, "rb") as f:
                 data = pickle.load(f)
             self._documents = data["documents"]
-            self._tokenized_corpus = data["tokenized_corpus"]
-            if self._tokenized_corpus:
+            if "bm25" in data:
+                self._bm25 = data["bm25"]
+                self._tokenizer_version = data.get("tokenizer")
+            elif data.get("tokenized_corpus"):
+                # Index written before the fitted model was persisted
                 from rank_bm25 import BM25Okapi
 
-                self._bm25 = BM25Okapi(self._tokenized_corpus)
+                self._bm25 = BM25Okapi(data["tokenized_corpus"])
         except Exception:
             self._bm25 = None
             self._documents = []
@@ -7,10 +7,25 @@ from pathlib import Path
 
 from . import Document, DocumentSource
 
+_OBSERVATION_DATE_HEADER_RE = re.compile(r"^## (\d{4}-\d{2}-\d{2})", re.MULTILINE)
+_REFLECTION_HEADER_RE = re.compile(r"^## (.+)", re.MULTILINE)
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
 
-def _line_number_for_offset(content: str, offset: int) -> int:
-    """Return the 1-based line number for a character offset into content."""
-    return content.count("\n", 0, offset) + 1
+
+def _section_line_numbers(content: str, matches: list[re.Match[str]]) -> list[int]:
+    """Return the 1-based start line of each match, counting newlines only once.
+
+    Counting from the top of the file for every section would rescan the same
+    prefix again and again on a large memory file.
+    """
+    line_numbers: list[int] = []
+    line = 1
+    previous = 0
+    for match in matches:
+        line += content.count("\n", previous, match.start())
+        previous = match.start()
+        line_numbers.append(line)
+    return line_numbers
 
 
 def derive_section_provenance(content: str) -> tuple[str | None, str | None, str | None]:
@@ -80,7 +95,8 @@ def parse_observations(path: Path) -> list[Document]:
     if not path.exists():
         return []
     content = path.read_text()
-    matches = list(re.finditer(r"^## (\d{4}-\d{2}-\d{2})", content, flags=re.MULTILINE))
+    matches = list(_OBSERVATION_DATE_HEADER_RE.finditer(content))
+    line_numbers = _section_line_numbers(content, matches)
 
     documents = []
     for index, match in enumerate(matches):
@@ -100,7 +116,7 @@ def parse_observations(path: Path) -> list[Document]:
                 date=date,
                 metadata={
                     "file_path": str(path),
-                    "source_start_line": _line_number_for_offset(content, start),
+                    "source_start_line": line_numbers[index],
                 },
             )
         )
@@ -112,7 +128,8 @@ def parse_reflections(path: Path) -> list[Document]:
     if not path.exists():
         return []
     content = path.read_text()
-    matches = list(re.finditer(r"^## (.+)", content, flags=re.MULTILINE))
+    matches = list(_REFLECTION_HEADER_RE.finditer(content))
+    line_numbers = _section_line_numbers(content, matches)
 
     documents = []
     for index, match in enumerate(matches):
@@ -123,7 +140,7 @@ def parse_reflections(path: Path) -> list[Document]:
             continue
 
         heading = match.group(1).strip()
-        slug = re.sub(r"[^a-z0-9]+", "-", heading.lower()).strip("-")
+        slug = _SLUG_SEPARATOR_RE.sub("-", heading.lower()).strip("-")
         owner, scope, source_type = derive_section_provenance(section)
         documents.append(
             Document(
@@ -133,7 +150,7 @@ def parse_reflections(path: Path) -> list[Document]:
                 content=section,
                 metadata={
                     "file_path": str(path),
-                    "source_start_line": _line_number_for_offset(content, start),
+                    "source_start_line": line_numbers[index],
                 },
                 owner=owner,
                 scope=scope,
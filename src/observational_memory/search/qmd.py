@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import binascii
+import hashlib
 import json
 import os
 import re
@@ -251,24 +252,44 @@ class QMDBackend:
         self._supports_no_rerank: bool | None = None
 
     def index(self, documents: list[Document]) -> None:
-        """Write documents as .md files and run qmd update."""
+        """Write documents as .md files and run qmd update.
+
+        Only new or changed documents are written and only removed ones are
+        deleted, so a reindex after a small memory edit leaves the unchanged
+        files (and their mtimes) alone instead of recreating the whole set.
+        Changes are detected from the content hash recorded in the manifest.
+        """
         self._docs_dir.mkdir(parents=True, exist_ok=True)
 
-        for f in self._docs_dir.glob("*.md"):
-            f.unlink()
+        stale = {f.name: f for f in self._docs_dir.glob("*.md")}
+        previous = self._load_manifest()
 
         manifest: dict[str, dict[str, object]] = {}
         for doc in documents:
             filename = self._filename_for_doc_id(doc.doc_id)
-            (self._docs_dir / filename).write_text(doc.content)
+            path = self._docs_dir / filename
+            digest = hashlib.sha256(doc.content.encode()).hexdigest()
+            if stale.pop(filename, None) is None:
+                unchanged = False
+            elif "sha256" in previous.get(filename, {}):
+                unchanged = previous[filename]["sha256"] == digest
+            else:
+                # Manifest written before hashes were recorded
+                unchanged = path.read_text() == doc.content
+            if not unchanged:
+                path.write_text(doc.content)
             manifest[filename] = {
                 "doc_id": doc.doc_id,
                 "source": doc.source.value,
                 "heading": doc.heading,
                 "date": doc.date,
                 "metadata": doc.metadata,
+                "sha256": digest,
             }
 
+        for f in stale.values():
+            f.unlink()
+
         self._manifest_path.write_text(json.dumps(manifest, indent=2) + "\n")
 
         self._ensure_collection()
@@ -41,6 +41,7 @@ _KIND_RE = re.compile(r"\bkind=(\w+)")
 # their visible text happens to contain a version-like token.
 _DURABLE_KINDS = frozenset({"preference", "identity", "policy", "mode", "evergreen"})
 _FRESHNESS_MARKER_RE = re.compile(r"\s*\(as of \d{4}-\d{2}-\d{2} — verify\)")
+_OBSERVATION_DATE_HEADER_RE = re.compile(r"^## (\d{4}-\d{2}-\d{2})$")
 
 
 @dataclass(frozen=True)
@@ -94,7 +95,9 @@ def refresh_startup_memory(config: Config | None = None) -> None:
     config.ensure_memory_dir()
 
     reflections = config.reflections_path.read_text() if config.reflections_path.exists() else ""
-    observations = config.observations_path.read_text() if config.observations_path.exists() else ""
+    # active.md only needs the latest date section of observations.md; stream it
+    # instead of holding the whole (unboundedly growing) log in memory.
+    observations = _read_latest_observation_section(config.observations_path)
 
     # Atomic so a concurrent snapshot/reader never captures a torn profile/active.
     from .sync.atomic import atomic_write_text
@@ -561,6 +564,33 @@ def _filter_priority_bullets(section: str, allowed_prefixes: tuple[str, ...]) ->
     return "\n".join(kept) if len(kept) > 1 else ""
 
 
+def _read_latest_observation_section(path: Path) -> str:
+    """Return the ``## YYYY-MM-DD`` section of *path* with the latest date.
+
+    Streams the file line by line and keeps only the best section seen so far,
+    so peak memory is one date section rather than the whole observation log.
+    Ties keep the first section, matching :func:`_extract_latest_current_context`.
+    """
+    best_date = ""
+    best: list[str] = []
+    collecting: list[str] | None = None
+    try:
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                match = _OBSERVATION_DATE_HEADER_RE.match(line.rstrip("\n"))
+                if match:
+                    if match.group(1) > best_date:
+                        best_date = match.group(1)
+                        best = collecting = [line]
+                    else:
+                        collecting = None
+                elif collecting is not None:
+                    collecting.append(line)
+    except FileNotFoundError:
+        return ""
+    return "".join(best)
+
+
 def _extract_latest_current_context(observations: str) -> str:
     if not observations:
         return ""
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Normalized message from any agent transcript."""
 
@@ -13,3 +15,38 @@ class Message:
     content: str  # text content (tool calls summarized)
     timestamp: str  # ISO 8601
     source: str  # "claude", "codex", "opencode", "kimi", "grok", "cowork", or "hermes"
+
+
+# json.loads returns a fresh str for every "role" value it decodes. Mapping
+# through this table lets every Message share one object per role.
+_CANONICAL_ROLES = {role: role for role in ("user", "assistant", "system")}
+
+
+def canonical_role(role: str) -> str:
+    """Return the shared string for a known *role*, or *role* unchanged."""
+    # Malformed transcripts can carry any JSON value here; unhashable ones
+    # must pass through rather than abort the whole parse.
+    return _CANONICAL_ROLES.get(role, role) if isinstance(role, str) else role
+
+
+def is_line_boundary(handle: BinaryIO, offset: int) -> bool:
+    """Return True if *offset* is the start of a line in the open transcript."""
+    if offset == 0:
+        return True
+    if offset < 0:
+        return False
+    handle.seek(offset - 1)
+    return handle.read(1) == b"\n"
+
+
+class TranscriptFile(NamedTuple):
+    """A discovered transcript plus the stat fields read while listing it."""
+
+    path: Path
+    size: int
+    mtime: float
+
+    @classmethod
+    def from_path(cls, path: Path) -> TranscriptFile:
+        st = path.stat()
+        return cls(path, st.st_size, st.st_mtime)
@@ -2,49 +2,47 @@
 
 from __future__ import annotations
 
+import io
 import json
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from . import Message
+from . import Message, TranscriptFile, canonical_role, is_line_boundary
 
+_REVERSE_SCAN_CHUNK_BYTES = 64 * 1024
 
-def parse_transcript(path: Path, after_uuid: str | None = None, source: str = "claude") -> list[Message]:
+
+def parse_transcript(
+    path: Path,
+    after_uuid: str | None = None,
+    source: str = "claude",
+    byte_offset: int | None = None,
+) -> list[Message]:
     """Parse a Claude Code .jsonl transcript into Messages.
 
     Args:
         path: Path to the transcript .jsonl file.
         after_uuid: If set, only return messages after this UUID (for incremental processing).
         source: Source label for the resulting Messages (default ``"claude"``).
+        byte_offset: The offset :func:`last_message_position` returned together
+            with *after_uuid*. While it still starts a line, parsing resumes
+            there instead of scanning the file for the UUID.
 
     Returns:
         List of normalized Message objects.
     """
     messages: list[Message] = []
-    seen_after = after_uuid is None  # if no cursor, include everything
-
-    for line in path.open(encoding="utf-8"):
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
 
+    for entry in _iter_message_entries(path, after_uuid=after_uuid, byte_offset=byte_offset):
         # Skip non-message entries
-        entry_type = entry.get("type")
-        if entry_type not in ("user", "assistant"):
+        if entry.get("type") not in ("user", "assistant"):
             continue
 
-        uuid = entry.get("uuid", "")
         timestamp = entry.get("timestamp") or entry.get("_audit_timestamp", "")
         msg = entry.get("message", {})
-        role = msg.get("role", "")
-
-        # Skip until we pass the cursor
-        if not seen_after:
-            if uuid == after_uuid:
-                seen_after = True
-            continue
+        role = canonical_role(msg.get("role", ""))
 
         # Skip meta messages (like skill expansions)
         if entry.get("isMeta"):
@@ -68,14 +66,7 @@ def count_messages(path: Path) -> int:
     """Return the number of normalized Claude Code messages without retaining them."""
     count = 0
 
-    for line in path.open(encoding="utf-8"):
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
+    for entry in _iter_message_entries(path):
         if entry.get("type") not in ("user", "assistant"):
             continue
         if entry.get("isMeta"):
@@ -88,22 +79,101 @@ def count_messages(path: Path) -> int:
     return count
 
 
+def _iter_message_entries(path: Path, after_uuid: str | None = None, byte_offset: int | None = None) -> Iterator[dict]:
+    """Yield the parsed records of *path* that may be user/assistant messages.
+
+    Only lines that mention a message type are parsed; progress, snapshot, and
+    other bookkeeping records often make up much of a transcript and are
+    skipped with a substring check instead of a full JSON parse.
+
+    With *after_uuid*, nothing is yielded until the user/assistant record
+    carrying that UUID has been passed, and lines before it are only parsed
+    when they contain the UUID text at all. A *byte_offset* that starts a line
+    is taken to be just past that record, so reading begins there instead.
+    """
+    pending = after_uuid
+    # The cursor line holds the UUID as JSON-encoded text; for the ASCII UUIDs
+    # Claude writes that is a plain substring. Anything else is parsed in full.
+    needle = json.dumps(after_uuid)[1:-1] if after_uuid is not None and after_uuid.isascii() else ""
+    with path.open("rb") as raw:
+        if pending is not None and byte_offset is not None and is_line_boundary(raw, byte_offset):
+            pending = None
+            raw.seek(byte_offset)
+        else:
+            raw.seek(0)
+        handle = io.TextIOWrapper(raw, encoding="utf-8")
+        for line in handle:
+            if pending is not None:
+                if needle not in line:
+                    continue
+            elif '"user"' not in line and '"assistant"' not in line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            if pending is not None:
+                if entry.get("type") in ("user", "assistant") and entry.get("uuid", "") == pending:
+                    pending = None
+                continue
+            yield entry
+
+
 def last_message_uuid(path: Path) -> str | None:
     """Return the last Claude user/assistant UUID without loading the full file."""
-    last_uuid = None
+    position = last_message_position(path)
+    return position[0] if position else None
 
-    for line in path.open(encoding="utf-8"):
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
 
-        if entry.get("type") in ("user", "assistant") and entry.get("uuid"):
-            last_uuid = entry["uuid"]
+def last_message_position(path: Path) -> tuple[str, int | None] | None:
+    """Return the last Claude user/assistant UUID and the byte offset just past its line.
 
-    return last_uuid
+    The file is read backwards in fixed-size blocks, so the common case where
+    the newest message sits at the end only touches the tail of the transcript.
+    The offset is None when that line has no trailing newline yet, since a
+    later append could still extend it.
+    """
+    with path.open("rb") as handle:
+        size = position = handle.seek(0, os.SEEK_END)
+        # Pieces of the line currently straddling block boundaries, newest first.
+        partial: list[bytes] = []
+        while position > 0:
+            read_size = min(_REVERSE_SCAN_CHUNK_BYTES, position)
+            position -= read_size
+            handle.seek(position)
+            block = handle.read(read_size)
+            end = len(block)
+            while (newline := block.rfind(b"\n", 0, end)) != -1:
+                line = block[newline + 1 : end] + b"".join(reversed(partial))
+                partial.clear()
+                if uuid := _message_uuid(line):
+                    return uuid, _offset_after_line(position + newline + 1 + len(line), size)
+                end = newline
+            partial.append(block[:end])
+    line = b"".join(reversed(partial))
+    if uuid := _message_uuid(line):
+        return uuid, _offset_after_line(len(line), size)
+    return None
+
+
+def _offset_after_line(line_end: int, size: int) -> int | None:
+    # Every line but the last is followed by the newline that split it off.
+    return line_end + 1 if line_end < size else None
+
+
+def _message_uuid(line: bytes) -> str | None:
+    # Byte scans are far cheaper than a parse, and tool/meta records rarely qualify.
+    if b'"uuid"' not in line or (b'"user"' not in line and b'"assistant"' not in line):
+        return None
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(entry, dict) and entry.get("type") in ("user", "assistant") and entry.get("uuid"):
+        return entry["uuid"]
+    return None
 
 
 def _extract_content(msg: dict) -> str:
@@ -139,64 +209,78 @@ def _extract_content(msg: dict) -> str:
                     image_count += 1
         if image_count:
             parts.append(f"[{image_count} image(s) shared]")
-        return "\n".join(p for p in parts if p).strip()
+        return "\n".join(filter(None, parts)).strip()
 
     return ""
 
 
+# Tools summarized as "[Tool: <input field>]", keyed to the field shown.
+_TOOL_SUMMARY_FIELDS = {
+    "Read": "file_path",
+    "Write": "file_path",
+    "Edit": "file_path",
+    "Glob": "pattern",
+    "Grep": "pattern",
+    "WebSearch": "query",
+    "WebFetch": "url",
+    "Task": "description",
+}
+
+
 def _summarize_tool_use(tool: str, inp: dict) -> str:
     """Create a one-line summary of a tool call."""
+    field = _TOOL_SUMMARY_FIELDS.get(tool)
+    if field is not None:
+        return f"[{tool}: {inp.get(field, '?')}]"
     if tool == "Bash":
         cmd = inp.get("command", "")
         desc = inp.get("description", "")
         return f"[Bash: {desc or cmd[:100]}]"
-    elif tool == "Read":
-        return f"[Read: {inp.get('file_path', '?')}]"
-    elif tool in ("Write", "Edit"):
-        return f"[{tool}: {inp.get('file_path', '?')}]"
-    elif tool == "Glob":
-        return f"[Glob: {inp.get('pattern', '?')}]"
-    elif tool == "Grep":
-        return f"[Grep: {inp.get('pattern', '?')}]"
-    elif tool == "WebSearch":
-        return f"[WebSearch: {inp.get('query', '?')}]"
-    elif tool == "WebFetch":
-        return f"[WebFetch: {inp.get('url', '?')}]"
-    elif tool == "Task":
-        return f"[Task: {inp.get('description', '?')}]"
-    else:
-        return f"[{tool}]"
+    return f"[{tool}]"
 
 
 def find_recent_transcripts(projects_dir: Path, max_age_hours: int = 24) -> list[Path]:
     """Find Claude Code transcript files modified within max_age_hours."""
-    from datetime import datetime, timedelta, timezone
-
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    transcripts = []
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
+    # scan_all_transcripts walks with os.scandir and stats each file once.
+    recent = [t.path for t in scan_all_transcripts(projects_dir) if t.mtime > cutoff]
+    recent.reverse()
+    return recent
 
-    if not projects_dir.exists():
-        return transcripts
 
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-        for jsonl in project_dir.glob("*.jsonl"):
-            mtime = datetime.fromtimestamp(jsonl.stat().st_mtime, tz=timezone.utc)
-            if mtime > cutoff:
-                transcripts.append(jsonl)
+def find_all_transcripts(projects_dir: Path) -> list[Path]:
+    """Find ALL Claude Code transcript files, sorted oldest-first by modification time."""
+    return [transcript.path for transcript in scan_all_transcripts(projects_dir)]
 
-    return sorted(transcripts, key=lambda p: p.stat().st_mtime, reverse=True)
 
+def scan_all_transcripts(projects_dir: Path) -> list[TranscriptFile]:
+    """Like :func:`find_all_transcripts`, but keep each file's size and mtime.
 
-def find_all_transcripts(projects_dir: Path) -> list[Path]:
-    """Find ALL Claude Code transcript files, sorted oldest-first by modification time."""
-    transcripts = []
-    if not projects_dir.exists():
+    Uses ``os.scandir`` so each transcript is stat'ed exactly once (free on
+    Windows, where the directory listing already carries it) and callers such
+    as ``om backfill --dry-run`` can report sizes without another ``stat``.
+    """
+    transcripts: list[TranscriptFile] = []
+    try:
+        projects = os.scandir(projects_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return transcripts
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-        for jsonl in project_dir.glob("*.jsonl"):
-            transcripts.append(jsonl)
-    return sorted(transcripts, key=lambda p: p.stat().st_mtime)
+    with projects:
+        for project in projects:
+            if not project.is_dir():
+                continue
+            try:
+                entries = os.scandir(project.path)
+            except OSError:
+                continue  # One unreadable project must not hide the others
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".jsonl"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # Removed since the listing, or unreadable
+                    transcripts.append(TranscriptFile(Path(entry.path), st.st_size, st.st_mtime))
+    transcripts.sort(key=lambda transcript: transcript.mtime)
+    return transcripts
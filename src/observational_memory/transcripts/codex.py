@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import json
 import logging
+import stat
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from . import Message
+from . import Message, canonical_role, is_line_boundary
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,18 +35,24 @@ def _extract_records(raw: str, source_path: Path) -> list[dict]:
         return _extract_json_records(raw, source_path) or records
 
     records = _extract_json_records(raw, source_path)
-    if records:
+    if records is not None:
+        # The file parsed as one JSON document; re-splitting it into lines
+        # cannot find records the full parse missed.
         return records
     return _extract_jsonl_records(raw, source_path)
 
 
-def _extract_json_records(raw: str, source_path: Path) -> list[dict]:
-    """Extract records from a full JSON transcript payload."""
+def _extract_json_records(raw: str, source_path: Path) -> list[dict] | None:
+    """Extract records from a full JSON transcript payload.
+
+    Returns None when *raw* is not valid JSON, so callers can tell a failed
+    parse apart from a well-formed session that holds no records.
+    """
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError as exc:
         _LOGGER.warning("Failed to parse Codex transcript %s as JSON: %s", source_path, exc)
-        return []
+        return None
 
     if isinstance(payload, dict):
         items = payload.get("items")
@@ -205,7 +213,7 @@ def parse_transcript_with_count(path: Path, after_index: int | None = None) -> t
         if total_messages >= start:
             messages.append(
                 Message(
-                    role=role,
+                    role=canonical_role(role),
                     content=content,
                     timestamp=timestamp,
                     source="codex",
@@ -216,6 +224,65 @@ def parse_transcript_with_count(path: Path, after_index: int | None = None) -> t
     return messages, total_messages
 
 
+def parse_transcript_resumable(
+    path: Path, after_index: int = 0, byte_offset: int | None = None
+) -> tuple[list[Message], int, int | None]:
+    """Parse the Codex messages after *after_index*, resuming at *byte_offset* when known.
+
+    ``byte_offset`` must be the ``end_offset`` an earlier call returned for the
+    same session together with ``after_index`` messages. Sessions are
+    append-only, so parsing then starts at that byte instead of re-decoding every
+    earlier line; an offset that no longer falls on a line boundary falls back to
+    a full parse.
+
+    Returns:
+        ``(messages, total_messages, end_offset)``. ``end_offset`` is the byte
+        position after the last complete line, or None when the session is not
+        JSONL or ends in a parsed line without a trailing newline (a later append
+        would otherwise be parsed together with it).
+    """
+    if path.suffix.lower() != ".jsonl":
+        messages, total_messages = parse_transcript_with_count(path, after_index=after_index)
+        return messages, total_messages, None
+
+    messages: list[Message] = []
+    with path.open("rb") as handle:
+        if byte_offset is not None and is_line_boundary(handle, byte_offset):
+            handle.seek(byte_offset)
+            skip, total_messages, end_offset = 0, after_index, byte_offset
+        else:
+            handle.seek(0)
+            skip, total_messages, end_offset = after_index, 0, 0
+
+        for raw in handle:
+            terminated = raw.endswith(b"\n")
+            if not raw.strip():
+                end_offset += len(raw)
+                continue
+            try:
+                entry = json.loads(raw.decode("utf-8"))
+            except ValueError as exc:
+                if not terminated:
+                    break  # Line still being written; pick it up on the next run
+                _LOGGER.warning("Skipping malformed JSON line in Codex transcript %s: %s", path, exc)
+                end_offset += len(raw)
+                continue
+
+            for record in _expand_line_records(entry):
+                extracted = _extract_message_entry(record)
+                if extracted is None or not extracted[1]:
+                    continue
+                if total_messages >= skip:
+                    role, content, timestamp = extracted
+                    messages.append(
+                        Message(role=canonical_role(role), content=content, timestamp=timestamp, source="codex")
+                    )
+                total_messages += 1
+            end_offset = end_offset + len(raw) if terminated else None
+
+    return messages, total_messages, end_offset
+
+
 def parse_transcript(path: Path, after_index: int | None = None) -> list[Message]:
     """Parse a Codex session transcript into Messages.
 
@@ -272,29 +339,31 @@ def _extract_content(entry: dict) -> str:
                     result = block.get("output", block.get("content", ""))
                     if isinstance(result, str) and len(result) < 300:
                         parts.append(f"[result: {result[:200]}]")
-        return "\n".join(p for p in parts if p).strip()
+        return "\n".join(filter(None, parts)).strip()
 
     return ""
 
 
 def find_recent_sessions(codex_home: Path, max_age_hours: int = 24) -> list[Path]:
     """Find Codex session files modified within max_age_hours."""
-    from datetime import datetime, timedelta, timezone
-
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    sessions = []
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
+    sessions: list[tuple[float, Path]] = []
 
     sessions_dir = codex_home / "sessions"
     if not sessions_dir.exists():
-        return sessions
+        return []
 
     for f in sessions_dir.rglob("*"):
-        if not f.is_file():
-            continue
+        # Check the suffix first so directories and other files cost no syscall,
+        # then stat once for both the regular-file test and the mtime.
         if f.suffix.lower() not in {".json", ".jsonl"}:
             continue
-        mtime = datetime.fromtimestamp(f.stat().st_mtime, tz=timezone.utc)
-        if mtime > cutoff:
-            sessions.append(f)
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mtime > cutoff:
+            sessions.append((st.st_mtime, f))
 
-    return sorted(sessions, key=lambda p: p.stat().st_mtime, reverse=True)
+    sessions.sort(key=lambda item: item[0], reverse=True)
+    return [path for _, path in sessions]
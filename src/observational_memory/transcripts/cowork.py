@@ -25,15 +25,16 @@ def find_recent_transcripts(sessions_dir: Path | None = None, max_age_hours: int
     if not base.exists():
         return []
 
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    transcripts: list[Path] = []
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
+    transcripts: list[tuple[float, Path]] = []
 
     for audit in base.glob("*/*/local_*/audit.jsonl"):
-        mtime = datetime.fromtimestamp(audit.stat().st_mtime, tz=timezone.utc)
+        mtime = audit.stat().st_mtime
         if mtime > cutoff:
-            transcripts.append(audit)
+            transcripts.append((mtime, audit))
 
-    return sorted(transcripts, key=lambda p: p.stat().st_mtime, reverse=True)
+    transcripts.sort(key=lambda item: item[0], reverse=True)
+    return [path for _, path in transcripts]
 
 
 def find_all_transcripts(sessions_dir: Path | None = None) -> list[Path]:
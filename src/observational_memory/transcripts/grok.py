@@ -149,7 +149,7 @@ def _extract_grok_content(update: dict[str, Any]) -> str:
                     parts.append(block["text"])
                 elif "text" in block:
                     parts.append(block["text"])
-        joined = "\n".join(p for p in parts if p).strip()
+        joined = "\n".join(filter(None, parts)).strip()
         if joined:
             return joined
 
@@ -12,10 +12,11 @@ from __future__ import annotations
 
 import json
 import logging
+import stat
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from . import Message
+from . import Message, canonical_role
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,38 +41,45 @@ def parse_transcript(
     """
     messages: list[Message] = []
     start = max(after_index or 0, 0)
+    seen = 0
 
-    for line in path.read_text().splitlines():
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        if not isinstance(entry, dict):
-            continue
+    # Stream the log line by line (split on "\n" only) instead of holding the
+    # whole session as one string plus a list of its lines.
+    with path.open("rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
 
-        role = entry.get("role", "")
+            if not isinstance(entry, dict):
+                continue
 
-        # Only keep user and assistant messages
-        if role not in ("user", "assistant"):
-            continue
+            role = entry.get("role", "")
 
-        timestamp = entry.get("timestamp", "")
-        content = _extract_content(entry)
+            # Only keep user and assistant messages
+            if role not in ("user", "assistant"):
+                continue
 
-        if content:
-            messages.append(
-                Message(
-                    role=role,
-                    content=content,
-                    timestamp=timestamp,
-                    source="hermes",
+            timestamp = entry.get("timestamp", "")
+            content = _extract_content(entry)
+
+            if content:
+                seen += 1
+                if seen <= start:
+                    continue
+                messages.append(
+                    Message(
+                        role=canonical_role(role),
+                        content=content,
+                        timestamp=timestamp,
+                        source="hermes",
+                    )
                 )
-            )
 
-    return messages[start:]
+    return messages
 
 
 def _extract_content(entry: dict) -> str:
@@ -125,7 +133,7 @@ def _extract_content(entry: dict) -> str:
     if not has_prose and entry.get("finish_reason") == "tool_calls":
         return ""
 
-    return "\n".join(p for p in parts if p).strip()
+    return "\n".join(filter(None, parts)).strip()
 
 
 def _summarize_tool_call(name: str, raw_args: str) -> str:
@@ -168,25 +176,27 @@ def find_recent_sessions(
     max_age_hours: int = 24,
 ) -> list[Path]:
     """Find Hermes session files modified within max_age_hours."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    sessions = []
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).timestamp()
+    sessions: list[tuple[float, Path]] = []
 
     if not sessions_dir.exists():
-        return sessions
+        return []
 
     for f in sessions_dir.iterdir():
-        if not f.is_file():
-            continue
         if f.suffix.lower() != ".jsonl":
             continue
         # Skip index/metadata files
         if f.name in ("sessions.json",):
             continue
-        mtime = datetime.fromtimestamp(f.stat().st_mtime, tz=timezone.utc)
-        if mtime > cutoff:
-            sessions.append(f)
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mtime > cutoff:
+            sessions.append((st.st_mtime, f))
 
-    return sorted(sessions, key=lambda p: p.stat().st_mtime, reverse=True)
+    sessions.sort(key=lambda item: item[0], reverse=True)
+    return [path for _, path in sessions]
 
 
 def find_all_sessions(sessions_dir: Path) -> list[Path]:
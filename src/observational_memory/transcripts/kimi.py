@@ -16,20 +16,21 @@ def parse_transcript(path: Path, *, after_index: int = 0, before_index: int | No
     if not path.exists():
         return messages
 
-    lines = path.read_text().splitlines()
-    if before_index is not None:
-        lines = lines[:before_index]
-
-    for line_no, line in enumerate(lines, start=1):
-        if line_no <= after_index or not line.strip():
-            continue
-        try:
-            event = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        msg = _event_to_message(event)
-        if msg is not None:
-            messages.append(msg)
+    # Events are "\n"-terminated JSON written with ensure_ascii=False, so split on
+    # "\n" only: str.splitlines() would also break a prompt at U+2028 and friends.
+    with path.open("rb") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            if before_index is not None and line_no > before_index:
+                break
+            if line_no <= after_index or not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            msg = _event_to_message(event)
+            if msg is not None:
+                messages.append(msg)
     return messages
 
 
@@ -75,7 +76,8 @@ def count_events(path: Path) -> int:
     """Return raw line count for cursor advancement."""
     if not path.exists():
         return 0
-    return len(path.read_text().splitlines())
+    with path.open("rb") as handle:
+        return sum(1 for _ in handle)
 
 
 def _now() -> str:
@@ -6,7 +6,7 @@ import json
 from pathlib import Path
 from typing import Any
 
-from . import Message
+from . import Message, canonical_role
 
 
 def find_recent_sessions(events_dir: Path) -> list[Path]:
@@ -80,7 +80,7 @@ def _extract_message(entry: dict[str, Any]) -> tuple[str, str, str] | None:
 def _normalize_role(value: object) -> str | None:
     role = str(value or "").lower()
     if role in {"user", "assistant", "system"}:
-        return role
+        return canonical_role(role)
     if role in {"agent", "ai", "model"}:
         return "assistant"
     return None
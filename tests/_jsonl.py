@@ -0,0 +1,16 @@
+"""JSONL line builders shared by the transcript and observer tests."""
+
+from __future__ import annotations
+
+import json
+
+
+def claude_line(kind: str, uuid: str, content: str) -> str:
+    """One Claude Code transcript message line, newline included."""
+    return json.dumps({"type": kind, "uuid": uuid, "message": {"role": kind, "content": content}}) + "\n"
+
+
+def codex_line(role: str, content: str) -> str:
+    """One Codex ``response_item`` message line, newline included."""
+    payload = {"type": "message", "role": role, "content": content}
+    return json.dumps({"type": "response_item", "payload": payload}) + "\n"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import os
+import types
 
 import pytest
 
@@ -60,3 +62,25 @@ def isolated_om_home(tmp_path, monkeypatch):
     monkeypatch.delenv("OM_CLUSTER_ENABLED", raising=False)
     monkeypatch.delenv("OM_CLUSTER_ID", raising=False)
     return tmp_path
+
+
+@pytest.fixture
+def claude_json_loads(monkeypatch):
+    """Record every value the Claude transcript module hands to ``json.loads``.
+
+    Only that module's ``json`` reference is swapped for a counting copy, so the
+    stdlib ``json.loads`` seen by everything else stays untouched.
+    """
+    from observational_memory.transcripts import claude as claude_transcripts
+
+    calls = []
+
+    def counting_loads(raw, *args, **kwargs):
+        calls.append(raw)
+        return json.loads(raw, *args, **kwargs)
+
+    spy = types.ModuleType("json")
+    spy.__dict__.update(vars(json))
+    spy.loads = counting_loads
+    monkeypatch.setattr(claude_transcripts, "json", spy)
+    return calls
@@ -37,6 +37,7 @@ def test_context_prefers_compact_startup_files(monkeypatch, tmp_path):
     result = runner.invoke(cli, ["context"])
 
     assert result.exit_code == 0, result.output
+    assert result.output.startswith('{"hookSpecificOutput":{"hookEventName":"SessionStart",')
     payload = json.loads(result.output)
     ctx = payload["hookSpecificOutput"]["additionalContext"]
     assert "# Observational Memory Startup Context" in ctx
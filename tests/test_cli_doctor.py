@@ -434,6 +434,138 @@ def test_status_warns_when_crontab_permission_denied(monkeypatch, tmp_path):
     assert "Cron jobs: error ([Errno 1] Operation not permitted: 'crontab')" in result.output
 
 
+def test_status_counts_memory_file_lines_and_bytes(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._om_cron_jobs", lambda: ({}, None))
+    monkeypatch.setattr("observational_memory.cli._launchd_job_statuses", lambda config: [])
+    runner = CliRunner()
+
+    config = Config(memory_dir=tmp_path / "data" / "observational-memory")
+    config.ensure_memory_dir()
+    config.observations_path.write_bytes("# Observations\n\n- café\n".encode())
+    config.reflections_path.write_bytes(b"# Reflections\n- no trailing newline")
+
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0, result.output
+    assert "Lines: 3, Size: 24 bytes" in result.output
+    assert "Lines: 2, Size: 35 bytes" in result.output
+    assert "Startup profile: not created yet" in result.output
+
+
+def test_file_line_byte_counts_spans_chunks_and_handles_empty_files(monkeypatch, tmp_path):
+    from observational_memory.cli import _file_line_byte_counts
+
+    monkeypatch.setattr("observational_memory.cli._LINE_COUNT_CHUNK_BYTES", 4)
+    empty = tmp_path / "empty.md"
+    empty.write_bytes(b"")
+    multi = tmp_path / "multi.md"
+    multi.write_bytes(b"one\ntwo\nthree\nfour")
+
+    assert _file_line_byte_counts(empty) == (0, 0)
+    assert _file_line_byte_counts(multi) == (4, 18)
+    assert _file_line_byte_counts(tmp_path / "missing.md") is None
+
+
+def test_status_skips_memory_file_probes_when_memory_dir_missing(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._launchd_job_statuses", lambda config: [])
+    monkeypatch.setattr(
+        "observational_memory.cli._file_line_byte_counts",
+        lambda path: (_ for _ in ()).throw(AssertionError(f"unexpected probe of {path}")),
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0, result.output
+    assert "Exists: False" in result.output
+    assert "Memory files: not installed (run 'om install' to create)" in result.output
+    assert "Cursor:" not in result.output
+
+
+def test_status_reports_unreadable_memory_dir(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._launchd_job_statuses", lambda config: [])
+    config = Config()
+    config.memory_dir.mkdir(parents=True)
+    real_scandir = os.scandir
+
+    def deny_memory_dir(path="."):
+        if os.fspath(path) == os.fspath(config.memory_dir):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", deny_memory_dir)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0, result.output
+    assert "Exists: True" in result.output
+    assert "Memory files: unreadable (Permission denied)" in result.output
+
+
+def test_status_cursor_count_skips_bookkeeping_entries(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._launchd_job_statuses", lambda config: [])
+    config = Config()
+    config.ensure_memory_dir()
+    config.save_cursor(
+        {
+            "/t/claude.jsonl": "uuid",
+            "/t/codex.jsonl": 3,
+            "claude-memory": {},
+            "codex-offsets": {"/t/codex.jsonl": {"messages": 3, "offset": 10}},
+            "claude-offsets": {"/t/claude.jsonl": {"uuid": "uuid", "offset": 10}},
+        }
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0, result.output
+    assert "Cursor: tracking 2 transcript(s)" in result.output
+
+
+def test_status_only_probes_memory_files_that_exist(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._launchd_job_statuses", lambda config: [])
+    config = Config()
+    config.memory_dir.mkdir(parents=True)
+    config.observations_path.write_text("one\ntwo\n")
+    probed = []
+
+    def fake_counts(path):
+        probed.append(path.name)
+        return (2, 8)
+
+    monkeypatch.setattr("observational_memory.cli._file_line_byte_counts", fake_counts)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0, result.output
+    assert probed == ["observations.md"]
+    assert "Reflections: not created yet" in result.output
+    assert "Cursor: no transcripts tracked yet" in result.output
+
+
+def test_status_reports_each_claude_hook_event(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._launchd_job_statuses", lambda config: [])
+    runner = CliRunner()
+
+    config = Config()
+    config.claude_settings_path.parent.mkdir(parents=True, exist_ok=True)
+    config.claude_settings_path.write_text(json.dumps({"hooks": {"SessionStart": [], "PreCompact": [], "Other": []}}))
+
+    result = runner.invoke(cli, ["status"])
+    assert result.exit_code == 0, result.output
+    assert (
+        "Claude Code hooks:\n"
+        "  SessionStart: installed\n"
+        "  SessionEnd: not installed\n"
+        "  UserPromptSubmit: not installed\n"
+        "  PreCompact: installed\n"
+    ) in result.output
+
+
 def test_status_reports_duplicate_backstops_on_macos(monkeypatch, tmp_path):
     _set_base_env(monkeypatch, tmp_path)
     monkeypatch.setattr("observational_memory.cli.sys.platform", "darwin")
@@ -681,3 +813,14 @@ def test_doctor_never_fails_when_growth_measurement_raises(monkeypatch, tmp_path
     assert growth is not None
     assert growth["status"] == "WARN"
     assert "growth blew up" in growth["detail"]
+
+
+def test_doctor_om_binary_check_uses_memoized_lookup(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._find_om_path", lambda: "/tmp/bin/om")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["doctor", "--json"])
+    assert result.exit_code == 0, result.output
+    check = _get_check(json.loads(result.output), "om binary")
+    assert check == {**check, "status": "PASS", "detail": "/tmp/bin/om"}
@@ -12,10 +12,13 @@ from click.testing import CliRunner
 
 from observational_memory.cli import (
     _claude_hook_commands,
+    _claude_hooks_template,
     _codex_hooks_feature_enabled,
     _cron_job_keys_for_targets,
     _desired_cron_jobs,
     _enable_codex_hooks_feature,
+    _install_claude_hooks,
+    _install_cron,
     _launchd_job_specs,
     _resolve_scheduler_mode,
     _uninstall_cron,
@@ -1345,3 +1348,164 @@ def test_uninstall_kimi_removes_only_managed_block(monkeypatch, tmp_path):
 
     assert result.exit_code == 0, result.output
     assert config_path.read_text() == 'model = "custom"\n'
+
+
+def test_find_om_path_is_memoized_per_path_value(monkeypatch):
+    import observational_memory.cli as cli_mod
+
+    calls = []
+
+    def fake_which(name, path=None):
+        calls.append(path)
+        return f"{path}/om"
+
+    cli_mod._which_om.cache_clear()
+    monkeypatch.setattr(cli_mod.shutil, "which", fake_which)
+    monkeypatch.setenv("PATH", "/first/bin")
+    try:
+        assert cli_mod._find_om_path() == "/first/bin/om"
+        assert cli_mod._find_om_path() == "/first/bin/om"
+        monkeypatch.setenv("PATH", "/second/bin")
+        assert cli_mod._find_om_path() == "/second/bin/om"
+    finally:
+        cli_mod._which_om.cache_clear()
+
+    assert calls == ["/first/bin", "/second/bin"]
+
+
+def test_replace_delimited_blocks_matches_legacy_regex_behavior():
+    from observational_memory.cli import _CODEX_OM_MARKER, _replace_delimited_blocks
+
+    block = f"{_CODEX_OM_MARKER}\nOM instructions\n{_CODEX_OM_MARKER}"
+    content = f"# Mine\n\n\n{block}\n\n## Keep me\n\n{block}\n"
+
+    assert _replace_delimited_blocks(content, _CODEX_OM_MARKER, _CODEX_OM_MARKER) == "# Mine\n## Keep me\n"
+    unterminated = f"# Mine\n{_CODEX_OM_MARKER}\ndangling\n"
+    assert _replace_delimited_blocks(unterminated, _CODEX_OM_MARKER, _CODEX_OM_MARKER) == unterminated
+
+
+def test_kimi_marked_block_replacement_keeps_backslashes_literal():
+    from observational_memory.cli import _KIMI_OM_BLOCK_END, _KIMI_OM_BLOCK_START, _replace_marked_block
+
+    old_block = f'{_KIMI_OM_BLOCK_START}\ncommand = "old"\n{_KIMI_OM_BLOCK_END}'
+    new_block = f'{_KIMI_OM_BLOCK_START}\ncommand = "C:\\\\Users\\\\me\\\\om.exe"\n{_KIMI_OM_BLOCK_END}'
+
+    updated = _replace_marked_block(f"[user]\nx = 1\n\n{old_block}\n", new_block)
+
+    assert updated == f"[user]\nx = 1\n\n{new_block}\n"
+
+
+def test_install_claude_hooks_leaves_unchanged_settings_untouched(monkeypatch, tmp_path, capsys):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._find_om_path", lambda: "/tmp/bin/om")
+    config = Config(memory_dir=tmp_path / "data" / "observational-memory", codex_home=tmp_path / "codex")
+
+    _install_claude_hooks(config)
+    first = config.claude_settings_path.read_text()
+    os.utime(config.claude_settings_path, ns=(1_000_000_000, 1_000_000_000))
+    capsys.readouterr()
+
+    _install_claude_hooks(config)
+
+    assert "already up to date" in capsys.readouterr().out
+    assert config.claude_settings_path.read_text() == first
+    assert config.claude_settings_path.stat().st_mtime_ns == 1_000_000_000
+
+
+def test_claude_hooks_template_matches_managed_events():
+    hooks = _claude_hooks_template("/tmp/start.sh", "/tmp/bin/om claude-checkpoint")
+
+    assert list(hooks) == ["SessionStart", "SessionEnd", "UserPromptSubmit", "PreCompact"]
+    assert hooks["SessionStart"] == [
+        {
+            "hooks": [
+                {
+                    "type": "command",
+                    "command": "/tmp/start.sh",
+                    "timeout": 15,
+                    "statusMessage": "Loading observational memory...",
+                }
+            ]
+        }
+    ]
+    assert hooks["PreCompact"] == [
+        {"hooks": [{"type": "command", "command": "/tmp/bin/om claude-checkpoint", "timeout": 5, "async": True}]}
+    ]
+
+
+def test_observer_interval_minutes_handles_unset_invalid_and_large_values(monkeypatch):
+    from observational_memory.cli import _codex_observer_interval_minutes
+
+    assert _codex_observer_interval_minutes() == 15
+    monkeypatch.setenv("OM_CODEX_OBSERVER_INTERVAL_MINUTES", "not-a-number")
+    assert _codex_observer_interval_minutes() == 15
+    monkeypatch.setenv("OM_CODEX_OBSERVER_INTERVAL_MINUTES", "0")
+    assert _codex_observer_interval_minutes() == 15
+    monkeypatch.setenv("OM_CODEX_OBSERVER_INTERVAL_MINUTES", "120")
+    assert _codex_observer_interval_minutes() == 59
+
+
+def test_cron_job_key_classifies_om_lines():
+    from observational_memory.cli import _cron_job_key
+
+    assert _cron_job_key("*/15 * * * * /bin/om observe-worker --source codex 2>/dev/null") == "codex"
+    assert _cron_job_key("0 * * * * om observe --source claude-memory") == "claude-memory"
+    assert _cron_job_key("*/5 * * * * . env && om observe-worker --source claude 2>/dev/null") == "claude"
+    assert _cron_job_key("0 4 * * * /usr/local/bin/om reflect 2>/dev/null") == "reflect"
+    assert _cron_job_key("0 3 * * * backup --source claude") is None
+    assert _cron_job_key("# --- observational-memory ---") is None
+
+
+def test_install_cron_skips_write_when_crontab_unchanged(monkeypatch, tmp_path, capsys):
+    _set_base_env(monkeypatch, tmp_path)
+    monkeypatch.setattr("observational_memory.cli._find_om_path", lambda: "/tmp/bin/om")
+    config = Config(memory_dir=tmp_path / "data" / "observational-memory", codex_home=tmp_path / "codex")
+
+    class Result:
+        def __init__(self, returncode=0, stdout="", stderr=""):
+            self.returncode = returncode
+            self.stdout = stdout
+            self.stderr = stderr
+
+    crontab_state = {"text": "0 3 * * * backup\n"}
+    writes: list[str] = []
+
+    def fake_run(args, **kwargs):
+        if args == ["crontab", "-l"]:
+            return Result(stdout=crontab_state["text"])
+        if args == ["crontab", "-"]:
+            writes.append(kwargs["input"])
+            crontab_state["text"] = kwargs["input"]
+            return Result()
+        raise AssertionError(f"Unexpected subprocess call: {args}")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+
+    _install_cron(config, "codex")
+    _install_cron(config, "codex")
+
+    assert len(writes) == 1
+    assert writes[0].startswith("0 3 * * * backup\n# --- observational-memory ---\n")
+    assert "Cron jobs already up to date" in capsys.readouterr().out
+
+
+def test_install_codex_agents_block_appends_once_and_skips_unchanged_rewrite(monkeypatch, tmp_path, capsys):
+    from observational_memory.cli import _CODEX_OM_BLOCK, _install_codex
+
+    _set_base_env(monkeypatch, tmp_path)
+    for name in ("_enable_codex_hooks_feature", "_install_codex_session_start_hook", "_install_codex_stop_hook"):
+        monkeypatch.setattr(f"observational_memory.cli.{name}", lambda config: None)
+    config = Config()
+    config.codex_agents_md.parent.mkdir(parents=True, exist_ok=True)
+    config.codex_agents_md.write_text("# Mine — keep me\n\n\n")
+
+    _install_codex(config)
+    installed = config.codex_agents_md.read_bytes()
+    assert installed == ("# Mine — keep me\n\n" + _CODEX_OM_BLOCK + "\n").encode()
+
+    before = config.codex_agents_md.stat().st_mtime_ns
+    os.utime(config.codex_agents_md, ns=(before - 10_000_000, before - 10_000_000))
+    _install_codex(config)
+    assert config.codex_agents_md.read_bytes() == installed
+    assert config.codex_agents_md.stat().st_mtime_ns == before - 10_000_000
+    assert "already up to date" in capsys.readouterr().out
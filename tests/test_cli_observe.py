@@ -2,6 +2,7 @@
 
 import json
 import os
+import sys
 import time
 from pathlib import Path
 
@@ -541,3 +542,87 @@ def test_codex_checkpoint_does_not_reclaim_live_owner_lock(monkeypatch, tmp_path
     assert (lock_path / "owner").read_text().startswith("pid=12345\n")
 
     _release_codex_checkpoint_lock(lock_path)
+
+
+def test_backfill_reads_cursor_once_and_skips_processed(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    runner = CliRunner()
+    project_dir = tmp_path / "home" / ".claude" / "projects" / "-tmp-proj"
+    project_dir.mkdir(parents=True)
+    done, fresh_a, fresh_b = (project_dir / f"{name}.jsonl" for name in ("done", "fresh-a", "fresh-b"))
+    for path in (done, fresh_a, fresh_b):
+        path.write_text("{}\n")
+    Config(memory_dir=tmp_path / "data" / "observational-memory").save_cursor({str(done): "uuid-1"})
+
+    loads = {"count": 0}
+    real_load_cursor = Config.load_cursor
+
+    def counting_load_cursor(self):
+        loads["count"] += 1
+        return real_load_cursor(self)
+
+    observed = []
+    monkeypatch.setattr(Config, "load_cursor", counting_load_cursor)
+    monkeypatch.setattr(
+        "observational_memory.observe.observe_claude_transcript_backfill",
+        lambda path, config, chunk_size: observed.append(path) or 10,
+    )
+    monkeypatch.setattr("observational_memory.reflect.run_reflector", lambda config: None)
+
+    result = runner.invoke(cli, ["backfill", "--source", "claude", "--reflect-every", "0"])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(observed) == sorted([fresh_a, fresh_b])
+    assert loads["count"] == 1
+    assert "Backfill complete: 2 transcript(s)" in result.output
+
+
+def test_backfill_dry_run_lists_sizes_from_discovery(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    runner = CliRunner()
+    project_dir = tmp_path / "home" / ".claude" / "projects" / "-tmp-proj"
+    project_dir.mkdir(parents=True)
+    (project_dir / "session.jsonl").write_text("{}\n" * 4)
+
+    result = runner.invoke(cli, ["backfill", "--source", "claude", "--dry-run"])
+
+    assert result.exit_code == 0, result.output
+    assert "Found 1 transcript(s), 1 unprocessed" in result.output
+    assert "[claude] -tmp-proj/session.jsonl (12 bytes)" in result.output
+
+
+def test_backfill_throttles_progress_on_a_terminal(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    runner = CliRunner()
+    project_dir = tmp_path / "home" / ".claude" / "projects" / "-tmp-proj"
+    project_dir.mkdir(parents=True)
+    for name in ("a", "b", "c", "d", "e"):
+        (project_dir / f"{name}.jsonl").write_text("{}\n")
+
+    chars = iter([None, 42, None, None, None])
+    clock = iter([100.0, 100.05, 100.2, 100.25, 100.26])
+    shown_while_observing = []
+    monkeypatch.setattr("observational_memory.cli._stdout_is_tty", lambda: True)
+    monkeypatch.setattr("observational_memory.cli._progress_clock", lambda: next(clock))
+
+    def fake_backfill(path, config, chunk_size):
+        sys.stdout.flush()
+        shown_while_observing.append(sys.stdout.buffer.getvalue().decode().rsplit("\r", 1)[-1][:5])
+        return next(chars)
+
+    monkeypatch.setattr("observational_memory.observe.observe_claude_transcript_backfill", fake_backfill)
+    monkeypatch.setattr("observational_memory.reflect.run_reflector", lambda config: None)
+
+    result = runner.invoke(cli, ["backfill", "--source", "claude", "--reflect-every", "0"])
+
+    assert result.exit_code == 0, result.output
+    # A label is drawn before its observation only once the interval has passed
+    # since the last draw, so [2/5], [4/5] and [5/5] run under an older label.
+    assert shown_while_observing == ["[1/5]", "[1/5]", "[3/5]", "[3/5]", "[3/5]"]
+    # The observed result always gets its own line, the undrawn quiet [4/5]
+    # writes nothing, and the last result always lands so the count reads N/N.
+    assert "[2/5] -tmp-proj/b.jsonl... (42 chars)\n" in result.output
+    assert "[4/5]" not in result.output
+    assert result.output.count("(no new messages)") == 3
+    assert "[5/5] -tmp-proj/e.jsonl... (no new messages)" in result.output
+    assert "Backfill complete: 5 transcript(s), 42 chars" in result.output
@@ -187,3 +187,22 @@ def test_search_raw_qmd_suppresses_reindex_banner(monkeypatch, tmp_path):
     assert result.exit_code == 0, result.output
     assert "launchd hit" in result.output
     assert "Indexed 7 document(s)" not in result.output
+
+
+def test_search_reindex_skips_readiness_probe(monkeypatch, tmp_path):
+    _set_base_env(monkeypatch, tmp_path)
+    runner = CliRunner()
+    reindexes = []
+
+    class _UnprobedBackend(_FakeBackend):
+        def is_ready(self) -> bool:
+            raise AssertionError("is_ready() should not run right after --reindex")
+
+    monkeypatch.setattr("observational_memory.search.get_backend", lambda backend_name, config: _UnprobedBackend())
+    monkeypatch.setattr("observational_memory.search.reindex", lambda config: reindexes.append(config) or 3)
+
+    result = runner.invoke(cli, ["search", "launchd", "--reindex", "--json"])
+
+    assert result.exit_code == 0, result.output
+    assert len(reindexes) == 1
+    assert json.loads(result.output)[0]["heading"] == "## 2026-02-10"
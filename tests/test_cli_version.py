@@ -13,3 +13,31 @@ def test_version_flag_outputs_package_version():
 
     assert result.exit_code == 0, result.output
     assert __version__ in result.output
+
+
+def test_config_is_built_lazily_and_env_file_seeded_first(monkeypatch, tmp_path):
+    import observational_memory.cli as cli_mod
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    env_file = tmp_path / "observational-memory" / "env"
+    env_file.parent.mkdir(parents=True)
+    env_file.write_text("OM_SEARCH_BACKEND=none\n")
+    built = []
+    real_config = cli_mod.Config
+
+    def _counting_config(*args, **kwargs):
+        config = real_config(*args, **kwargs)
+        built.append(config)
+        return config
+
+    monkeypatch.setattr(cli_mod, "Config", _counting_config)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["logout"])
+    assert result.exit_code == 0, result.output
+    assert built == []
+
+    state = cli_mod._CliState()
+    assert state["config"] is state["config"]
+    assert len(built) == 1
+    assert built[0].search_backend == "none"
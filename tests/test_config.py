@@ -4,7 +4,7 @@ import os
 
 import pytest
 
-from observational_memory.config import Config
+from observational_memory.config import Config, default_env_file, load_env_file, read_env_file
 
 
 @pytest.fixture(autouse=True)
@@ -94,10 +94,63 @@ class TestEnvFile:
         monkeypatch.delenv("QUOTED_KEY", raising=False)
         monkeypatch.delenv("DOUBLE_KEY", raising=False)
 
+    def test_read_env_file_caches_until_file_changes(self, tmp_path, monkeypatch):
+        env_file = tmp_path / "env"
+        env_file.write_text("# comment\nA_KEY=one\nB_KEY='two'\n")
+        from observational_memory.config import _parse_env_file
+
+        _parse_env_file.cache_clear()
+
+        assert read_env_file(env_file) == {"A_KEY": "one", "B_KEY": "two"}
+        assert read_env_file(env_file) == {"A_KEY": "one", "B_KEY": "two"}
+        assert _parse_env_file.cache_info().misses == 1
+
+        env_file.write_text("A_KEY=changed\n")
+        os.utime(env_file, ns=(1_000_000_000, 1_000_000_000))
+        assert read_env_file(env_file) == {"A_KEY": "changed"}
+        assert read_env_file(tmp_path / "missing") == {}
+
+    def test_read_env_file_parses_assignment_lines_only(self, tmp_path):
+        env_file = tmp_path / "env"
+        env_file.write_text(
+            "\n"
+            "  # COMMENTED=out\n"
+            "not an assignment\n"
+            "=missing-key\n"
+            "  SPACED_KEY  =  ' padded value '  \n"
+            "HASH_VALUE=abc#123\n"
+            "EMPTY=\n"
+            "DUP=first\n"
+            "DUP=second\r\n"
+        )
+
+        assert read_env_file(env_file) == {
+            "SPACED_KEY": " padded value ",
+            "HASH_VALUE": "abc#123",
+            "EMPTY": "",
+            "DUP": "first",
+        }
+
     def test_load_missing_env_file_is_noop(self, tmp_path):
         config = Config(env_file=tmp_path / "nonexistent")
         config.load_env_file()  # should not raise
 
+    def test_default_env_file_follows_xdg_config_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        assert default_env_file() == tmp_path / "observational-memory" / "env"
+        assert Config().env_file == default_env_file()
+
+    def test_module_load_env_file_matches_method(self, tmp_path, monkeypatch):
+        env_file = tmp_path / "env"
+        env_file.write_text("MODULE_LEVEL_KEY=loaded\n")
+        monkeypatch.delenv("MODULE_LEVEL_KEY", raising=False)
+
+        load_env_file(env_file)
+
+        assert os.environ.get("MODULE_LEVEL_KEY") == "loaded"
+        monkeypatch.delenv("MODULE_LEVEL_KEY", raising=False)
+
     def test_codex_paths_live_under_codex_home(self, tmp_path):
         codex_home = tmp_path / "codex-home"
         memory_dir = tmp_path / "memory"
@@ -203,6 +256,28 @@ class TestEnvFile:
 
         assert config.load_cursor() == {}
 
+    def test_load_cursor_reads_utf8_bytes_and_tolerates_invalid_encoding(self, tmp_path):
+        config = Config(memory_dir=tmp_path / "memory")
+        config.ensure_memory_dir()
+        config.cursor_path.write_bytes('{"/tmp/caf\u00e9.jsonl": "uuid-1"}'.encode())
+        assert config.load_cursor() == {"/tmp/caf\u00e9.jsonl": "uuid-1"}
+
+        config.cursor_path.write_bytes(b'{"\xff": 1}')
+        assert config.load_cursor() == {}
+
+    def test_merge_cursor_rereads_file_and_skips_unchanged_writes(self, monkeypatch, tmp_path):
+        config = Config(memory_dir=tmp_path / "memory")
+        config.save_cursor({"a": 1})
+        config.save_cursor({"a": 1, "b": "uuid-b"})  # another source saved meanwhile
+
+        config.merge_cursor({"a": 2})
+        assert config.load_cursor() == {"a": 2, "b": "uuid-b"}
+
+        writes = []
+        monkeypatch.setattr(Config, "save_cursor", lambda self, cursor: writes.append(cursor))
+        config.merge_cursor({"a": 2, "b": "uuid-b"})
+        assert writes == []
+
     def test_save_cursor_uses_atomic_write(self, monkeypatch, tmp_path):
         config = Config(memory_dir=tmp_path / "memory")
         calls = []
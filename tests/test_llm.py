@@ -6,7 +6,7 @@ from types import SimpleNamespace
 import pytest
 
 from observational_memory.config import Config
-from observational_memory.llm import _call_openai_direct, compress
+from observational_memory.llm import _call_openai_direct, compress, compress_batch
 
 
 @pytest.fixture(autouse=True)
@@ -24,6 +24,7 @@ def clear_llm_env(monkeypatch):
         "ANTHROPIC_API_KEY",
         "OPENAI_API_KEY",
         "AWS_REGION",
+        "OM_LLM_CACHE",
     ]:
         monkeypatch.delenv(key, raising=False)
 
@@ -87,6 +88,77 @@ def test_operation_specific_model_override(monkeypatch):
     assert calls == ["observer-model", "reflector-model"]
 
 
+def test_llm_cache_replays_identical_requests(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    config = Config(memory_dir=tmp_path, llm_provider="anthropic", llm_cache_enabled=True, usage_tracking=False)
+    calls = []
+
+    def fake_anthropic(system_prompt, user_content, model, max_tokens, cfg):
+        calls.append(user_content)
+        return f"reply {len(calls)}"
+
+    monkeypatch.setattr("observational_memory.llm._call_anthropic_direct", fake_anthropic)
+    assert compress("sys", "user", config=config) == "reply 1"
+    assert compress("sys", "user", config=config) == "reply 1"
+    assert compress("sys", "other", config=config) == "reply 2"
+    assert compress("sys", "user", config=config, max_tokens=10) == "reply 3"
+    assert calls == ["user", "other", "user"]
+    assert len(list(config.llm_cache_dir.glob("*.json"))) == 3
+
+
+def test_llm_cache_expires_and_is_off_by_default(monkeypatch, tmp_path):
+    import os
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    calls = []
+
+    def fake_anthropic(system_prompt, user_content, model, max_tokens, cfg):
+        calls.append(user_content)
+        return "ok"
+
+    monkeypatch.setattr("observational_memory.llm._call_anthropic_direct", fake_anthropic)
+    config = Config(memory_dir=tmp_path, llm_provider="anthropic", usage_tracking=False)
+    compress("sys", "user", config=config)
+    compress("sys", "user", config=config)
+    assert len(calls) == 2
+    assert not config.llm_cache_dir.exists()
+
+    config.llm_cache_enabled = True
+    compress("sys", "user", config=config)
+    (entry,) = config.llm_cache_dir.glob("*.json")
+    stale = entry.stat().st_mtime - (config.llm_cache_ttl_days + 1) * 86400
+    os.utime(entry, (stale, stale))
+    compress("sys", "user", config=config)
+    assert len(calls) == 4
+
+
+def test_llm_cache_write_prunes_stale_unrelated_entries_once_a_day(tmp_path):
+    import os
+
+    from observational_memory import llm_cache
+
+    def age(path, days):
+        stale = path.stat().st_mtime - days * 86400
+        os.utime(path, (stale, stale))
+
+    config = Config(memory_dir=tmp_path, llm_cache_enabled=True)
+    llm_cache.put(config, "old", "stale text")
+    llm_cache.put(config, "recent", "fresh text")
+    age(config.llm_cache_dir / "old.json", config.llm_cache_ttl_days + 1)
+
+    # The first write already swept, so the next one within a day leaves the directory alone.
+    llm_cache.put(config, "new", "text")
+    assert (config.llm_cache_dir / "old.json").exists()
+
+    age(config.llm_cache_dir / ".last-prune", 2)
+    llm_cache.put(config, "newer", "text")
+    assert sorted(path.name for path in config.llm_cache_dir.glob("*.json")) == [
+        "new.json",
+        "newer.json",
+        "recent.json",
+    ]
+
+
 def test_unknown_provider_raises_value_error():
     class BadConfig:
         def operation_provider(self, operation=None):
@@ -149,3 +221,171 @@ def test_openai_token_limit_parameter_matches_model_family(monkeypatch, model, e
     assert request[expected_token_arg] == 8
     unexpected_token_arg = "max_tokens" if expected_token_arg == "max_completion_tokens" else "max_completion_tokens"
     assert unexpected_token_arg not in request
+
+
+def test_compress_batch_falls_back_to_sequential_calls_for_other_providers(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    config = Config(llm_provider="openai", usage_tracking=False)
+    calls = []
+
+    def fake_openai(system_prompt, user_content, model, max_tokens, cfg):
+        calls.append(user_content)
+        return f"out:{user_content}"
+
+    monkeypatch.setattr("observational_memory.llm._call_openai_direct", fake_openai)
+
+    assert compress_batch([("sys", "a"), ("sys", "b")], config, operation="observer") == ["out:a", "out:b"]
+    assert calls == ["a", "b"]
+
+
+def test_compress_batch_uses_one_anthropic_message_batch(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setattr("observational_memory.llm.time.sleep", lambda seconds: None)
+    config = Config(llm_provider="anthropic", usage_tracking=False)
+    created = []
+    polls = []
+
+    def succeeded(custom_id, text):
+        message = SimpleNamespace(
+            content=[SimpleNamespace(text=text)], usage=SimpleNamespace(input_tokens=3, output_tokens=2)
+        )
+        return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message))
+
+    class FakeBatches:
+        def create(self, requests):
+            created.append(requests)
+            return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+        def retrieve(self, batch_id):
+            polls.append(batch_id)
+            return SimpleNamespace(id=batch_id, processing_status="ended")
+
+        def results(self, batch_id):
+            # Results come back in completion order, not submission order.
+            return iter([succeeded("om-1", "second"), succeeded("om-0", "first")])
+
+    class FakeAnthropic:
+        def __init__(self, **_kwargs):
+            self.messages = SimpleNamespace(batches=FakeBatches())
+
+    monkeypatch.setitem(sys.modules, "anthropic", SimpleNamespace(Anthropic=FakeAnthropic))
+
+    result = compress_batch([("sys", "a"), ("sys", "b")], config, max_tokens=100, operation="observer")
+
+    assert result == ["first", "second"]
+    assert len(created) == 1
+    assert [request["custom_id"] for request in created[0]] == ["om-0", "om-1"]
+    assert created[0][1]["params"]["messages"] == [{"role": "user", "content": "b"}]
+    assert created[0][0]["params"]["max_tokens"] == 100
+    assert polls == ["batch-1"]
+
+
+def test_compress_batch_retries_only_failed_batch_entries(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    config = Config(llm_provider="anthropic", usage_tracking=False)
+    message = SimpleNamespace(content=[SimpleNamespace(text="batched")], usage=None)
+
+    class FakeBatches:
+        def create(self, requests):
+            return SimpleNamespace(id="batch-1", processing_status="ended")
+
+        def results(self, batch_id):
+            return iter(
+                [
+                    SimpleNamespace(custom_id="om-0", result=SimpleNamespace(type="errored", error="overloaded")),
+                    SimpleNamespace(custom_id="om-1", result=SimpleNamespace(type="succeeded", message=message)),
+                ]
+            )
+
+    class FakeAnthropic:
+        def __init__(self, **_kwargs):
+            self.messages = SimpleNamespace(batches=FakeBatches())
+
+    monkeypatch.setitem(sys.modules, "anthropic", SimpleNamespace(Anthropic=FakeAnthropic))
+    retried = []
+    monkeypatch.setattr(
+        "observational_memory.llm._call_anthropic_direct",
+        lambda system_prompt, user_content, model, max_tokens, cfg: retried.append(user_content) or "direct",
+    )
+
+    assert compress_batch([("sys", "a"), ("sys", "b"), ("sys", "c")], config, operation="observer") == [
+        "direct",
+        "batched",
+        "direct",
+    ]
+    assert retried == ["a", "c"]
+
+
+def test_compress_batch_cancels_a_batch_that_never_ends(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setattr("observational_memory.llm._BATCH_TIMEOUT_SECONDS", 0)
+    config = Config(llm_provider="anthropic", usage_tracking=False)
+    canceled = []
+
+    class FakeBatches:
+        def create(self, requests):
+            return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+        def cancel(self, batch_id):
+            canceled.append(batch_id)
+
+    class FakeAnthropic:
+        def __init__(self, **_kwargs):
+            self.messages = SimpleNamespace(batches=FakeBatches())
+
+    monkeypatch.setitem(sys.modules, "anthropic", SimpleNamespace(Anthropic=FakeAnthropic))
+
+    with pytest.raises(RuntimeError, match="did not end within"):
+        compress_batch([("sys", "a"), ("sys", "b")], config, operation="observer")
+    assert canceled == ["batch-1"]
+
+
+def test_compress_batch_shares_the_llm_cache_with_compress(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    config = Config(memory_dir=tmp_path, llm_provider="anthropic", llm_cache_enabled=True, usage_tracking=False)
+    monkeypatch.setattr(
+        "observational_memory.llm._call_anthropic_direct",
+        lambda system_prompt, user_content, model, max_tokens, cfg: f"direct:{user_content}",
+    )
+    assert compress("sys", "a", config=config, operation="observer") == "direct:a"
+
+    batched = []
+
+    def fake_batch(requests, model, max_tokens):
+        batched.append([user for _system, user in requests])
+        return [(f"batch:{user}", None) for _system, user in requests]
+
+    monkeypatch.setattr("observational_memory.llm._call_anthropic_batch", fake_batch)
+    requests = [("sys", "a"), ("sys", "b"), ("sys", "c")]
+    assert compress_batch(requests, config, operation="observer") == ["direct:a", "batch:b", "batch:c"]
+    assert batched == [["b", "c"]]
+
+    # Every result is now cached, so a repeat makes no call at all.
+    assert compress_batch(requests, config, operation="observer") == ["direct:a", "batch:b", "batch:c"]
+    assert batched == [["b", "c"]]
+
+
+def test_direct_anthropic_calls_reuse_one_client_per_credential(monkeypatch):
+    from observational_memory.llm import _call_anthropic_direct
+
+    constructed = []
+
+    class FakeMessages:
+        def create(self, **kwargs):
+            return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=None)
+
+    class FakeAnthropic:
+        def __init__(self, **kwargs):
+            constructed.append(kwargs)
+            self.messages = FakeMessages()
+
+    monkeypatch.setitem(sys.modules, "anthropic", SimpleNamespace(Anthropic=FakeAnthropic))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-one")
+
+    _call_anthropic_direct("sys", "a", "claude-sonnet-4-5", 10, Config())
+    _call_anthropic_direct("sys", "b", "claude-sonnet-4-5", 10, Config())
+    assert len(constructed) == 1
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-two")
+    _call_anthropic_direct("sys", "c", "claude-sonnet-4-5", 10, Config())
+    assert len(constructed) == 2
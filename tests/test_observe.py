@@ -7,6 +7,7 @@ from unittest.mock import PropertyMock, patch
 from observational_memory.config import Config
 from observational_memory.observe import (
     _append_observations,
+    _backfill_from_messages,
     _chunk_messages,
     _codex_messages_since_cursor,
     _format_messages,
@@ -20,6 +21,8 @@ from observational_memory.observe import (
 )
 from observational_memory.transcripts import Message
 
+from ._jsonl import claude_line, codex_line
+
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
@@ -122,6 +125,31 @@ class TestRunObserver:
         content = config.observations_path.read_text()
         assert "Test" in content
 
+    @patch("observational_memory.observe.compress")
+    def test_observer_prompt_is_read_once_per_process(self, mock_compress, monkeypatch):
+        from observational_memory import observe as observe_mod
+
+        mock_compress.return_value = "# Observations\n\n## 2026-02-10\n\n- 🔴 14:00 Test"
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(path, *args, **kwargs):
+            if path == observe_mod.OBSERVER_PROMPT_PATH:
+                reads.append(path)
+            return original_read_text(path, *args, **kwargs)
+
+        observe_mod._load_observer_prompt.cache_clear()
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        config = Config(min_messages=3)
+        try:
+            run_observer(_sample_messages(), config, dry_run=True)
+            run_observer(_sample_messages(), config, dry_run=True)
+        finally:
+            observe_mod._load_observer_prompt.cache_clear()
+
+        assert len(reads) == 1
+        assert mock_compress.call_args_list[0].args[0] == mock_compress.call_args_list[1].args[0]
+
 
 class TestChunkMessages:
     def test_chunk_single_chunk(self):
@@ -199,6 +227,29 @@ class TestBackfillObserver:
         assert result is None
         assert not mock_compress.called
 
+    def test_backfill_batch_submits_eligible_chunks_together(self, monkeypatch, tmp_path):
+        config = Config(memory_dir=tmp_path / "memory", min_messages=3, backfill_batch=True)
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text("")
+        messages = (_sample_messages() * 3)[:7]  # chunks of 3, 3 and a trailing 1
+        batches = []
+
+        def fake_compress_batch(requests, cfg, max_tokens=4096, operation=None):
+            batches.append([user for _system, user in requests])
+            return [f"## 2026-02-1{index}\n\n- 🔴 chunk {index}" for index in range(len(requests))]
+
+        monkeypatch.setattr("observational_memory.observe.compress_batch", fake_compress_batch)
+        monkeypatch.setattr("observational_memory.observe._reindex_if_enabled", lambda config: None)
+
+        total = _backfill_from_messages(messages, transcript, config, 3, dry_run=False)
+
+        assert len(batches) == 1
+        assert len(batches[0]) == 2  # the trailing 1-message chunk is below min_messages
+        assert all("New transcript to process" in user for user in batches[0])
+        content = config.observations_path.read_text()
+        assert content.index("chunk 0") < content.index("chunk 1")
+        assert total == sum(len(f"## 2026-02-1{index}\n\n- 🔴 chunk {index}") for index in range(2))
+
     def test_append_observations_creates_file(self, tmp_path):
         config = Config(memory_dir=tmp_path / "memory")
         _append_observations("## Test\n\n- observation", config)
@@ -233,6 +284,25 @@ class TestBackfillObserver:
 
         assert calls == [(config.observations_path, "## New section\n", None)]
 
+    def test_append_observations_appends_existing_bytes_atomically(self, monkeypatch, tmp_path):
+        config = Config(memory_dir=tmp_path / "memory")
+        config.ensure_memory_dir()
+        config.observations_path.write_bytes("## 2026-02-10\n\n- 🔴 café\n\n\n".encode())
+        calls = []
+
+        def fake_atomic_write_bytes(path, data, mode=None):
+            calls.append((path, data, mode))
+            path.write_bytes(data)
+
+        monkeypatch.setattr("observational_memory.sync.atomic.atomic_write_bytes", fake_atomic_write_bytes)
+        monkeypatch.setattr("observational_memory.startup_memory.refresh_startup_memory", lambda config: None)
+        monkeypatch.setattr("observational_memory.observe._reindex_if_enabled", lambda config: None)
+
+        _append_observations("## 2026-02-11\n\n- 🟡 naïve\n\n", config)
+
+        expected = "## 2026-02-10\n\n- 🔴 café\n\n## 2026-02-11\n\n- 🟡 naïve\n".encode()
+        assert calls == [(config.observations_path, expected, None)]
+
     def test_write_observations_uses_atomic_write(self, monkeypatch, tmp_path):
         config = Config(memory_dir=tmp_path / "memory")
         calls = []
@@ -250,6 +320,39 @@ class TestBackfillObserver:
 
         assert calls == [(config.observations_path, "## New section\n", None)]
 
+    def test_run_observer_reuses_its_read_unless_the_file_changed(self, monkeypatch, tmp_path):
+        config = Config(memory_dir=tmp_path / "memory", min_messages=3)
+        config.ensure_memory_dir()
+        config.observations_path.write_text("## 2020-01-01\n\n- 🟢 old\n")
+        monkeypatch.setattr("observational_memory.startup_memory.refresh_startup_memory", lambda config: None)
+        monkeypatch.setattr("observational_memory.observe._reindex_if_enabled", lambda config: None)
+        reads = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(path, *args, **kwargs):
+            if path == config.observations_path:
+                reads.append(path)
+            return original_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        monkeypatch.setattr("observational_memory.observe.compress", lambda *args, **kwargs: "- 🟡 first")
+        run_observer(_sample_messages(), config)
+        assert len(reads) == 1
+
+        def compress_while_another_run_appends(*args, **kwargs):
+            with config.observations_path.open("a") as handle:
+                handle.write("\n- 🟢 concurrent\n")
+            return "- 🟡 second"
+
+        monkeypatch.setattr("observational_memory.observe.compress", compress_while_another_run_appends)
+        run_observer(_sample_messages(), config)
+
+        assert len(reads) == 3
+        content = config.observations_path.read_text()
+        assert "- 🟡 first" in content
+        assert "- 🟢 concurrent" in content
+        assert content.rstrip().endswith("- 🟡 second")
+
 
 class TestCodexObserver:
     @patch("observational_memory.observe.run_observer")
@@ -264,10 +367,28 @@ class TestCodexObserver:
         assert result == "## 2026-02-10\n\n- checkpoint"
         assert config.load_cursor()[str(transcript)] == 7
 
+    def test_observe_all_codex_reindexes_once_per_scan(self, monkeypatch, tmp_path):
+        from observational_memory.observe import observe_all_codex
+
+        config = Config(memory_dir=tmp_path / "memory", codex_home=tmp_path / "codex", search_backend="bm25")
+        sessions = config.codex_home / "sessions"
+        sessions.mkdir(parents=True)
+        for name in ("a.jsonl", "b.jsonl"):
+            (sessions / name).write_text((FIXTURES / "codex-transcript.jsonl").read_text())
+        reindexed = []
+        monkeypatch.setattr("observational_memory.search.reindex", lambda config: reindexed.append(config))
+        monkeypatch.setattr("observational_memory.startup_memory.refresh_startup_memory", lambda config: None)
+        monkeypatch.setattr("observational_memory.observe.compress", lambda *args, **kwargs: "- 🟡 noted")
+
+        results = observe_all_codex(config)
+
+        assert len(results) == 2
+        assert reindexed == [config]
+
     def test_codex_messages_since_cursor_migrates_legacy_line_offsets(self):
         transcript = FIXTURES / "codex-transcript.jsonl"
 
-        messages, total = _codex_messages_since_cursor(transcript, {str(transcript): 3})
+        messages, total, _ = _codex_messages_since_cursor(transcript, {str(transcript): 3})
 
         assert total == 7
         assert len(messages) == 4
@@ -297,11 +418,82 @@ class TestCodexObserver:
             + "\n"
         )
 
-        messages, total = _codex_messages_since_cursor(transcript, {str(transcript): 4})
+        messages, total, _ = _codex_messages_since_cursor(transcript, {str(transcript): 4})
 
         assert total == 2
         assert messages == []
 
+    def test_codex_messages_since_cursor_resumes_from_saved_offset(self, tmp_path):
+        transcript = tmp_path / "codex.jsonl"
+        transcript.write_text(codex_line("user", "one") + codex_line("assistant", "two"))
+        messages, total, offset = _codex_messages_since_cursor(transcript, {})
+        assert (len(messages), total, offset) == (2, 2, transcript.stat().st_size)
+
+        with transcript.open("a") as handle:
+            handle.write(codex_line("user", "three"))
+        cursor = {str(transcript): 2, "codex-offsets": {str(transcript): {"messages": 2, "offset": offset}}}
+        messages, total, new_offset = _codex_messages_since_cursor(transcript, cursor)
+        assert [m.content for m in messages] == ["three"]
+        assert (total, new_offset) == (3, transcript.stat().st_size)
+
+        # An offset saved with a different message count is ignored.
+        stale = {str(transcript): 1, "codex-offsets": {str(transcript): {"messages": 2, "offset": offset}}}
+        messages, total, _ = _codex_messages_since_cursor(transcript, stale)
+        assert [m.content for m in messages] == ["two", "three"]
+        assert total == 3
+
+    def test_observe_codex_saves_resume_offset(self, tmp_path):
+        config = Config(memory_dir=tmp_path / "memory")
+        transcript = tmp_path / "codex.jsonl"
+        transcript.write_text(codex_line("user", "hello"))
+
+        with patch("observational_memory.observe.run_observer", return_value="obs"):
+            observe_codex_transcript(transcript, config)
+
+        cursor = config.load_cursor()
+        assert cursor[str(transcript)] == 1
+        assert cursor["codex-offsets"] == {str(transcript): {"messages": 1, "offset": transcript.stat().st_size}}
+
+    def test_count_codex_messages_resumes_from_saved_offset(self, tmp_path):
+        from observational_memory.observe import count_codex_messages
+
+        config = Config(memory_dir=tmp_path / "memory")
+        transcript = tmp_path / "codex.jsonl"
+        transcript.write_text(codex_line("user", "hello"))
+        assert count_codex_messages(transcript, config) == 1
+
+        prefix = transcript.stat().st_size
+        with transcript.open("a") as handle:
+            handle.write(codex_line("user", "hello"))
+        # Pretend the saved prefix held 5 messages: a resumed count only parses the tail.
+        config.save_cursor({"codex-offsets": {str(transcript): {"messages": 5, "offset": prefix}}})
+        assert count_codex_messages(transcript, config) == 6
+
+
+class TestClaudeCursor:
+    def test_observe_claude_saves_and_resumes_from_offset(self, tmp_path, claude_json_loads):
+        from observational_memory.observe import observe_claude_transcript
+
+        config = Config(memory_dir=tmp_path / "memory")
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(claude_line("user", "u1", "hello") + claude_line("assistant", "a1", "hi"))
+
+        with patch("observational_memory.observe.run_observer", return_value="obs"):
+            observe_claude_transcript(transcript, config)
+        cursor = config.load_cursor()
+        assert cursor[str(transcript)] == "a1"
+        assert cursor["claude-offsets"] == {str(transcript): {"uuid": "a1", "offset": transcript.stat().st_size}}
+
+        with transcript.open("a") as handle:
+            handle.write(claude_line("user", "u2", "again"))
+        claude_json_loads.clear()
+        with patch("observational_memory.observe.run_observer", return_value="obs") as mock_run:
+            observe_claude_transcript(transcript, config)
+        assert [m.content for m in mock_run.call_args.args[0]] == ["again"]
+        # Resuming at the offset never decodes the cursor line (or anything before it).
+        assert not any(isinstance(raw, str) and '"a1"' in raw for raw in claude_json_loads)
+        assert config.load_cursor()["claude-offsets"][str(transcript)]["uuid"] == "u2"
+
 
 class TestHermesObserver:
     @patch("observational_memory.observe.run_observer")
@@ -441,6 +633,27 @@ def test_observe_kimi_transcript_parses_hook_events(mock_run_observer, tmp_path)
     assert messages[0].source == "kimi"
 
 
+@patch("observational_memory.observe.run_observer")
+def test_observe_kimi_transcript_keeps_prompts_with_unicode_line_separators(mock_run_observer, tmp_path):
+    from observational_memory.observe import observe_kimi_transcript
+
+    transcript = tmp_path / "kimi-events.jsonl"
+    events = [
+        {"hook_event_name": "UserPromptSubmit", "prompt": "line one\u2028line two", "om_captured_at": "t0"},
+        {"hook_event_name": "SubagentStop", "agent_name": "coder", "response": "ok\x85", "om_captured_at": "t1"},
+    ]
+    transcript.write_text("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events), encoding="utf-8")
+    config = Config(memory_dir=tmp_path / "memory")
+    config.min_messages = 1
+    mock_run_observer.return_value = "## 2026-06-14\n\n- kimi"
+
+    observe_kimi_transcript(transcript, config, dry_run=False)
+
+    messages = mock_run_observer.call_args.args[0]
+    assert [message.content for message in messages] == ["line one\u2028line two", "[coder subagent response] ok"]
+    assert config.load_cursor()[str(transcript)] == 2
+
+
 @patch("observational_memory.observe.run_observer")
 def test_observe_kimi_transcript_cursor_stops_at_processed_boundary(mock_run_observer, tmp_path):
     from observational_memory.observe import observe_kimi_transcript
@@ -17,6 +17,7 @@ from observational_memory.reflect import (
     _parse_last_reflected,
     _parse_last_updated,
     _reflect_chunked,
+    _split_date_sections,
     _stamp_timestamps,
     _trim_old_observations,
     reflector_catchup_needed,
@@ -156,6 +157,53 @@ class TestTrimObservations:
         assert "Very old" not in result
         assert "Future observation" in result
 
+    def test_leaves_file_untouched_when_nothing_ages_out(self, tmp_path, monkeypatch):
+        config = Config(memory_dir=tmp_path / "memory", observation_retention_days=7)
+        config.ensure_memory_dir()
+        config.observations_path.write_text("# Observations\n\n## 2099-12-31\n\n- 🔴 14:00 Future observation\n")
+        monkeypatch.setattr(
+            "observational_memory.sync.atomic.atomic_write_text",
+            lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("unexpected rewrite")),
+        )
+
+        _trim_old_observations(config)
+
+    def test_reuses_caller_content_while_file_is_unchanged(self, tmp_path, monkeypatch):
+        from observational_memory.observe import _file_signature
+
+        config = Config(memory_dir=tmp_path / "memory", observation_retention_days=7)
+        config.ensure_memory_dir()
+        content = "# Observations\n\n## 2020-01-01\n\n- 🔴 old\n\n## 2099-12-31\n\n- 🔴 future\n"
+        config.observations_path.write_text(content)
+        signature = _file_signature(config.observations_path)
+        monkeypatch.setattr(
+            type(config.observations_path),
+            "read_text",
+            lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("unexpected re-read")),
+        )
+
+        _trim_old_observations(config, content=content, signature=signature)
+
+        monkeypatch.undo()
+        assert config.observations_path.read_text() == "# Observations\n\n## 2099-12-31\n\n- 🔴 future\n"
+
+    def test_rereads_when_file_changed_after_caller_read(self, tmp_path):
+        from observational_memory.observe import _file_signature
+
+        config = Config(memory_dir=tmp_path / "memory", observation_retention_days=7)
+        config.ensure_memory_dir()
+        stale = "# Observations\n\n## 2020-01-01\n\n- 🔴 old\n"
+        config.observations_path.write_text(stale)
+        signature = _file_signature(config.observations_path)
+        # An observer appends while the reflector LLM call is in flight.
+        config.observations_path.write_text(stale + "\n## 2099-12-31\n\n- 🔴 appended meanwhile\n")
+
+        _trim_old_observations(config, content=stale, signature=signature)
+
+        result = config.observations_path.read_text()
+        assert "appended meanwhile" in result
+        assert "old" not in result
+
 
 class TestParseLastReflected:
     def test_extracts_date(self):
@@ -237,6 +285,38 @@ class TestFilterNewObservations:
         assert result == ""
 
 
+class TestSplitDateSections:
+    def test_splits_header_and_dated_sections_losslessly(self):
+        obs = (
+            "# Observations\n\n"
+            "## 2026-02-07\n\n- old\n## not a date\n\n"
+            "## 2026-02-10 (backfill)\n\n- new\n"
+            "### 2026-02-11 nested\n"
+        )
+        header, sections = _split_date_sections(obs)
+        assert header == "# Observations\n\n"
+        assert [date for date, _ in sections] == ["2026-02-07", "2026-02-10"]
+        assert sections[0][1].endswith("## not a date\n\n")
+        assert header + "".join(section for _, section in sections) == obs
+
+    def test_header_at_start_of_text(self):
+        header, sections = _split_date_sections("## 2026-02-10\n\n- only\n")
+        assert header == ""
+        assert sections == [("2026-02-10", "## 2026-02-10\n\n- only\n")]
+
+    def test_no_date_headers(self):
+        assert _split_date_sections("# Observations\n\n## 2026-2-10\n") == ("# Observations\n\n## 2026-2-10\n", [])
+
+    def test_spans_cover_indented_first_header(self):
+        from observational_memory.reflect import _date_section_spans
+
+        obs = "  ## 2026-02-07\n- old\n## 2026-02-10\n- new\n"
+        header_end, spans = _date_section_spans(obs)
+        assert header_end == 0
+        assert spans == [("2026-02-07", 0, 22), ("2026-02-10", 22, len(obs))]
+        assert _split_date_sections(obs) == ("", [(date, obs[start:end]) for date, start, end in spans])
+
+
 class TestExtractLatestObservationDate:
     def test_finds_latest(self):
         obs = "# Observations\n\n## 2026-02-07\n\n- old\n\n## 2026-02-10\n\n- new\n\n## 2026-02-09\n\n- middle\n"
@@ -252,6 +332,10 @@ class TestExtractLatestObservationDate:
     def test_returns_none_for_empty(self):
         assert _extract_latest_observation_date("") is None
 
+    def test_ignores_non_header_date_lines(self):
+        obs = "## 2026-02-07\n\n### 2026-03-01 nested\n  ## 2026-03-02 indented\n- ## 2026-03-03 inline\n"
+        assert _extract_latest_observation_date(obs) == "2026-02-07"
+
 
 class TestStampTimestamps:
     def test_replaces_existing_timestamps(self):
@@ -270,6 +354,17 @@ class TestStampTimestamps:
         assert "*Last updated: 2026-02-10 14:00 UTC*" in result
         assert "*Last reflected: 2026-02-10*" in result
 
+    def test_replaces_only_first_line_of_each_kind(self):
+        reflections = (
+            "# Reflections\n\n*Last reflected: 2026-02-08*\n*Last updated: 2026-02-09 10:00 UTC*\n\n"
+            "## Notes\n*Last updated: quoted*\n*Last reflected: 2026-01-01*\n"
+        )
+        result = _stamp_timestamps(reflections, "2026-02-10 14:00 UTC", "2026-02-10")
+        assert result == (
+            "# Reflections\n\n*Last reflected: 2026-02-10*\n*Last updated: 2026-02-10 14:00 UTC*\n\n"
+            "## Notes\n*Last updated: quoted*\n*Last reflected: 2026-01-01*\n"
+        )
+
     def test_injects_both_when_neither_exists(self):
         reflections = "# Reflections\n\n## Core Identity\n"
         result = _stamp_timestamps(reflections, "2026-02-10 14:00 UTC", "2026-02-10")
@@ -370,13 +465,15 @@ class TestReflectChunked:
 
         _reflect_chunked("system prompt", "", observations, config)
 
-        # First call (intermediate) should have the NOTE in system prompt
-        first_call_system = mock_compress.call_args_list[0][0][0]
-        assert "chunk 1 of 2" in first_call_system
+        # The system prompt is identical across folds so it stays cacheable.
+        first_call, last_call = mock_compress.call_args_list
+        assert first_call[0][0] == last_call[0][0] == "system prompt"
+
+        # First call (intermediate) carries the NOTE in its user turn
+        assert "chunk 1 of 2" in first_call[0][1]
 
         # Last call should NOT have the NOTE
-        last_call_system = mock_compress.call_args_list[1][0][0]
-        assert "chunk" not in last_call_system or "NOTE" not in last_call_system
+        assert "NOTE" not in last_call[0][1]
 
     @patch("observational_memory.reflect.compress")
     def test_final_chunk_gets_auto_memory_cleanup_note_on_deletion(self, mock_compress, tmp_path):
@@ -97,6 +97,8 @@ class TestParseObservations:
 
         assert docs[0].metadata["file_path"] == str(obs_file)
         assert docs[0].metadata["source_start_line"] == 5
+        header_lines = [n for n, line in enumerate(SAMPLE_OBSERVATIONS.splitlines(), 1) if line.startswith("## ")]
+        assert [doc.metadata["source_start_line"] for doc in docs] == header_lines
 
     def test_empty_file(self, tmp_path):
         obs_file = tmp_path / "observations.md"
@@ -131,6 +133,8 @@ class TestParseReflections:
 
         assert docs[0].metadata["file_path"] == str(ref_file)
         assert docs[0].metadata["source_start_line"] == 5
+        header_lines = [n for n, line in enumerate(SAMPLE_REFLECTIONS.splitlines(), 1) if line.startswith("## ")]
+        assert [doc.metadata["source_start_line"] for doc in docs] == header_lines
 
     def test_empty_file(self, tmp_path):
         ref_file = tmp_path / "reflections.md"
@@ -239,6 +243,25 @@ class TestTokenize:
         assert "and" not in tokens
         assert "quick" in tokens
 
+    def test_keeps_unicode_words_and_splits_on_punctuation(self):
+        assert _tokenize("Café-naïve 🔴 snake_case/日本語") == ["café", "naïve", "snake_case", "日本語"]
+
+    def test_ascii_fast_path_matches_unicode_tokenizer(self):
+        from observational_memory.search.bm25 import _STOPWORDS, _TOKEN_RE
+
+        text = "- 14:30 The User prefers **PostgreSQL** over MySQL for project_x (see #42), NOT sqlite!"
+        expected = [w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOPWORDS]
+        assert _tokenize(text) == expected
+        assert all(type(token) is str for token in _tokenize(text))
+
+
+@pytest.fixture(scope="class")
+def prebuilt_backend(tmp_path_factory):
+    """One indexed backend shared by BM25 tests that only search it."""
+    backend = BM25Backend(tmp_path_factory.mktemp("bm25") / "bm25.pkl")
+    backend.index(TestBM25Backend()._make_docs())
+    return backend
+
 
 class TestBM25Backend:
     def _make_docs(self):
@@ -263,6 +286,14 @@ class TestBM25Backend:
             ),
         ]
 
+    def test_scores_match_rank_bm25(self, tmp_path):
+        import numpy as np
+
+        backend = BM25Backend(tmp_path / "bm25.pkl")
+        backend.index(self._make_docs())
+        for query in (["postgresql"], ["postgresql", "database", "postgresql"], ["unknown", "react"]):
+            assert np.array_equal(backend._get_scores(query), backend._bm25.get_scores(query))
+
     def test_index_and_search(self, tmp_path):
         index_path = tmp_path / "bm25.pkl"
         backend = BM25Backend(index_path)
@@ -293,25 +324,112 @@ class TestBM25Backend:
         results = backend2.search("PostgreSQL")
         assert len(results) >= 1
 
-    def test_zero_score_filtering(self, tmp_path):
+    def test_load_reuses_fitted_model(self, tmp_path, monkeypatch):
+        index_path = tmp_path / "bm25.pkl"
+        BM25Backend(index_path).index(self._make_docs())
+
+        monkeypatch.setattr("rank_bm25.BM25Okapi.__init__", lambda *args: pytest.fail("refit on load"))
+        backend = BM25Backend(index_path)
+        assert backend.search("PostgreSQL database")[0].document.doc_id == "obs:2026-02-10"
+
+    def test_loads_index_saved_as_tokenized_corpus(self, tmp_path):
+        import pickle
+
+        docs = self._make_docs()
+        index_path = tmp_path / "bm25.pkl"
+        index_path.write_bytes(
+            pickle.dumps({"documents": docs, "tokenized_corpus": [_tokenize(doc.content) for doc in docs]})
+        )
+
+        backend = BM25Backend(index_path)
+        assert backend.is_ready()
+        assert backend.search("PostgreSQL database")[0].document.doc_id == "obs:2026-02-10"
+
+    def test_index_shares_one_string_per_term(self, tmp_path):
+        backend = BM25Backend(tmp_path / "bm25.pkl")
+        backend.index(self._make_docs())
+        terms = {}
+        for freqs in backend._bm25.doc_freqs:
+            for term in freqs:
+                assert terms.setdefault(term, term) is term
+
+        reloaded = BM25Backend(tmp_path / "bm25.pkl")
+        first, *rest = (freqs for freqs in reloaded._bm25.doc_freqs if "postgresql" in freqs)
+        assert rest
+        key = next(term for term in first if term == "postgresql")
+        assert all(next(term for term in freqs if term == "postgresql") is key for freqs in rest)
+
+    def test_reindex_of_unchanged_documents_skips_rebuild(self, tmp_path, monkeypatch):
+        docs = self._make_docs()
         index_path = tmp_path / "bm25.pkl"
+        BM25Backend(index_path).index(docs)
+
         backend = BM25Backend(index_path)
+        monkeypatch.setattr(backend, "_save", lambda: pytest.fail("unchanged index was rewritten"))
         backend.index(self._make_docs())
+        assert backend.search("PostgreSQL database")[0].document.doc_id == "obs:2026-02-10"
 
-        results = backend.search("xyznonexistent")
-        assert len(results) == 0
+    def test_reindex_reuses_term_counts_of_unchanged_documents(self, tmp_path, monkeypatch):
+        import numpy as np
+
+        from observational_memory.search import bm25
 
-    def test_search_ranking(self, tmp_path):
+        docs = self._make_docs()
         index_path = tmp_path / "bm25.pkl"
+        BM25Backend(index_path).index(docs)
+
+        tokenized = []
+        monkeypatch.setattr(bm25, "_tokenize", lambda text: tokenized.append(text) or _tokenize(text))
+        changed = Document(
+            doc_id="obs:2026-02-11",
+            source=DocumentSource.OBSERVATIONS,
+            heading="## 2026-02-11",
+            content="Migrated PostgreSQL replicas",
+        )
         backend = BM25Backend(index_path)
+        backend.index([*docs, changed])
+        assert tokenized == [changed.content]
+
+        fresh = BM25Backend(tmp_path / "fresh.pkl")
+        fresh.index([*docs, changed])
+        query = ["postgresql", "database"]
+        assert np.array_equal(backend._get_scores(query), fresh._get_scores(query))
+
+        # Counts saved by an unknown tokenizer version are never reused.
+        monkeypatch.setattr(bm25, "_TOKENIZER_VERSION", bm25._TOKENIZER_VERSION + 1)
+        tokenized.clear()
+        BM25Backend(index_path).index(docs)
+        assert len(tokenized) == len(docs)
+
+    def test_zero_score_filtering(self, prebuilt_backend):
+        results = prebuilt_backend.search("xyznonexistent")
+        assert len(results) == 0
+
+    def test_unknown_terms_return_before_scoring(self, tmp_path, monkeypatch):
+        backend = BM25Backend(tmp_path / "bm25.pkl")
         backend.index(self._make_docs())
+        monkeypatch.setattr(backend, "_get_scores", lambda query: pytest.fail("scored a query with no corpus terms"))
+
+        assert backend.search("the xyznonexistent and") == []
 
-        results = backend.search("PostgreSQL database")
+    def test_search_ranking(self, prebuilt_backend):
+        results = prebuilt_backend.search("PostgreSQL database")
         assert len(results) >= 1
         # First result should be the one with both keywords
         assert results[0].document.doc_id == "obs:2026-02-10"
         assert results[0].rank == 1
 
+    def test_limit_keeps_tied_documents_in_corpus_order(self, tmp_path):
+        docs = [
+            Document(doc_id=f"obs:{i}", source=DocumentSource.OBSERVATIONS, heading="## x", content=text)
+            for i, text in enumerate(["kiwi mango", "pear plum", "kiwi mango", "fig", "kiwi mango", "lime"])
+        ]
+        backend = BM25Backend(tmp_path / "bm25.pkl")
+        backend.index(docs)
+
+        results = backend.search("kiwi", limit=2)
+        assert [(r.document.doc_id, r.rank) for r in results] == [("obs:0", 1), ("obs:2", 2)]
+
     def test_search_falls_back_for_zero_idf_common_terms(self, tmp_path):
         index_path = tmp_path / "bm25.pkl"
         backend = BM25Backend(index_path)
@@ -352,12 +470,8 @@ class TestBM25Backend:
         ]
         assert all(r.score > 0 for r in results)
 
-    def test_empty_query(self, tmp_path):
-        index_path = tmp_path / "bm25.pkl"
-        backend = BM25Backend(index_path)
-        backend.index(self._make_docs())
-
-        results = backend.search("")
+    def test_empty_query(self, prebuilt_backend):
+        results = prebuilt_backend.search("")
         assert results == []
 
     def test_search_not_ready(self, tmp_path):
@@ -484,6 +598,49 @@ class TestQMDBackend:
         assert any(call[0][-1] == "--no-rerank" for call in calls if "query" in call[0])
         assert query_call[1]["env"]["QMD_EMBED_MODEL"] == "embed-model"
 
+    def test_index_rewrites_only_changed_documents(self, tmp_path, monkeypatch):
+        import os
+
+        backend = QMDBackend(tmp_path)
+        monkeypatch.setattr(backend, "_ensure_collection", lambda: None)
+        monkeypatch.setattr("observational_memory.search.qmd._run_qmd", lambda *args, **kwargs: None)
+
+        def doc(doc_id, content):
+            return Document(doc_id=doc_id, source=DocumentSource.OBSERVATIONS, heading="## x", content=content)
+
+        backend.index([doc("obs:a", "same"), doc("obs:b", "old"), doc("obs:c", "gone")])
+        docs_dir = tmp_path / ".qmd-docs"
+        for path in docs_dir.glob("*.md"):
+            os.utime(path, (1_000_000, 1_000_000))
+
+        backend.index([doc("obs:a", "same"), doc("obs:b", "new")])
+
+        same = docs_dir / backend._filename_for_doc_id("obs:a")
+        changed = docs_dir / backend._filename_for_doc_id("obs:b")
+        assert same.stat().st_mtime == 1_000_000
+        assert changed.read_text() == "new"
+        assert changed.stat().st_mtime != 1_000_000
+        assert sorted(p.name for p in docs_dir.glob("*.md")) == sorted([same.name, changed.name])
+
+    def test_index_detects_changes_from_manifest_hashes(self, tmp_path, monkeypatch):
+        from pathlib import Path
+
+        backend = QMDBackend(tmp_path)
+        monkeypatch.setattr(backend, "_ensure_collection", lambda: None)
+        monkeypatch.setattr("observational_memory.search.qmd._run_qmd", lambda *args, **kwargs: None)
+        docs = [Document(doc_id="obs:a", source=DocumentSource.OBSERVATIONS, heading="## a", content="same")]
+        backend.index(docs)
+        assert "sha256" in backend._load_manifest()[backend._filename_for_doc_id("obs:a")]
+
+        original_read_text = Path.read_text
+
+        def read_manifest_only(path, *args, **kwargs):
+            assert path.name == "manifest.json", f"unexpected read of {path.name}"
+            return original_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", read_manifest_only)
+        backend.index(docs)
+
     def test_search_uses_manifest_metadata(self, tmp_path, monkeypatch):
         backend = QMDBackend(tmp_path)
         docs_dir = tmp_path / ".qmd-docs"
@@ -2,6 +2,8 @@
 
 from observational_memory.config import Config
 from observational_memory.startup_memory import (
+    _extract_latest_current_context,
+    _read_latest_observation_section,
     build_startup_payload,
     ensure_startup_memory,
     recall_handle,
@@ -90,6 +92,22 @@ def test_refresh_startup_memory_generates_compact_files(tmp_path):
     assert "Older task" not in active
 
 
+def test_latest_observation_section_streams_out_of_order_dates(tmp_path):
+    path = tmp_path / "observations.md"
+    path.write_text(
+        "# Observations\n\n## 2026-03-12\n\n### Current Context\n- Newest\n\n"
+        "## 2026-03-09\n\n### Current Context\n- Backfilled older day\n"
+    )
+
+    section = _read_latest_observation_section(path)
+
+    assert section.startswith("## 2026-03-12\n")
+    assert "Newest" in section
+    assert "Backfilled older day" not in section
+    assert _extract_latest_current_context(section) == _extract_latest_current_context(path.read_text())
+    assert _read_latest_observation_section(tmp_path / "missing.md") == ""
+
+
 def test_ensure_startup_memory_refreshes_missing_files(tmp_path):
     config = Config(memory_dir=tmp_path / "memory")
     config.ensure_memory_dir()
@@ -5,6 +5,8 @@ import logging
 import time
 from pathlib import Path
 
+import pytest
+
 from observational_memory.transcripts import codex as codex_transcripts
 from observational_memory.transcripts.claude import (
     count_messages as count_claude_messages,
@@ -21,6 +23,8 @@ from observational_memory.transcripts.codex import line_offset_to_message_count
 from observational_memory.transcripts.codex import parse_transcript as parse_codex
 from observational_memory.transcripts.hermes import parse_transcript as parse_hermes
 
+from ._jsonl import claude_line
+
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
@@ -90,6 +94,123 @@ class TestClaudeParser:
         assert count_claude_messages(transcript) == 2
         assert last_message_uuid(transcript) == "meta"
 
+    def test_last_message_uuid_scans_backwards_across_block_boundaries(self, tmp_path, monkeypatch):
+        from observational_memory.transcripts import claude as claude_transcripts
+
+        monkeypatch.setattr(claude_transcripts, "_REVERSE_SCAN_CHUNK_BYTES", 7)
+        transcript = tmp_path / "session.jsonl"
+        lines = [
+            json.dumps({"type": "user", "uuid": "first", "message": {"content": "hé"}}),
+            json.dumps({"type": "assistant", "uuid": "second", "message": {"content": "x" * 40}}),
+            json.dumps({"type": "summary", "uuid": "not-a-message"}),
+            "[1, 2]",
+            "{bad json",
+            "",
+        ]
+        transcript.write_text("\n".join(lines))
+        assert last_message_uuid(transcript) == "second"
+
+        transcript.write_text(lines[0])
+        assert last_message_uuid(transcript) == "first"
+
+        transcript.write_text("")
+        assert last_message_uuid(transcript) is None
+
+    def test_last_message_position_offset_resumes_parse(self, tmp_path, monkeypatch):
+        from observational_memory.transcripts import claude as claude_transcripts
+
+        monkeypatch.setattr(claude_transcripts, "_REVERSE_SCAN_CHUNK_BYTES", 7)
+        transcript = tmp_path / "session.jsonl"
+        first = json.dumps({"type": "user", "uuid": "u1", "message": {"role": "user", "content": "hé"}}) + "\n"
+        tail = json.dumps({"type": "progress", "data": "x"}) + "\n"
+        transcript.write_text(first + tail, encoding="utf-8")
+        uuid, offset = claude_transcripts.last_message_position(transcript)
+        assert (uuid, offset) == ("u1", len(first.encode()))
+
+        with transcript.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"type": "assistant", "uuid": "a1", "message": {"content": "next"}}))
+        assert claude_transcripts.last_message_position(transcript) == ("a1", None)
+        messages = parse_claude(transcript, after_uuid="u1", byte_offset=offset)
+        assert [m.content for m in messages] == ["next"]
+        # An offset that no longer starts a line falls back to scanning for the UUID.
+        assert [m.content for m in parse_claude(transcript, after_uuid="u1", byte_offset=3)] == ["next"]
+
+    def test_last_message_uuid_skips_parsing_lines_without_message_markers(self, tmp_path, claude_json_loads):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(
+            "\n".join(
+                [
+                    json.dumps({"type": "assistant", "uuid": "answer"}),
+                    json.dumps({"type": "progress", "data": "x"}),
+                    json.dumps({"type": "summary", "leafUuid": "answer"}),
+                ]
+            )
+        )
+        assert last_message_uuid(transcript) == "answer"
+        assert len(claude_json_loads) == 1
+
+    def test_parse_skips_parsing_bookkeeping_lines(self, tmp_path, claude_json_loads):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(
+            "\n".join(
+                [
+                    json.dumps({"type": "progress", "data": {"output": "x" * 200}}),
+                    json.dumps({"type": "user", "uuid": "u1", "message": {"role": "user", "content": "hi"}}),
+                    "[1, 2]",
+                    json.dumps({"type": "file-history-snapshot", "snapshot": {}}),
+                ]
+            )
+        )
+        assert [m.content for m in parse_claude(transcript)] == ["hi"]
+        assert count_claude_messages(transcript) == 1
+        assert len(claude_json_loads) == 2
+
+    def test_incremental_parse_only_decodes_cursor_line_before_cursor(self, tmp_path, claude_json_loads):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(
+            claude_line("user", "u1", "first")
+            + claude_line("assistant", "a1", "second")
+            + json.dumps({"type": "summary", "leafUuid": "u2"})
+            + "\n"
+            + claude_line("user", "u2", "third")
+            + claude_line("assistant", "a2", "fourth")
+        )
+        assert [m.content for m in parse_claude(transcript, after_uuid="u2")] == ["fourth"]
+        # The summary line mentions the UUID too, so it is parsed but does not match.
+        assert len(claude_json_loads) == 3
+        assert parse_claude(transcript, after_uuid="missing") == []
+
+    def test_parsed_roles_share_one_string_per_role(self):
+        messages = parse_claude(FIXTURES / "claude-transcript.jsonl")
+        users = [m.role for m in messages if m.role == "user"]
+        assert len(users) > 1
+        assert all(role is users[0] for role in users)
+
+    def test_non_string_role_does_not_abort_parse(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(
+            json.dumps({"type": "user", "uuid": "u1", "message": {"role": ["user"], "content": "odd"}})
+            + "\n"
+            + json.dumps({"type": "assistant", "uuid": "a1", "message": {"role": "assistant", "content": "fine"}})
+            + "\n"
+        )
+        assert [m.content for m in parse_claude(transcript)] == ["odd", "fine"]
+
+    @pytest.mark.parametrize(
+        ("tool", "inp", "expected"),
+        [
+            ("Bash", {"command": "ls -la", "description": "List files"}, "[Bash: List files]"),
+            ("Bash", {"command": "x" * 150}, f"[Bash: {'x' * 100}]"),
+            ("Edit", {"file_path": "src/app.py"}, "[Edit: src/app.py]"),
+            ("WebFetch", {}, "[WebFetch: ?]"),
+            ("TodoWrite", {"todos": []}, "[TodoWrite]"),
+        ],
+    )
+    def test_summarize_tool_use(self, tool, inp, expected):
+        from observational_memory.transcripts import claude as claude_transcripts
+
+        assert claude_transcripts._summarize_tool_use(tool, inp) == expected
+
     def test_user_content_preserved(self):
         messages = parse_claude(FIXTURES / "claude-transcript.jsonl")
         user_messages = [m for m in messages if m.role == "user"]
@@ -129,6 +250,22 @@ class TestFindAllTranscripts:
         assert results[0].name == "old.jsonl"
         assert results[1].name == "new.jsonl"
 
+    def test_skips_unreadable_project_dirs(self, tmp_path, monkeypatch):
+        import os
+
+        for name in ("locked", "open"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "session.jsonl").write_text('{"type":"user"}\n')
+        real_scandir = os.scandir
+
+        def deny_locked(path="."):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", deny_locked)
+        assert find_all_transcripts(tmp_path) == [tmp_path / "open" / "session.jsonl"]
+
     def test_returns_empty_for_missing_dir(self, tmp_path):
         results = find_all_transcripts(tmp_path / "nonexistent")
         assert results == []
@@ -143,6 +280,39 @@ class TestFindAllTranscripts:
         results = find_all_transcripts(tmp_path)
         assert len(results) == 1
 
+    def test_scan_carries_size_and_mtime(self, tmp_path):
+        from observational_memory.transcripts.claude import scan_all_transcripts
+
+        proj = tmp_path / "project"
+        proj.mkdir()
+        transcript = proj / "session.jsonl"
+        transcript.write_text('{"type":"user"}\n')
+        (tmp_path / "stray.jsonl").write_text("top-level files are not project dirs")
+
+        results = scan_all_transcripts(tmp_path)
+
+        assert [r.path for r in results] == [transcript]
+        assert results[0].size == transcript.stat().st_size
+        assert results[0].mtime == transcript.stat().st_mtime
+        assert scan_all_transcripts(tmp_path / "nonexistent") == []
+
+    def test_find_recent_newest_first_within_cutoff(self, tmp_path):
+        import os
+
+        from observational_memory.transcripts.claude import find_recent_transcripts
+
+        proj = tmp_path / "project"
+        proj.mkdir()
+        now = time.time()
+        paths = {}
+        for name, age_hours in (("stale", 48), ("older", 2), ("newer", 1)):
+            paths[name] = proj / f"{name}.jsonl"
+            paths[name].write_text('{"type":"user"}\n')
+            os.utime(paths[name], (now - age_hours * 3600, now - age_hours * 3600))
+
+        assert find_recent_transcripts(tmp_path, max_age_hours=24) == [paths["newer"], paths["older"]]
+        assert find_recent_transcripts(tmp_path / "nonexistent") == []
+
 
 class TestCodexParser:
     def test_parse_full_transcript(self):
@@ -263,6 +433,16 @@ class TestCodexParser:
         assert len(messages) == 2
         assert "Failed to parse Codex transcript" not in caplog.text
 
+    def test_empty_json_session_is_not_rescanned_as_jsonl(self, tmp_path, caplog):
+        transcript = tmp_path / "codex-empty.json"
+        transcript.write_text(json.dumps({"id": "session", "items": []}, indent=2))
+
+        with caplog.at_level(logging.WARNING):
+            messages = parse_codex(transcript)
+
+        assert messages == []
+        assert "Skipping malformed JSON line" not in caplog.text
+
     def test_jsonl_file_with_single_full_json_payload_still_unwraps_items(self, tmp_path, caplog):
         transcript = tmp_path / "codex-single-doc.jsonl"
         transcript.write_text(
@@ -353,6 +533,42 @@ class TestCodexParser:
         # agree with the parser's own message numbering for that wrapper shape.
         assert line_offset_to_message_count(transcript, 2) == 2
 
+    def test_resumable_parse_matches_full_parse_and_holds_back_partial_line(self, tmp_path):
+        transcript = tmp_path / "codex.jsonl"
+        complete = (FIXTURES / "codex-transcript.jsonl").read_bytes()
+        transcript.write_bytes(complete + b'{"type": "response_item", "payload": {"type": "mess')
+
+        messages, total, offset = codex_transcripts.parse_transcript_resumable(transcript, after_index=3)
+        assert (messages, total) == codex_transcripts.parse_transcript_with_count(transcript, after_index=3)
+        assert offset == len(complete)
+
+        resumed, resumed_total, _ = codex_transcripts.parse_transcript_resumable(
+            transcript, after_index=total, byte_offset=offset
+        )
+        assert (resumed, resumed_total) == ([], total)
+        # An offset in the middle of a line is not trusted.
+        assert codex_transcripts.parse_transcript_resumable(transcript, after_index=3, byte_offset=5)[:2] == (
+            messages,
+            total,
+        )
+
+    def test_find_recent_sessions_orders_newest_first_and_skips_dirs(self, tmp_path):
+        import os
+
+        day = tmp_path / "sessions" / "2026" / "03" / "11"
+        day.mkdir(parents=True)
+        (day / "looks-like.jsonl").mkdir()
+        now = time.time()
+        paths = []
+        for name, age_hours in (("old.jsonl", 48), ("older.JSON", 2), ("newer.jsonl", 1)):
+            path = day / name
+            path.write_text("{}\n")
+            os.utime(path, (now - age_hours * 3600, now - age_hours * 3600))
+            paths.append(path)
+        (day / "notes.txt").write_text("x")
+
+        assert codex_transcripts.find_recent_sessions(tmp_path, max_age_hours=24) == [paths[2], paths[1]]
+
 
 class TestHermesParser:
     def test_parse_full_transcript(self):
@@ -386,6 +602,20 @@ class TestHermesParser:
 
         assert [m.content for m in messages] == ["two", "three"]
 
+    def test_streams_session_without_read_text(self, tmp_path, monkeypatch):
+        transcript = tmp_path / "hermes-session.jsonl"
+        transcript.write_text(
+            '{"role":"user","content":"one\u2028more","timestamp":"2026-04-04T00:00:00Z"}\n'
+            "not json\n"
+            '{"role":"assistant","content":"two","timestamp":"2026-04-04T00:00:01Z"}',
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(Path, "read_text", lambda *args, **kwargs: pytest.fail("Hermes parser should stream"))
+
+        messages = parse_hermes(transcript)
+
+        assert [m.content for m in messages] == ["one\u2028more", "two"]
+
 
 class TestCoworkParser:
     """Tests for Cowork audit.jsonl parsing via the Claude parser with source='cowork'."""
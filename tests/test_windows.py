@@ -145,10 +145,8 @@ def test_cluster_init_expands_windows_transport_env_path(windows_env):
 
 
 def test_doctor_warns_for_windows_cluster_key_acl_verification(windows_env, monkeypatch):
-    monkeypatch.setattr(
-        "observational_memory.cli.shutil.which",
-        lambda name: "C:/tools/om.exe" if name == "om" else None,
-    )
+    monkeypatch.setattr("observational_memory.cli._find_om_path", lambda: "C:/tools/om.exe")
+    monkeypatch.setattr("observational_memory.cli.shutil.which", lambda name: None)
     runner = CliRunner()
     result = runner.invoke(
         cli,
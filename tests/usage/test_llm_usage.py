@@ -87,6 +87,35 @@ def test_budget_bypass_allows_call(cfg, monkeypatch):
     assert llm.compress("sys", "user", config=cfg2, operation="reflector") == "done"
 
 
+def test_batch_budget_checks_the_batch_total(cfg, monkeypatch):
+    from observational_memory.usage.pricing import load_pricing
+
+    _provider, model = llm._resolve_provider_and_model(cfg, "observer")
+    one = load_pricing(cfg.pricing_overrides_path).estimate(
+        provider="anthropic", model=model, prompt_tokens=0, completion_tokens=1000
+    )
+    # Room for one request's estimate but not for three together.
+    monkeypatch.setenv("OM_BUDGET_DAILY_USD", str(one.total_usd * 1.5))
+    monkeypatch.setenv("OM_BUDGET_MODE", "hard")
+    cfg2 = Config(memory_dir=cfg.memory_dir, env_file=cfg.env_file)
+    monkeypatch.setattr(llm, "_call_anthropic_batch", lambda *a: pytest.fail("batch submitted over budget"))
+
+    with pytest.raises(BudgetExceededError):
+        llm.compress_batch([("", "a"), ("", "b"), ("", "c")], cfg2, max_tokens=1000, operation="observer")
+    assert _summary(cfg2)["blocked_calls"] == 1
+
+
+def test_batch_records_usage_of_succeeded_entries(cfg, monkeypatch):
+    usage = LLMUsage(prompt_tokens=1000, completion_tokens=500, total_tokens=1500, token_source="provider")
+    monkeypatch.setattr(llm, "_call_anthropic_batch", lambda requests, model, max_tokens: [("first", usage), None])
+    monkeypatch.setattr(llm, "_call_anthropic_direct", lambda *a: ("second", usage))
+
+    assert llm.compress_batch([("sys", "a"), ("sys", "b")], cfg, operation="observer") == ["first", "second"]
+    summary = _summary(cfg)
+    assert summary["ok_calls"] == 2
+    assert summary["total_tokens"] == 3000
+
+
 def test_tracking_off_creates_no_db(tmp_path, monkeypatch):
     monkeypatch.setenv("OM_USAGE_TRACKING", "0")
     monkeypatch.setenv("OM_USAGE_DB", str(tmp_path / "usage.sqlite"))